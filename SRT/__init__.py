@@ -1,7 +1,16 @@
+from .client_pool import ClientPool
 from .errors import SRTError, SRTLoginError, SRTNotLoggedInError, SRTResponseError
+from .jobs import JobRegistry
+from .metrics import ClientMetrics
 from .passenger import Adult, Child, Disability1To3, Disability4To6, Passenger, Senior
+from .recording import Recorder, Replay
+from .result_store import ResultStore
+from .search_cache import SearchCache
 from .seat_type import SeatType
 from .srt import SRT
+from .tracing import Tracer
+from .train_table import TrainTable
+from .transport import TransportConfig
 
 __all__ = [
     "SRT",
@@ -16,4 +25,14 @@ __all__ = [
     "Disability1To3",
     "Disability4To6",
     "SeatType",
+    "SearchCache",
+    "ResultStore",
+    "ClientPool",
+    "JobRegistry",
+    "TransportConfig",
+    "ClientMetrics",
+    "Tracer",
+    "Recorder",
+    "Replay",
+    "TrainTable",
 ]
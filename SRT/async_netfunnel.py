@@ -0,0 +1,189 @@
+import asyncio
+import time
+from typing import Callable
+
+import aiohttp
+
+from .errors import SRTNetFunnelError
+from .netfunnel import (
+    COMPLETE_BACKGROUND,
+    COMPLETE_ONCE,
+    NetFunnelResponse,
+    NetFunnelWaitStatus,
+    _NetFunnelBase,
+    print_wait_status,
+)
+from .transport import DEFAULT_TRANSPORT, TransportConfig
+
+
+def _client_session(transport: TransportConfig, headers: dict) -> aiohttp.ClientSession:
+    return aiohttp.ClientSession(
+        headers=headers,
+        cookie_jar=aiohttp.CookieJar(unsafe=True),
+        connector=aiohttp.TCPConnector(
+            limit=transport.pool_maxsize, force_close=not transport.keep_alive
+        ),
+    )
+
+
+def _client_timeout(transport: TransportConfig, url_or_name: str) -> aiohttp.ClientTimeout:
+    connect, read = transport.timeout_for(url_or_name)
+    return aiohttp.ClientTimeout(sock_connect=connect, sock_read=read)
+
+
+class AsyncNetFunnelHelper(_NetFunnelBase):
+    """asyncio 기반 NetFunnel 키 관리 클래스
+
+    :class:`NetFunnelHelper`와 같은 요청을 보내며, 대기열에서 기다리는 동안
+    이벤트 루프를 막지 않습니다. 여러 :class:`AsyncSRT` 간에 공유할 수 있습니다.
+    ``complete_mode`` 와 ``on_wait`` 은 :class:`NetFunnelHelper` 와 같습니다.
+
+    >>> helper = AsyncNetFunnelHelper()
+    >>> key = await helper.generate_netfunnel_key(use_cache=True)
+    >>> await helper.close()
+    """
+
+    def __init__(
+        self,
+        session: aiohttp.ClientSession | None = None,
+        transport: TransportConfig | None = None,
+        complete_mode: str = COMPLETE_ONCE,
+        on_wait: Callable[[NetFunnelWaitStatus], None] | None = None,
+    ):
+        self.transport = transport if transport is not None else DEFAULT_TRANSPORT
+        self._session = session
+        self._owns_session = session is None
+        self._cached_key = None
+        self._lock: asyncio.Lock | None = None
+        self._init_complete_mode(complete_mode)
+        self._background: set[asyncio.Task] = set()
+        self.on_wait = on_wait if on_wait is not None else print_wait_status
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        # ClientSession은 실행 중인 이벤트 루프 안에서 생성해야 합니다.
+        if self._session is None:
+            self._session = _client_session(self.transport, self.DEFAULT_HEADERS)
+        return self._session
+
+    async def close(self) -> None:
+        if self._background:
+            await asyncio.gather(*self._background, return_exceptions=True)
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+        self._session = None
+
+    async def generate_netfunnel_key(self, use_cache: bool) -> str:
+        key = await self._get_netfunnel_key(use_cache)
+
+        if self._needs_complete(key):
+            if use_cache and self.complete_mode == COMPLETE_BACKGROUND:
+                task = asyncio.get_running_loop().create_task(
+                    self._complete_in_background(key)
+                )
+                self._background.add(task)
+                task.add_done_callback(self._background.discard)
+            else:
+                try:
+                    await self._set_complete(key)
+                except Exception:
+                    self._forget_complete(key)
+                    raise
+
+        return key
+
+    async def _complete_in_background(self, key: str) -> None:
+        try:
+            await self._set_complete(key)
+        except Exception:
+            # 다음에 이 키를 사용할 때 다시 완료 요청을 보냅니다.
+            self._forget_complete(key)
+
+    async def _get_netfunnel_key(self, use_cache: bool) -> str:
+        """
+        NetFunnel 키를 요청합니다.
+
+        동시에 여러 코루틴이 키를 요청하면 한 번만 발급받고 나머지는 그 결과를 사용합니다.
+
+        Args:
+            use_cache (bool): 캐시 사용 여부, 캐시 사용 시 이전 요청에서 반환한 키를 반환합니다.
+
+        Returns:
+            str: NetFunnel 키
+        """
+
+        if use_cache and self._cached_key is not None:
+            return self._cached_key
+
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        async with self._lock:
+            if use_cache and self._cached_key is not None:
+                return self._cached_key
+
+            netfunnel_resp = await self._request(self._get_key_params())
+
+            netfunnel_key = netfunnel_resp.get("key")
+            if netfunnel_key is None:
+                raise SRTNetFunnelError("NetFunnel key not found in response")
+
+            if netfunnel_resp.get("status") == self.WAIT_STATUS_FAIL:
+                netfunnel_key = await self._wait_until_complete(
+                    netfunnel_key, netfunnel_resp
+                )
+
+            self._cached_key = netfunnel_key
+
+            return netfunnel_key
+
+    async def _wait_until_complete(
+        self, key: str, netfunnel_resp: NetFunnelResponse
+    ) -> str:
+        """
+        NetFunnel이 완료될 때까지 대기합니다. 확인 간격은 :class:`NetFunnelHelper` 와 같습니다.
+        """
+
+        started = time.monotonic()
+        polls = 0
+
+        while True:
+            status = self._wait_status(netfunnel_resp, polls, time.monotonic() - started)
+            self.on_wait(status)
+            await asyncio.sleep(status.interval)
+
+            netfunnel_resp = await self._request(self._wait_params(key))
+            polls += 1
+
+            key = netfunnel_resp.get("key")
+            if key is None:
+                raise SRTNetFunnelError("NetFunnel key not found in response")
+
+            nwait = netfunnel_resp.get("nwait")
+            if not nwait or nwait == "0":
+                return key
+
+    async def _set_complete(self, key: str) -> None:
+        """
+        NetFunnel 완료 요청을 보냅니다.
+
+        Args:
+            key (str): NetFunnel 키
+        """
+
+        netfunnel_resp = await self._request(self._complete_params(key))
+        self._check_complete_response(netfunnel_resp)
+
+    async def _request(self, params: dict) -> NetFunnelResponse:
+        params = {str(k): str(v) for k, v in params.items()}
+        try:
+            async with self.session.get(
+                self.NETFUNNEL_URL,
+                params=params,
+                timeout=_client_timeout(self.transport, "netfunnel"),
+            ) as resp:
+                text = await resp.text()
+        except Exception as e:
+            raise SRTNetFunnelError(e) from e
+
+        return NetFunnelResponse.parse(text)
@@ -0,0 +1,571 @@
+import asyncio
+from datetime import datetime
+from typing import AsyncIterator, NoReturn
+
+import aiohttp
+
+from . import constants
+from .async_netfunnel import AsyncNetFunnelHelper, _client_session, _client_timeout
+from .constants import INVALID_NETFUNNEL_KEY, STATION_CODE
+from .errors import SRTError, SRTLoginError, SRTNotLoggedInError, SRTResponseError
+from .passenger import Adult, Passenger
+from .reservation import SRTReservation, SRTTicket
+from .response_data import SRTResponseData
+from .seat_type import SeatType
+from .srt import (
+    DEFAULT_HEADERS,
+    RESERVE_JOBID,
+    _check_payment_response,
+    _filter_trains,
+    _is_special_seat,
+    _login_data,
+    _next_page_time,
+    _parse_login_response,
+    _parse_response,
+    _payment_data,
+    _reservation_from_result,
+    _reservations_from_response,
+    _response_error,
+    _reserve_data,
+    _search_data,
+    _validate_reserve_train,
+)
+from .train import SRTTrain
+from .transport import DEFAULT_TRANSPORT, TransportConfig
+
+
+class AsyncSRT:
+    """asyncio 기반 SRT 클라이언트 클래스
+
+    :class:`SRT`와 같은 메서드를 코루틴으로 제공합니다. 요청 데이터와 응답 해석은
+    :class:`SRT`와 공유하므로 결과도 같습니다.
+
+    Args:
+        srt_id (str): SRT 계정 아이디 (멤버십 번호, 이메일, 전화번호)
+        srt_pw (str): SRT 계정 패스워드
+        auto_login (bool): ``async with`` 진입 시 :func:`login` 호출 여부
+        verbose (bool): 디버깅용 로그 출력 여부
+        netfunnel_helper (AsyncNetFunnelHelper, optional): 여러 클라이언트 간에 netfunnel 키를 공유할 때 사용합니다
+        transport (TransportConfig, optional): 연결 수 제한, 타임아웃 설정
+
+    >>> async with AsyncSRT("1234567890", YOUR_PASSWORD) as srt:
+    ...     trains = await srt.search_train("수서", "부산", "20240101", "000000")
+    ...     reservation = await srt.reserve(trains[0])
+    """
+
+    def __init__(
+        self,
+        srt_id: str,
+        srt_pw: str,
+        auto_login: bool = True,
+        verbose: bool = False,
+        netfunnel_helper: AsyncNetFunnelHelper | None = None,
+        transport: TransportConfig | None = None,
+    ) -> None:
+        self.transport = transport if transport is not None else DEFAULT_TRANSPORT
+        self._session: aiohttp.ClientSession | None = None
+        self._owns_netfunnel_helper = netfunnel_helper is None
+        self.netfunnel_helper = (
+            netfunnel_helper
+            if netfunnel_helper is not None
+            else AsyncNetFunnelHelper(transport=self.transport)
+        )
+
+        self.srt_id: str = srt_id
+        self.srt_pw: str = srt_pw
+        self.auto_login: bool = auto_login
+        self.verbose: bool = verbose
+
+        self.is_login: bool = False
+        self.membership_number = None
+
+    async def __aenter__(self) -> "AsyncSRT":
+        if self.auto_login and not self.is_login:
+            await self.login()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        # ClientSession은 실행 중인 이벤트 루프 안에서 생성해야 합니다.
+        if self._session is None:
+            self._session = _client_session(self.transport, DEFAULT_HEADERS)
+        return self._session
+
+    async def close(self) -> None:
+        """HTTP 세션을 닫습니다. 공유받은 netfunnel_helper는 닫지 않습니다."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+        if self._owns_netfunnel_helper:
+            await self.netfunnel_helper.close()
+
+    def _log(self, msg: str) -> None:
+        if self.verbose:
+            print("[*] " + msg)
+
+    def _raise_for_failure(self, parser: SRTResponseData) -> NoReturn:
+        """실패 응답의 예외를 던집니다. 세션이 만료된 경우 로그인 상태를 해제합니다."""
+        error = _response_error(parser)
+        if isinstance(error, SRTNotLoggedInError):
+            self.is_login = False
+        raise error
+
+    async def _post(self, url: str, data: dict | None = None) -> str:
+        # requests와 같이 None 값은 전송하지 않습니다.
+        form = None
+        if data is not None:
+            form = {k: str(v) for k, v in data.items() if v is not None}
+        async with self.session.post(
+            url, data=form, timeout=_client_timeout(self.transport, url)
+        ) as r:
+            return await r.text()
+
+    async def login(self, srt_id: str | None = None, srt_pw: str | None = None):
+        """SRT 서버에 로그인합니다.
+
+        Args:
+            srt_id (str, optional): SRT 계정 아이디
+            srt_pwd (str, optional): SRT 계정 패스워드
+
+        Returns:
+            bool: 로그인 성공 여부
+        """
+        if srt_id is None:
+            srt_id = self.srt_id
+        else:
+            self.srt_id = srt_id
+
+        if srt_pw is None:
+            srt_pw = self.srt_pw
+        else:
+            self.srt_pw = srt_pw
+
+        url = constants.API_ENDPOINTS["login"]
+        text = await self._post(url, _login_data(srt_id, srt_pw))
+        self._log(text)
+        try:
+            membership_number = _parse_login_response(text)
+        except SRTLoginError:
+            self.is_login = False
+            raise
+
+        self.is_login = True
+        self.membership_number = membership_number
+
+        return True
+
+    async def logout(self) -> bool:
+        """SRT 서버에서 로그아웃합니다."""
+
+        if not self.is_login:
+            return True
+
+        url = constants.API_ENDPOINTS["logout"]
+
+        async with self.session.post(url) as r:
+            text = await r.text()
+            ok = r.ok
+        self._log(text)
+
+        if not ok:
+            raise SRTResponseError(text)
+
+        self.is_login = False
+        self.membership_number = None
+
+        return True
+
+    async def search_train(
+        self,
+        dep: str,
+        arr: str,
+        date: str | None = None,
+        time: str | None = None,
+        time_limit: str | None = None,
+        available_only: bool = True,
+    ) -> list[SRTTrain]:
+        """주어진 출발지에서 도착지로 향하는 SRT 열차를 검색합니다.
+
+        Args:
+            dep (str): 출발역
+            arr (str): 도착역
+            date (str, optional): 출발 날짜 (yyyyMMdd) (default: 당일)
+            time (str, optional): 출발 시각 (hhmmss) (default: 0시 0분 0초)
+            time_limit (str, optional): 출발 시각 조회 한도 (hhmmss)
+            available_only (bool, optional): 매진되지 않은 열차만 검색합니다 (default: True)
+
+        Returns:
+            list[:class:`SRTTrain`]: 열차 리스트
+        """
+
+        if dep not in STATION_CODE:
+            raise ValueError(f'Station "{dep}" not exists')
+        if arr not in STATION_CODE:
+            raise ValueError(f'Station "{arr}" not exists')
+
+        if date is None:
+            date = datetime.now().strftime("%Y%m%d")
+        if time is None:
+            time = "000000"
+
+        return await self._search_train(
+            date=date,
+            time=time,
+            time_limit=time_limit,
+            dep_code=STATION_CODE[dep],
+            arr_code=STATION_CODE[arr],
+            available_only=available_only,
+            use_netfunnel_cache=True,
+        )
+
+    def iter_trains(
+        self,
+        dep: str,
+        arr: str,
+        date: str | None = None,
+        time: str | None = None,
+        time_limit: str | None = None,
+        available_only: bool = True,
+    ) -> AsyncIterator[SRTTrain]:
+        """열차를 응답 페이지가 도착하는 대로 하나씩 반환합니다. :func:`SRT.iter_trains` 참고
+
+        >>> async for train in srt.iter_trains("수서", "부산", "20240101", "080000"):
+        ...     break
+        """
+
+        if dep not in STATION_CODE:
+            raise ValueError(f'Station "{dep}" not exists')
+        if arr not in STATION_CODE:
+            raise ValueError(f'Station "{arr}" not exists')
+
+        if date is None:
+            date = datetime.now().strftime("%Y%m%d")
+        if time is None:
+            time = "000000"
+
+        return self._iter_trains(
+            date=date,
+            time=time,
+            time_limit=time_limit,
+            dep_code=STATION_CODE[dep],
+            arr_code=STATION_CODE[arr],
+            available_only=available_only,
+        )
+
+    async def _search_train(
+        self,
+        date: str,
+        time: str,
+        time_limit: str | None,
+        dep_code: str,
+        arr_code: str,
+        available_only: bool,
+        use_netfunnel_cache: bool,
+    ) -> list[SRTTrain]:
+        """:func:`SRT._search_train` 참고"""
+
+        return [
+            train
+            async for train in self._iter_trains(
+                date=date,
+                time=time,
+                time_limit=time_limit,
+                dep_code=dep_code,
+                arr_code=arr_code,
+                available_only=available_only,
+                use_netfunnel_cache=use_netfunnel_cache,
+            )
+        ]
+
+    async def _iter_trains(
+        self,
+        date: str,
+        time: str,
+        time_limit: str | None,
+        dep_code: str,
+        arr_code: str,
+        available_only: bool,
+        use_netfunnel_cache: bool = True,
+    ) -> AsyncIterator[SRTTrain]:
+        """:func:`SRT._iter_trains` 참고"""
+
+        netfunnelKey = await self.netfunnel_helper.generate_netfunnel_key(
+            use_netfunnel_cache
+        )
+
+        url = constants.API_ENDPOINTS["search_schedule"]
+        data = _search_data(date, time, dep_code, arr_code, netfunnelKey)
+
+        parser = _parse_response(await self._post(url, data))
+
+        if not parser.success():
+            message_code = parser.message_code()
+            if message_code == INVALID_NETFUNNEL_KEY and use_netfunnel_cache:
+                self._log(f"Invalid netfunnel key: {netfunnelKey}, regenerating...")
+
+                async for train in self._iter_trains(
+                    date=date,
+                    time=time,
+                    time_limit=time_limit,
+                    dep_code=dep_code,
+                    arr_code=arr_code,
+                    available_only=available_only,
+                    use_netfunnel_cache=False,
+                ):
+                    yield train
+                return
+            raise SRTResponseError(parser.message(), parser.message_code())
+
+        self._log(parser.message())
+
+        # Note: updated api returns subarray of all trains,
+        #       therefore, to retrieve all trains, retry unless there are no more trains
+        while True:
+            page = [SRTTrain(train) for train in parser.out_data()]
+            for train in _filter_trains(page, available_only, time_limit):
+                yield train
+
+            # Break if the last train's departure time reaches the time_limit,
+            # the next page would start after it
+            if not page or (time_limit and page[-1].dep_time >= time_limit):
+                return
+
+            data["dptTm"] = _next_page_time(page)
+            parser = _parse_response(await self._post(url, data))
+
+            # When there is no more train, return code will be FAIL
+            if not parser.success():
+                return
+
+    async def reserve(
+        self,
+        train: SRTTrain,
+        passengers: list[Passenger] | None = None,
+        special_seat: SeatType = SeatType.GENERAL_FIRST,
+        window_seat: bool | None = None,
+        fetch_details: bool = True,
+    ) -> SRTReservation:
+        """열차를 예약합니다. :func:`SRT.reserve` 참고"""
+
+        return await self._reserve(
+            RESERVE_JOBID["PERSONAL"],
+            train,
+            passengers,
+            special_seat,
+            window_seat=window_seat,
+            fetch_details=fetch_details,
+        )
+
+    async def reserve_standby(
+        self,
+        train: SRTTrain,
+        passengers: list[Passenger] | None = None,
+        special_seat: SeatType = SeatType.GENERAL_FIRST,
+        mblPhone: str | None = None,
+        fetch_details: bool = True,
+    ) -> SRTReservation:
+        """예약대기 신청 합니다. :func:`SRT.reserve_standby` 참고"""
+
+        return await self._reserve(
+            RESERVE_JOBID["STANDBY"],
+            train,
+            passengers,
+            special_seat,
+            mblPhone=mblPhone,
+            fetch_details=fetch_details,
+        )
+
+    async def _reserve(
+        self,
+        jobid: str,
+        train: SRTTrain,
+        passengers: list[Passenger] | None = None,
+        special_seat: SeatType = SeatType.GENERAL_FIRST,
+        mblPhone: str | None = None,
+        window_seat: bool | None = None,
+        fetch_details: bool = True,
+    ) -> SRTReservation:
+        """예약 신청 요청 공통 함수. :func:`SRT._reserve` 참고"""
+        if not self.is_login:
+            raise SRTNotLoggedInError()
+
+        _validate_reserve_train(train)
+
+        if passengers is None:
+            passengers = [Adult()]
+        passengers = Passenger.combine(passengers)
+
+        is_special_seat = _is_special_seat(train, special_seat)
+
+        netfunnelKey = await self.netfunnel_helper.generate_netfunnel_key(True)
+
+        url = constants.API_ENDPOINTS["reserve"]
+        data = _reserve_data(
+            jobid,
+            train,
+            passengers,
+            is_special_seat,
+            mblPhone,
+            window_seat,
+            netfunnelKey,
+        )
+
+        parser = _parse_response(await self._post(url, data))
+
+        if not parser.success():
+            self._raise_for_failure(parser)
+
+        self._log(parser.message())
+        reservation_result = parser.reserv_list()[0]
+        pnr_no = reservation_result["pnrNo"]
+
+        if not fetch_details:
+            return _reservation_from_result(reservation_result, train, passengers)
+
+        # find corresponding reservation and fetch tickets of it only
+        url = constants.API_ENDPOINTS["tickets"]
+        parser = _parse_response(await self._post(url, {"pageNo": "0"}))
+
+        if not parser.success():
+            self._raise_for_failure(parser)
+
+        for train_data, pay_data in _reservations_from_response(parser, False):
+            if train_data["pnrNo"] == pnr_no:
+                tickets = await self.ticket_info(pnr_no)
+                return SRTReservation(train_data, pay_data, tickets)
+
+        # if ticket not found, it's an error
+        raise SRTError("Ticket not found: check reservation status")
+
+    async def reserve_standby_option_settings(
+        self,
+        reservation: SRTReservation | int,
+        isAgreeSMS: bool,
+        isAgreeClassChange: bool,
+        telNo: str | None = None,
+    ) -> bool:
+        """예약대기 옵션을 적용 합니다. :func:`SRT.reserve_standby_option_settings` 참고"""
+        if not self.is_login:
+            raise SRTNotLoggedInError()
+
+        if isinstance(reservation, SRTReservation):
+            reservation = reservation.reservation_number
+
+        url = constants.API_ENDPOINTS["standby_option"]
+
+        data = {
+            "pnrNo": reservation,
+            "psrmClChgFlg": "Y" if isAgreeClassChange else "N",
+            "smsSndFlg": "Y" if isAgreeSMS else "N",
+            "telNo": telNo if isAgreeSMS else "",
+        }
+
+        form = {k: str(v) for k, v in data.items() if v is not None}
+        async with self.session.post(
+            url, data=form, timeout=_client_timeout(self.transport, url)
+        ) as r:
+            return r.status == 200
+
+    async def get_reservations(self, paid_only: bool = False) -> list[SRTReservation]:
+        """전체 예약 정보를 얻습니다.
+
+        각 예약의 티켓 정보는 동시에 요청합니다.
+
+        Args:
+            paid_only (bool): 결제된 예약 내역만 가져올지 여부
+
+        Returns:
+            list[:class:`SRTReservation`]: 예약 리스트
+        """
+        if not self.is_login:
+            raise SRTNotLoggedInError()
+
+        url = constants.API_ENDPOINTS["tickets"]
+        parser = _parse_response(await self._post(url, {"pageNo": "0"}))
+
+        if not parser.success():
+            self._raise_for_failure(parser)
+
+        self._log(parser.message())
+
+        pairs = _reservations_from_response(parser, paid_only)
+        tickets = await asyncio.gather(
+            *(self.ticket_info(train["pnrNo"]) for train, _ in pairs)
+        )
+
+        return [
+            SRTReservation(train, pay, ticket)
+            for (train, pay), ticket in zip(pairs, tickets)
+        ]
+
+    async def ticket_info(self, reservation: SRTReservation | int) -> list[SRTTicket]:
+        """예약에 포함된 티켓 정보를 반환합니다. :func:`SRT.ticket_info` 참고"""
+        if not self.is_login:
+            raise SRTNotLoggedInError()
+
+        if isinstance(reservation, SRTReservation):
+            reservation = reservation.reservation_number
+
+        url = constants.API_ENDPOINTS["ticket_info"]
+        data = {"pnrNo": reservation, "jrnySqno": "1"}
+
+        parser = _parse_response(await self._post(url, data))
+
+        if not parser.success():
+            self._raise_for_failure(parser)
+
+        return [SRTTicket(ticket) for ticket in parser.train_list()]
+
+    async def cancel(self, reservation: SRTReservation | int) -> bool:
+        """예약을 취소합니다. :func:`SRT.cancel` 참고"""
+        if not self.is_login:
+            raise SRTNotLoggedInError()
+
+        if isinstance(reservation, SRTReservation):
+            reservation = reservation.reservation_number
+
+        url = constants.API_ENDPOINTS["cancel"]
+        data = {"pnrNo": reservation, "jrnyCnt": "1", "rsvChgTno": "0"}
+
+        parser = _parse_response(await self._post(url, data))
+
+        if not parser.success():
+            self._raise_for_failure(parser)
+
+        self._log(parser.message())
+
+        return True
+
+    async def pay_with_card(
+        self,
+        reservation: SRTReservation,
+        number: str,
+        password: str,
+        validation_number: str,
+        expire_date: str,
+        installment: int = 0,
+        card_type: str = "J",
+    ) -> bool:
+        """결제합니다. :func:`SRT.pay_with_card` 참고"""
+        if not self.is_login:
+            raise SRTNotLoggedInError()
+
+        url = constants.API_ENDPOINTS["payment"]
+
+        data = _payment_data(
+            reservation,
+            self.membership_number,
+            number,
+            password,
+            validation_number,
+            expire_date,
+            installment,
+            card_type,
+        )
+
+        _check_payment_response(await self._post(url, data))
+
+        return True
@@ -0,0 +1,217 @@
+import threading
+import time
+from typing import Any, Callable
+
+
+class _PooledClient:
+    __slots__ = ("client", "password", "lock", "logged_in", "generation", "last_used", "last_checked")
+
+    def __init__(self, client: Any, password: str):
+        self.client = client
+        self.password = password
+        self.lock = threading.Lock()
+        self.logged_in = False
+        self.generation = 0  # 로그인에 성공한 횟수
+        self.last_used = 0.0
+        self.last_checked = 0.0
+
+
+class ClientPool:
+    """계정별로 로그인된 클라이언트를 재사용하는 풀
+
+    같은 계정으로 들어온 요청과 매크로는 하나의 로그인된 클라이언트를 함께 사용합니다.
+    ``idle_timeout`` 초 동안 사용하지 않은 클라이언트는 풀에서 제거하고,
+    ``health_check_interval`` 초마다 ``is_logged_in`` 으로 서버의 로그인 상태를 확인해 다시 로그인합니다.
+    :func:`call` 로 실행한 작업이 ``relogin_errors`` 중 하나를 던지면 다시 로그인한 뒤 한 번 더 실행합니다.
+    같은 계정에 다른 비밀번호로 요청하면 새 클라이언트가 로그인에 성공한 뒤에만 기존 클라이언트를 바꿉니다.
+
+    >>> pool = ClientPool.for_srt()
+    >>> trains = pool.call(srt_id, srt_pw, lambda srt: srt.search_train("수서", "부산"))
+
+    Args:
+        factory (Callable[[str, str], Any]): ``factory(user_id, password)`` 로 로그인하지 않은 클라이언트를 생성
+        login (Callable[[Any], Any]): 클라이언트를 로그인시키며, 실패하면 예외를 던져야 합니다
+        is_logged_in (Callable[[Any], bool]): 인증이 필요한 요청을 보내 서버에서 로그인이 유지되는지 확인
+        relogin_errors (tuple[type[Exception], ...]): 다시 로그인해야 함을 나타내는 예외들
+        idle_timeout (float): 사용하지 않는 클라이언트를 유지할 시간 (초)
+        health_check_interval (float): 로그인 상태를 확인하는 주기 (초)
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[str, str], Any],
+        login: Callable[[Any], Any],
+        is_logged_in: Callable[[Any], bool],
+        relogin_errors: tuple[type[Exception], ...] = (),
+        idle_timeout: float = 30 * 60,
+        health_check_interval: float = 60,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.factory = factory
+        self.login = login
+        self.is_logged_in = is_logged_in
+        self.relogin_errors = relogin_errors
+        self.idle_timeout = idle_timeout
+        self.health_check_interval = health_check_interval
+        self._clock = clock
+
+        self._lock = threading.Lock()
+        self._entries: dict[str, _PooledClient] = {}
+
+        self._logins = 0
+        self._reuses = 0
+        self._relogins = 0
+        self._evictions = 0
+
+    @classmethod
+    def for_srt(
+        cls,
+        idle_timeout: float = 30 * 60,
+        health_check_interval: float = 60,
+        **client_kwargs,
+    ) -> "ClientPool":
+        """:class:`SRT` 클라이언트 풀을 만듭니다. ``client_kwargs`` 는 :class:`SRT` 에 전달됩니다."""
+        from .errors import SRTNotLoggedInError, SRTResponseError
+        from .srt import SRT
+
+        def is_logged_in(srt: SRT) -> bool:
+            # 티켓 정보 없이 예약 목록만 조회 (요청 1회)
+            if not srt.is_login:
+                return False
+            try:
+                srt.get_reservations(lazy_tickets=True)
+            except SRTNotLoggedInError:
+                return False
+            except SRTResponseError:
+                pass  # 로그인 외의 이유로 실패한 응답은 세션이 살아 있음을 뜻함
+            return True
+
+        return cls(
+            factory=lambda user_id, password: SRT(
+                user_id, password, auto_login=False, **client_kwargs
+            ),
+            login=lambda srt: srt.login(),
+            is_logged_in=is_logged_in,
+            # 서버에서 세션이 만료된 응답도 SRTNotLoggedInError로 바뀌어 다시 로그인함
+            relogin_errors=(SRTNotLoggedInError,),
+            idle_timeout=idle_timeout,
+            health_check_interval=health_check_interval,
+        )
+
+    def get(self, user_id: str, password: str) -> Any:
+        """로그인된 클라이언트를 반환합니다. 없으면 생성하고 로그인합니다.
+
+        Raises:
+            Exception: 로그인에 실패한 경우 ``login`` 이 던진 예외
+        """
+        return self._acquire(user_id, password).client
+
+    def call(self, user_id: str, password: str, fn: Callable[[Any], Any]) -> Any:
+        """``fn(client)`` 를 실행합니다. 로그인이 풀린 경우 다시 로그인한 뒤 한 번 더 실행합니다."""
+        entry = self._acquire(user_id, password)
+        generation = entry.generation
+        try:
+            return fn(entry.client)
+        except self.relogin_errors:
+            return fn(self._relogin(entry, user_id, generation))
+
+    def relogin(self, user_id: str, password: str) -> Any:
+        """클라이언트를 다시 로그인시킵니다."""
+        with self._lock:
+            entry = self._entries.get(user_id)
+        if entry is None or entry.password != password:
+            return self.get(user_id, password)
+        return self._relogin(entry, user_id, entry.generation)
+
+    def discard(self, user_id: str) -> None:
+        """풀에서 클라이언트를 제거합니다 (서버에서 로그아웃하지는 않습니다)."""
+        with self._lock:
+            self._entries.pop(user_id, None)
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "logins": self._logins,
+                "reuses": self._reuses,
+                "relogins": self._relogins,
+                "evictions": self._evictions,
+            }
+
+    def _acquire(self, user_id: str, password: str) -> _PooledClient:
+        now = self._clock()
+        self._evict_idle(now)
+
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None:
+                entry = _PooledClient(self.factory(user_id, password), password)
+                self._entries[user_id] = entry
+            entry.last_used = now
+
+        if entry.password != password:
+            return self._replace(user_id, password, now)
+
+        with entry.lock:
+            if entry.logged_in and now - entry.last_checked >= self.health_check_interval:
+                entry.logged_in = bool(self.is_logged_in(entry.client))
+                entry.last_checked = now
+
+            if entry.logged_in:
+                with self._lock:
+                    self._reuses += 1
+                return entry
+
+            self._login(entry, user_id)
+            return entry
+
+    def _replace(self, user_id: str, password: str, now: float) -> _PooledClient:
+        # 새 클라이언트는 풀 밖에서 로그인하므로, 실패해도 (잘못된 비밀번호 등)
+        # 다른 작업이 쓰고 있는 기존 클라이언트는 풀에 그대로 남음
+        entry = _PooledClient(self.factory(user_id, password), password)
+        entry.last_used = now
+        with entry.lock:
+            self._login(entry, user_id)
+        with self._lock:
+            self._entries[user_id] = entry
+        return entry
+
+    def _relogin(self, entry: _PooledClient, user_id: str, generation: int) -> Any:
+        # generation은 로그인 오류를 만나기 전의 entry.generation.
+        # 그 사이 다른 스레드가 이미 다시 로그인했으면 그 로그인을 그대로 사용하므로,
+        # 여러 스레드가 동시에 로그인 오류를 만나도 로그인은 한 번만 합니다.
+        with entry.lock:
+            if entry.generation == generation:
+                if entry.logged_in:
+                    with self._lock:
+                        self._relogins += 1
+                self._login(entry, user_id)
+        return entry.client
+
+    def _login(self, entry: _PooledClient, user_id: str) -> None:
+        # entry.lock을 잡은 상태에서 호출해야 합니다.
+        entry.logged_in = False
+        try:
+            self.login(entry.client)
+        except Exception:
+            with self._lock:
+                if self._entries.get(user_id) is entry:
+                    del self._entries[user_id]
+            raise
+
+        entry.logged_in = True
+        entry.generation += 1
+        entry.last_checked = self._clock()
+        with self._lock:
+            self._logins += 1
+
+    def _evict_idle(self, now: float) -> None:
+        with self._lock:
+            idle = [
+                user_id
+                for user_id, entry in self._entries.items()
+                if now - entry.last_used > self.idle_timeout
+            ]
+            for user_id in idle:
+                del self._entries[user_id]
+            self._evictions += len(idle)
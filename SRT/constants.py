@@ -1,3 +1,5 @@
+import os
+
 STATION_CODE = {
     "수서": "0551",
     "동탄": "0552",
@@ -52,7 +54,8 @@ TRAIN_NAME = {
 
 WINDOW_SEAT = {None: "000", True: "012", False: "013"}
 
-SRT_MOBILE = "https://app.srail.or.kr:443"
+# SRT_BASE_URL로 모의 서버 등 다른 주소를 지정할 수 있습니다 (benchmarks/mock_server.py)
+SRT_MOBILE = os.environ.get("SRT_BASE_URL") or "https://app.srail.or.kr:443"
 API_ENDPOINTS = {
     "main": f"{SRT_MOBILE}/main/main.do",
     "login": f"{SRT_MOBILE}/apb/selectListApb01080_n.do",
@@ -71,4 +74,7 @@ USER_AGENT = (
     "(KHTML, like Gecko) Mobile/15E148 SRT-APP-iOS V.2.0.18"
 )
 
-INVALID_NETFUNNEL_KEY = "NET000001"
\ No newline at end of file
+INVALID_NETFUNNEL_KEY = "NET000001"
+
+# 서버에서 세션이 만료되어 로그인이 풀렸을 때 실패 응답의 메시지
+NOT_LOGGED_IN_MESSAGES = ("로그인 후 사용하십시오", "로그인 후 이용하십시오", "로그인이 필요합니다")
\ No newline at end of file
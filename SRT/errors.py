@@ -14,8 +14,9 @@ class SRTLoginError(SRTError):
 
 
 class SRTResponseError(SRTError):
-    def __init__(self, msg):
+    def __init__(self, msg, message_code=None):
         super().__init__(msg)
+        self.message_code = message_code
 
 
 class SRTDuplicateError(SRTResponseError):
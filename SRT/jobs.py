@@ -0,0 +1,333 @@
+import threading
+import time
+import uuid
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable, Iterator
+
+JOB_PENDING = "pending"
+JOB_RUNNING = "running"
+JOB_SUCCEEDED = "succeeded"
+JOB_FAILED = "failed"
+JOB_CANCELLED = "cancelled"
+
+FINISHED_STATUSES = frozenset((JOB_SUCCEEDED, JOB_FAILED, JOB_CANCELLED))
+
+_CURRENT = threading.local()
+
+
+def current_job() -> "Job | None":
+    """현재 스레드에서 :class:`JobRegistry` 워커가 실행 중인 작업"""
+    return getattr(_CURRENT, "job", None)
+
+
+class Job:
+    """예약 매크로 작업 하나의 상태, 진행 메시지, 취소 이벤트
+
+    매크로는 대기할 때 ``time.sleep`` 대신 :func:`wait` 를 사용합니다.
+    :func:`cancel` 을 호출하면 대기 중인 :func:`wait` 가 바로 ``True`` 를 반환하므로
+    매크로가 다음 사이클까지 기다리지 않고 멈춥니다.
+
+    진행 메시지는 :func:`publish` 로 기록하고, :func:`subscribe` 로 받아봅니다.
+    메시지마다 1부터 늘어나는 ID를 붙이고, 최근 ``max_events`` 개만 보관합니다.
+
+    Args:
+        job_id (str): 작업 ID
+        owner (str): 작업을 시작한 사용자 (계정 ID)
+        description (str): 작업 설명
+        max_events (int): 보관할 최근 메시지 수
+    """
+
+    def __init__(
+        self,
+        job_id: str,
+        owner: str,
+        description: str = "",
+        max_events: int = 256,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.job_id = job_id
+        self.owner = owner
+        self.description = description
+        self._clock = clock
+
+        self.status = JOB_PENDING
+        self.message = ""
+        self.created_at = clock()
+        self.updated_at = self.created_at
+        self.finished_at: float | None = None
+
+        self._lock = threading.Lock()
+        self._changed = threading.Condition(self._lock)
+        self._events: deque[tuple[int, str]] = deque(maxlen=max_events)
+        self._last_event_id = 0
+        self._cancel = threading.Event()
+
+    @property
+    def cancelled(self) -> bool:
+        """취소 요청을 받았는지 여부"""
+        return self._cancel.is_set()
+
+    @property
+    def done(self) -> bool:
+        return self.status in FINISHED_STATUSES
+
+    def cancel(self) -> bool:
+        """작업에 취소를 요청합니다. 이미 끝난 작업이면 ``False`` 를 반환합니다."""
+        if self.done:
+            return False
+        self._cancel.set()
+        return True
+
+    def wait(self, timeout: float) -> bool:
+        """최대 ``timeout`` 초 동안 기다립니다. 그 사이 취소되면 바로 ``True`` 를 반환합니다."""
+        return self._cancel.wait(timeout)
+
+    def join(self, timeout: float | None = None) -> bool:
+        """작업이 끝날 때까지 최대 ``timeout`` 초 기다립니다. 끝났으면 ``True`` 를 반환합니다."""
+        with self._lock:
+            return self._changed.wait_for(lambda: self.status in FINISHED_STATUSES, timeout)
+
+    def start(self) -> None:
+        self._set(JOB_RUNNING)
+
+    @property
+    def last_event_id(self) -> int:
+        """마지막 메시지의 ID (메시지가 없으면 0)"""
+        return self._last_event_id
+
+    def publish(self, message: str) -> int:
+        """진행 메시지를 기록하고 구독자에게 전달합니다.
+
+        Returns:
+            int: 메시지 ID
+        """
+        with self._lock:
+            self.message = message
+            self.updated_at = self._clock()
+            self._last_event_id += 1
+            self._events.append((self._last_event_id, message))
+            self._changed.notify_all()
+            return self._last_event_id
+
+    def subscribe(
+        self, last_event_id: int = 0, heartbeat: float | None = None
+    ) -> Iterator[tuple[int, str] | None]:
+        """``last_event_id`` 다음의 메시지부터 ``(ID, 메시지)`` 를 차례로 반환합니다. 작업이 끝나면 멈춥니다.
+
+        보관 중인 메시지보다 오래된 ID를 주면 보관 중인 가장 오래된 메시지부터 반환합니다.
+        ``heartbeat`` 를 주면 그 시간(초) 동안 새 메시지가 없을 때마다 ``None`` 을 반환합니다.
+        """
+        while True:
+            with self._lock:
+                # 다른 작업의 ID 등 아직 없는 ID를 받은 경우 처음부터 보냄
+                if last_event_id > self._last_event_id:
+                    last_event_id = 0
+                self._changed.wait_for(
+                    lambda: self._last_event_id > last_event_id or self.status in FINISHED_STATUSES,
+                    heartbeat,
+                )
+                events = [event for event in self._events if event[0] > last_event_id]
+                finished = self.status in FINISHED_STATUSES
+
+            if events:
+                yield from events
+                last_event_id = events[-1][0]
+            elif finished:
+                return
+            else:
+                yield None
+
+    def finish(self, status: str, message: str | None = None) -> None:
+        """작업을 ``status`` 로 끝냅니다. 이미 끝난 작업이면 무시합니다."""
+        if status not in FINISHED_STATUSES:
+            raise ValueError(f"Invalid finished status: {status}")
+        self._set(status, message, finished=True)
+
+    def to_dict(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "job_id": self.job_id,
+                "owner": self.owner,
+                "description": self.description,
+                "status": self.status,
+                "message": self.message,
+                "last_event_id": self._last_event_id,
+                "cancel_requested": self.cancelled,
+                "created_at": self.created_at,
+                "updated_at": self.updated_at,
+                "finished_at": self.finished_at,
+            }
+
+    def _set(self, status: str, message: str | None = None, finished: bool = False) -> None:
+        with self._lock:
+            if self.status in FINISHED_STATUSES:
+                return
+            self.status = status
+            if message is not None:
+                self.message = message
+            self.updated_at = self._clock()
+            if finished:
+                self.finished_at = self.updated_at
+            self._changed.notify_all()
+
+    def __repr__(self) -> str:
+        return f"<Job {self.job_id} {self.owner} {self.status}>"
+
+
+class JobRegistry:
+    """예약 매크로 작업 목록과 작업을 실행하는 워커 풀
+
+    :func:`submit` 으로 등록한 작업은 최대 ``max_workers`` 개의 워커 스레드에서 실행되고,
+    워커가 모두 바쁘면 ``pending`` 상태로 차례를 기다립니다. 작업은 HTTP 연결과 관계없이 실행되며,
+    응답 스트림은 :func:`Job.subscribe` 로 진행 메시지를 받아보기만 합니다.
+
+    작업마다 ID와 취소 이벤트를 따로 두므로, 한 사용자가 작업을 멈춰도 다른 작업에는 영향이 없습니다.
+    끝난 작업은 ``retention`` 초 동안 목록에 남아 결과를 확인할 수 있습니다.
+
+    >>> jobs = JobRegistry(max_workers=8)
+    >>> job = jobs.submit(srt_id, lambda job: macro(job, ...), "수서→부산 20240101")
+    >>> for message in job.subscribe():
+    ...     print(message)
+    >>> jobs.cancel(job.job_id, owner=srt_id)
+
+    Args:
+        max_workers (int): 동시에 실행할 최대 작업 수
+        retention (float): 끝난 작업을 목록에 남겨둘 시간 (초)
+        max_events (int): 작업마다 보관할 최근 진행 메시지 수
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 8,
+        retention: float = 60 * 60,
+        max_events: int = 256,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if max_workers < 1:
+            raise ValueError("max_workers must be positive")
+
+        self.max_workers = max_workers
+        self.retention = retention
+        self.max_events = max_events
+        self._clock = clock
+
+        self._lock = threading.Lock()
+        self._jobs: dict[str, Job] = {}
+        self._closed = False
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="job")
+
+    def create(self, owner: str, description: str = "") -> Job:
+        """새 작업을 등록합니다.
+
+        Raises:
+            RuntimeError: :func:`drain` 또는 :func:`shutdown` 이후에 호출한 경우
+        """
+        job = Job(uuid.uuid4().hex, owner, description, self.max_events, clock=self._clock)
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("JobRegistry is shut down")
+            self._prune()
+            self._jobs[job.job_id] = job
+        return job
+
+    def submit(
+        self,
+        owner: str,
+        fn: Callable[[Job], Iterable[str]],
+        description: str = "",
+    ) -> Job:
+        """새 작업을 등록하고 워커 풀에서 ``fn(job)`` 을 실행합니다.
+
+        ``fn`` 이 반환(yield)하는 메시지는 :func:`Job.publish` 로 기록됩니다.
+        ``fn`` 안에서는 :func:`current_job` 으로 실행 중인 작업을 찾을 수 있습니다.
+        ``fn`` 이 성공 상태를 정하지 않고 끝나면 작업은 ``failed`` (취소된 경우 ``cancelled``) 로 끝납니다.
+        """
+        job = self.create(owner, description)
+        self._executor.submit(self._run, job, fn)
+        return job
+
+    def get(self, job_id: str, owner: str | None = None) -> Job | None:
+        """작업을 찾습니다. ``owner`` 를 주면 그 사용자의 작업만 찾습니다."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+        if job is None or (owner is not None and job.owner != owner):
+            return None
+        return job
+
+    def jobs(self, owner: str | None = None) -> list[Job]:
+        """작업 목록 (오래된 순). ``owner`` 를 주면 그 사용자의 작업만 반환합니다."""
+        with self._lock:
+            self._prune()
+            jobs = list(self._jobs.values())
+        if owner is not None:
+            jobs = [job for job in jobs if job.owner == owner]
+        return jobs
+
+    def cancel(self, job_id: str, owner: str | None = None) -> bool:
+        """작업에 취소를 요청합니다. 작업이 없거나 이미 끝났으면 ``False`` 를 반환합니다."""
+        job = self.get(job_id, owner)
+        return job is not None and job.cancel()
+
+    def cancel_all(self, owner: str | None = None) -> int:
+        """진행 중인 작업 모두에 취소를 요청하고, 취소한 작업 수를 반환합니다."""
+        return sum(job.cancel() for job in self.jobs(owner))
+
+    def stats(self) -> dict[str, int]:
+        counts = Counter(job.status for job in self.jobs())
+        return {"size": sum(counts.values()), "max_workers": self.max_workers, **counts}
+
+    def drain(self, timeout: float | None = None) -> int:
+        """새 작업을 받지 않고, 진행 중인 작업이 끝날 때까지 최대 ``timeout`` 초 기다린 뒤 워커 풀을 닫습니다.
+
+        그때까지 끝나지 않은 작업은 취소합니다. 취소된 작업은 진행 메시지와 함께 ``cancelled`` 로 끝나므로
+        구독 중인 응답 스트림도 정상적으로 끝납니다.
+
+        Returns:
+            int: 취소한 작업 수
+        """
+        with self._lock:
+            self._closed = True
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for job in self.jobs():
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            job.join(remaining)
+
+        cancelled = self.cancel_all()
+        self._executor.shutdown(wait=True)
+        return cancelled
+
+    def shutdown(self, wait: bool = True) -> None:
+        """진행 중인 작업을 모두 취소하고 워커 풀을 닫습니다."""
+        with self._lock:
+            self._closed = True
+        self.cancel_all()
+        self._executor.shutdown(wait=wait)
+
+    def _run(self, job: Job, fn: Callable[[Job], Iterable[str]]) -> None:
+        if job.cancelled:
+            job.finish(JOB_CANCELLED)
+            return
+
+        job.start()
+        _CURRENT.job = job
+        try:
+            for message in fn(job):
+                job.publish(message)
+        except Exception as e:
+            job.publish(f"작업 오류: {e}")
+            job.finish(JOB_FAILED)
+        finally:
+            _CURRENT.job = None
+            job.finish(JOB_CANCELLED if job.cancelled else JOB_FAILED)
+
+    def _prune(self) -> None:
+        # self._lock을 잡은 상태에서 호출해야 합니다.
+        expired = self._clock() - self.retention
+        for job_id in [
+            job_id
+            for job_id, job in self._jobs.items()
+            if job.finished_at is not None and job.finished_at < expired
+        ]:
+            del self._jobs[job_id]
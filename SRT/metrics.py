@@ -0,0 +1,204 @@
+import bisect
+import re
+import threading
+from collections import Counter
+from typing import Any, Iterable
+
+# 응답 시간 히스토그램 구간 (초)
+DEFAULT_BUCKETS = (0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# SRT/Korail JSON 응답의 처리 결과와 메시지 코드, NetFunnel 응답의 상태 코드
+_RESULT = re.compile(rb'"strResult"\s*:\s*"([^"]*)"')
+_CODE = re.compile(rb'"(?:msgCd|h_msg_cd)"\s*:\s*"([^"]*)"')
+_NETFUNNEL_STATUS = re.compile(rb"NetFunnel\.gControl\.result='[^:']*:([^:']*):")
+
+
+def parse_result(content: bytes) -> tuple[str, str]:
+    """응답 본문에서 ``(처리 결과, 코드)`` 를 찾습니다.
+
+    SRT는 ``strResult`` 와 ``msgCd``, Korail은 ``strResult`` 와 ``h_msg_cd`` 를,
+    NetFunnel은 상태 코드(``200``, ``201``, ``502``)를 코드로 반환합니다. 찾지 못한 값은 빈 문자열입니다.
+    """
+    result = _RESULT.search(content)
+    code = _CODE.search(content)
+    if code is None:
+        code = _NETFUNNEL_STATUS.search(content)
+    return (
+        result.group(1).decode("utf-8", "replace") if result else "",
+        code.group(1).decode("utf-8", "replace") if code else "",
+    )
+
+
+class _EndpointStats:
+    __slots__ = ("buckets", "count", "latency_sum", "responses", "errors", "bytes_sent", "bytes_received")
+
+    def __init__(self, size: int):
+        self.buckets = [0] * (size + 1)  # 마지막 칸은 +Inf
+        self.count = 0
+        self.latency_sum = 0.0
+        self.responses: Counter = Counter()  # (status, result, code) → 횟수
+        self.errors: Counter = Counter()  # 예외 이름 → 횟수
+        self.bytes_sent = 0
+        self.bytes_received = 0
+
+
+class ClientMetrics:
+    """엔드포인트별 HTTP 요청 지표
+
+    :class:`TransportConfig` 로 만든 세션(``SRT._session``, ``NetFunnelHelper.session``, ``Korail._session``)의
+    모든 요청에 대해 엔드포인트 이름별로 응답 시간 히스토그램, HTTP 상태와 처리 결과/코드별 응답 수,
+    예외별 실패 수, 주고받은 바이트 수를 기록합니다.
+    엔드포인트 이름은 ``API_ENDPOINTS`` 와 ``KORAIL_*`` 상수로 등록한 이름입니다.
+
+    >>> metrics = ClientMetrics()
+    >>> srt = SRT(srt_id, srt_pw, transport=TransportConfig(metrics=metrics))
+    >>> metrics.snapshot()["search_schedule"]["count"]
+    3
+    >>> print(metrics.render())  # Prometheus text format
+
+    Args:
+        buckets (Iterable[float]): 응답 시간 히스토그램 구간 (초)
+    """
+
+    def __init__(self, buckets: Iterable[float] = DEFAULT_BUCKETS) -> None:
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self._endpoints: dict[str, _EndpointStats] = {}
+
+    def observe(
+        self,
+        endpoint: str,
+        elapsed: float,
+        status: int | str,
+        result: str = "",
+        code: str = "",
+        sent: int = 0,
+        received: int = 0,
+    ) -> None:
+        """응답 하나를 기록합니다."""
+        with self._lock:
+            stats = self._stats(endpoint)
+            self._observe_latency(stats, elapsed)
+            stats.responses[(str(status), result, code)] += 1
+            stats.bytes_sent += sent
+            stats.bytes_received += received
+
+    def observe_error(self, endpoint: str, elapsed: float, error: BaseException, sent: int = 0) -> None:
+        """응답을 받지 못한 요청(타임아웃, 연결 실패 등)을 기록합니다."""
+        with self._lock:
+            stats = self._stats(endpoint)
+            self._observe_latency(stats, elapsed)
+            stats.errors[type(error).__name__] += 1
+            stats.bytes_sent += sent
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """엔드포인트 이름별 지표
+
+        ``latency.buckets`` 는 ``{구간 상한: 누적 횟수}`` 이며 마지막 키는 ``"+Inf"`` 입니다.
+        ``responses`` 는 ``{"status", "result", "code", "count"}`` 목록입니다.
+        """
+        with self._lock:
+            return {
+                endpoint: {
+                    "count": stats.count,
+                    "latency": {
+                        "sum": stats.latency_sum,
+                        "mean": stats.latency_sum / stats.count if stats.count else 0.0,
+                        "buckets": dict(zip(self._bounds(), _cumulative(stats.buckets))),
+                    },
+                    "responses": [
+                        {"status": status, "result": result, "code": code, "count": count}
+                        for (status, result, code), count in sorted(stats.responses.items())
+                    ],
+                    "errors": dict(stats.errors),
+                    "bytes_sent": stats.bytes_sent,
+                    "bytes_received": stats.bytes_received,
+                }
+                for endpoint, stats in sorted(self._endpoints.items())
+            }
+
+    def render(self, prefix: str = "train_client") -> str:
+        """Prometheus text format (0.0.4)"""
+        with self._lock:
+            endpoints = sorted(self._endpoints.items())
+            bounds = self._bounds()
+
+            lines = [
+                f"# HELP {prefix}_request_duration_seconds HTTP request latency by endpoint.",
+                f"# TYPE {prefix}_request_duration_seconds histogram",
+            ]
+            for endpoint, stats in endpoints:
+                label = f'endpoint="{_escape(endpoint)}"'
+                for bound, count in zip(bounds, _cumulative(stats.buckets)):
+                    lines.append(f'{prefix}_request_duration_seconds_bucket{{{label},le="{bound}"}} {count}')
+                lines.append(f"{prefix}_request_duration_seconds_sum{{{label}}} {stats.latency_sum}")
+                lines.append(f"{prefix}_request_duration_seconds_count{{{label}}} {stats.count}")
+
+            lines += [
+                f"# HELP {prefix}_responses_total Responses by endpoint, HTTP status and result code.",
+                f"# TYPE {prefix}_responses_total counter",
+            ]
+            for endpoint, stats in endpoints:
+                for (status, result, code), count in sorted(stats.responses.items()):
+                    lines.append(
+                        f'{prefix}_responses_total{{endpoint="{_escape(endpoint)}",status="{_escape(status)}",'
+                        f'result="{_escape(result)}",code="{_escape(code)}"}} {count}'
+                    )
+
+            lines += [
+                f"# HELP {prefix}_request_errors_total Requests that got no response, by exception.",
+                f"# TYPE {prefix}_request_errors_total counter",
+            ]
+            for endpoint, stats in endpoints:
+                for error, count in sorted(stats.errors.items()):
+                    lines.append(
+                        f'{prefix}_request_errors_total{{endpoint="{_escape(endpoint)}",error="{_escape(error)}"}} {count}'
+                    )
+
+            lines += [
+                f"# HELP {prefix}_bytes_total Request and response body bytes by endpoint.",
+                f"# TYPE {prefix}_bytes_total counter",
+            ]
+            for endpoint, stats in endpoints:
+                label = f'endpoint="{_escape(endpoint)}"'
+                lines.append(f'{prefix}_bytes_total{{{label},direction="sent"}} {stats.bytes_sent}')
+                lines.append(f'{prefix}_bytes_total{{{label},direction="received"}} {stats.bytes_received}')
+
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        with self._lock:
+            self._endpoints.clear()
+
+    def _stats(self, endpoint: str) -> _EndpointStats:
+        # self._lock을 잡은 상태에서 호출해야 합니다.
+        stats = self._endpoints.get(endpoint)
+        if stats is None:
+            stats = self._endpoints[endpoint] = _EndpointStats(len(self.buckets))
+        return stats
+
+    def _observe_latency(self, stats: _EndpointStats, elapsed: float) -> None:
+        # self._lock을 잡은 상태에서 호출해야 합니다.
+        stats.buckets[bisect.bisect_left(self.buckets, elapsed)] += 1
+        stats.count += 1
+        stats.latency_sum += elapsed
+
+    def _bounds(self) -> list[str]:
+        return [repr(float(bound)) for bound in self.buckets] + ["+Inf"]
+
+
+def _cumulative(counts: list[int]) -> list[int]:
+    total = 0
+    cumulative = []
+    for count in counts:
+        total += count
+        cumulative.append(total)
+    return cumulative
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+# 따로 지정하지 않은 모든 TransportConfig가 기록하는 지표
+CLIENT_METRICS = ClientMetrics()
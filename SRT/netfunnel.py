@@ -1,13 +1,79 @@
+import json
+import math
+import os
+import re
+import threading
 import time
-
-import requests
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable
 
 from .constants import SRT_MOBILE, USER_AGENT
 from .errors import SRTNetFunnelError
+from .tracing import span
+from .transport import DEFAULT_TRANSPORT, TransportConfig
+
+# setComplete 요청 방식
+COMPLETE_ALWAYS = "always"  # 키를 사용할 때마다 완료 요청 (이전 동작)
+COMPLETE_ONCE = "once"  # 키마다 한 번만 완료 요청
+COMPLETE_BACKGROUND = "background"  # 키마다 한 번, 백그라운드에서 완료 요청
+
+COMPLETE_MODES = (COMPLETE_ALWAYS, COMPLETE_ONCE, COMPLETE_BACKGROUND)
+
+# 완료 여부를 기억할 최근 키 수
+_COMPLETED_KEYS_SIZE = 16
+
+
+@dataclass
+class NetFunnelWaitStatus:
+    """NetFunnel 대기열 상태
+
+    Attributes:
+        nwait (int): 앞에 남은 대기 인원
+        nnext (int): 다음에 한꺼번에 입장시키는 인원
+        tps (float): 초당 입장 인원
+        eta (float | None): 예상 입장까지 남은 시간 (초), 처리량을 모르면 None
+        interval (float): 다음 확인까지 기다릴 시간 (초)
+        polls (int): 지금까지 대기 상태를 확인한 횟수 (0이면 대기열에 막 들어온 상태)
+        elapsed (float): 대기열에 들어온 뒤 지난 시간 (초)
+    """
+
+    nwait: int
+    nnext: int
+    tps: float
+    eta: float | None
+    interval: float
+    polls: int
+    elapsed: float
+
 
+def print_wait_status(status: NetFunnelWaitStatus) -> None:
+    """기본 ``on_wait``: 대기열 상태를 출력합니다."""
+    if status.polls == 0:
+        print("접속자가 많아 대기열에 들어갑니다.")
 
-class NetFunnelHelper:
-    NETFUNNEL_URL = "http://nf.letskorail.com/ts.wseq"
+    if status.eta is None:
+        print(f"대기인원: {status.nwait}명")
+    else:
+        print(f"대기인원: {status.nwait}명 (예상 대기시간 {status.eta:.0f}초)")
+
+
+def _to_number(value: str | None) -> float:
+    try:
+        return float(value) if value else 0.0
+    except ValueError:
+        return 0.0
+
+
+class _NetFunnelBase:
+    """NetFunnel 요청 파라미터 생성과 응답 해석을 담당합니다.
+
+    :class:`NetFunnelHelper`와 :class:`SRT.async_netfunnel.AsyncNetFunnelHelper`가
+    함께 사용하며, 실제 HTTP 요청은 각 하위 클래스가 수행합니다.
+    """
+
+    # NETFUNNEL_URL로 모의 서버 등 다른 주소를 지정할 수 있습니다
+    NETFUNNEL_URL = os.environ.get("NETFUNNEL_URL") or "http://nf.letskorail.com/ts.wseq"
 
     OP_CODE = {
         "getTidchkEnter": "5101",
@@ -15,6 +81,11 @@ class NetFunnelHelper:
         "setComplete": "5004",
     }
 
+    # 대기열 확인 간격 (초)
+    MIN_WAIT_INTERVAL = 0.5
+    MAX_WAIT_INTERVAL = 5.0
+    DEFAULT_WAIT_INTERVAL = 1.0
+
     WAIT_STATUS_PASS = "200"  # No need to wait
     WAIT_STATUS_FAIL = "201"  # Need to wait
     ALREADY_COMPLETED = "502"  # already completed(set-complete)
@@ -32,16 +103,197 @@ class NetFunnelHelper:
         "Sec-Fetch-Site": "cross-site",
     }
 
-    def __init__(self):
-        self.session = requests.session()
-        self.session.headers.update(self.DEFAULT_HEADERS)
+    def _get_key_params(self) -> dict:
+        return {
+            "opcode": self.OP_CODE["getTidchkEnter"],
+            "nfid": "0",
+            "prefix": f"NetFunnel.gRtype={self.OP_CODE['getTidchkEnter']};",
+            "sid": "service_1",
+            "aid": "act_10",
+            "js": "true",
+            self._get_timestamp_for_netfunnel(): "",
+        }
+
+    def _wait_params(self, key: str) -> dict:
+        return {
+            "opcode": self.OP_CODE["chkEnter"],
+            "key": key,
+            "nfid": "0",
+            "prefix": f"NetFunnel.gRtype={self.OP_CODE['chkEnter']};",
+            "ttl": 1,
+            "sid": "service_1",
+            "aid": "act_10",
+            "js": "true",
+            self._get_timestamp_for_netfunnel(): "",
+        }
+
+    def _complete_params(self, key: str) -> dict:
+        return {
+            "opcode": self.OP_CODE["setComplete"],
+            "key": key,
+            "nfid": "0",
+            "prefix": f"NetFunnel.gRtype={self.OP_CODE['setComplete']};",
+            "js": "true",
+            self._get_timestamp_for_netfunnel(): "",
+        }
+
+    def _check_complete_response(self, netfunnel_resp: "NetFunnelResponse") -> None:
+        if netfunnel_resp.get("status") not in [
+            self.WAIT_STATUS_PASS,
+            self.ALREADY_COMPLETED,
+        ]:
+            raise SRTNetFunnelError(f"Failed to complete NetFunnel: {netfunnel_resp}")
+
+    def _get_timestamp_for_netfunnel(self):
+        return int(time.time() * 1000)
+
+    def _endpoint_name(self, params: dict) -> str:
+        """요청 지표에 쓸 엔드포인트 이름 (``netfunnel_chkEnter`` 등)"""
+        for name, opcode in self.OP_CODE.items():
+            if params.get("opcode") == opcode:
+                return f"netfunnel_{name}"
+        return "netfunnel"
+
+    def _wait_status(
+        self, netfunnel_resp: "NetFunnelResponse", polls: int, elapsed: float
+    ) -> NetFunnelWaitStatus:
+        """대기열 응답으로 예상 대기 시간과 다음 확인 간격을 계산합니다.
+
+        예상 대기 시간은 ``nwait / tps`` 이고, 처리량을 모르면 ``ttl`` 마다 ``nnext`` 명씩 입장한다고 보고
+        계산합니다. 서버가 ``ttl`` 로 재확인 간격을 알려주면 그대로 따르고, 없으면 다음 입장 묶음(``nwait <= nnext``)에
+        들어간 경우 가장 짧은 간격으로, 그 외에는 예상 대기 시간의 절반을 기다립니다.
+        간격은 ``MIN_WAIT_INTERVAL`` ~ ``MAX_WAIT_INTERVAL`` 사이로 제한하며, 예상 대기 시간보다 길게 기다리지 않습니다.
+        """
+        nwait = netfunnel_resp.nwait
+        nnext = netfunnel_resp.nnext
+        tps = netfunnel_resp.tps
+        ttl = netfunnel_resp.ttl
+
+        if tps > 0:
+            eta = nwait / tps
+        elif nnext > 0 and ttl > 0:
+            eta = math.ceil(nwait / nnext) * ttl
+        else:
+            eta = None
+
+        if ttl > 0:
+            interval = ttl
+        elif 0 < nwait <= nnext:
+            interval = self.MIN_WAIT_INTERVAL
+        elif eta is not None:
+            interval = eta / 2
+        else:
+            interval = self.DEFAULT_WAIT_INTERVAL
+
+        if eta is not None:
+            interval = min(interval, eta)
+        interval = min(max(interval, self.MIN_WAIT_INTERVAL), self.MAX_WAIT_INTERVAL)
+
+        return NetFunnelWaitStatus(
+            nwait=nwait,
+            nnext=nnext,
+            tps=tps,
+            eta=eta,
+            interval=interval,
+            polls=polls,
+            elapsed=elapsed,
+        )
+
+    def _init_complete_mode(self, complete_mode: str) -> None:
+        if complete_mode not in COMPLETE_MODES:
+            raise ValueError(f"complete_mode must be one of {COMPLETE_MODES}")
+
+        self.complete_mode = complete_mode
+        self._completed_keys: OrderedDict[str, None] = OrderedDict()
+        self._completed_lock = threading.Lock()
+
+    def _needs_complete(self, key: str) -> bool:
+        """``key`` 의 완료 요청을 보내야 하는지 확인하고, 보낼 경우 완료된 것으로 기록합니다."""
+        if self.complete_mode == COMPLETE_ALWAYS:
+            return True
+
+        with self._completed_lock:
+            if key in self._completed_keys:
+                return False
+            self._completed_keys[key] = None
+            while len(self._completed_keys) > _COMPLETED_KEYS_SIZE:
+                self._completed_keys.popitem(last=False)
+            return True
+
+    def _forget_complete(self, key: str) -> None:
+        """완료 요청이 실패한 키를 다음에 다시 완료하도록 기록에서 지웁니다."""
+        with self._completed_lock:
+            self._completed_keys.pop(key, None)
+
+
+class NetFunnelHelper(_NetFunnelBase):
+    """NetFunnel 키 관리 클래스
+
+    ``complete_mode`` 로 키 사용 후의 완료(setComplete) 요청 방식을 정합니다.
+
+    - ``"always"``: 키를 사용할 때마다 완료 요청을 보냅니다.
+    - ``"once"``: 키마다 처음 한 번만 완료 요청을 보냅니다. (default)
+    - ``"background"``: 키마다 한 번, 백그라운드에서 보내므로 SRT 요청과 동시에 진행됩니다.
+      새 키로 다시 시도하는 경우(``use_cache=False``)에는 완료 요청이 끝난 뒤 반환합니다.
+
+    대기열에 들어가면 대기 상태(:class:`NetFunnelWaitStatus`)가 바뀔 때마다 ``on_wait`` 을 호출합니다.
+    기본값은 대기 인원과 예상 대기 시간을 출력합니다.
+
+    Args:
+        transport (TransportConfig, optional): HTTP 연결 설정
+        complete_mode (str): 완료 요청 방식
+        on_wait (Callable[[NetFunnelWaitStatus], None], optional): 대기열 상태를 받을 함수
+    """
+
+    def __init__(
+        self,
+        transport: TransportConfig | None = None,
+        complete_mode: str = COMPLETE_ONCE,
+        on_wait: Callable[["NetFunnelWaitStatus"], None] | None = None,
+    ):
+        self.transport = transport if transport is not None else DEFAULT_TRANSPORT
+        self.session = self.transport.create_session(self.DEFAULT_HEADERS)
         self._cached_key = None
+        self._init_complete_mode(complete_mode)
+        self.on_wait = on_wait if on_wait is not None else print_wait_status
+
+        if self.transport.warmup:
+            self.transport.warmup_session(
+                self.session, [self.NETFUNNEL_URL], background=True
+            )
+
+    def warmup(self) -> int:
+        """NetFunnel 서버에 미리 연결을 열어둡니다."""
+        return self.transport.warmup_session(self.session, [self.NETFUNNEL_URL])
 
     def generate_netfunnel_key(self, use_cache: bool):
-        key = self._get_netfunnel_key(use_cache)
-        self._set_complete(key)
+        with span("netfunnel.get_key"):
+            key = self._get_netfunnel_key(use_cache)
+
+        if self._needs_complete(key):
+            if use_cache and self.complete_mode == COMPLETE_BACKGROUND:
+                # 백그라운드 완료 요청은 예약 요청과 동시에 진행되므로 시작만 기록
+                with span("netfunnel.complete", background=True):
+                    threading.Thread(
+                        target=self._complete_in_background, args=(key,), daemon=True
+                    ).start()
+            else:
+                with span("netfunnel.complete"):
+                    try:
+                        self._set_complete(key)
+                    except Exception:
+                        self._forget_complete(key)
+                        raise
+
         return key
 
+    def _complete_in_background(self, key: str) -> None:
+        try:
+            self._set_complete(key)
+        except Exception:
+            # 다음에 이 키를 사용할 때 다시 완료 요청을 보냅니다.
+            self._forget_complete(key)
+
     def _get_netfunnel_key(self, use_cache: bool):
         """
         NetFunnel 키를 요청합니다.
@@ -56,84 +308,52 @@ class NetFunnelHelper:
         if use_cache and self._cached_key is not None:
             return self._cached_key
 
-        params = {
-            "opcode": self.OP_CODE["getTidchkEnter"],
-            "nfid": "0",
-            "prefix": f"NetFunnel.gRtype={self.OP_CODE['getTidchkEnter']};",
-            "sid": "service_1",
-            "aid": "act_10",
-            "js": "true",
-            self._get_timestamp_for_netfunnel(): "",
-        }
+        self._cached_key = self._fetch_key()
 
-        try:
-            resp = self.session.get(
-                self.NETFUNNEL_URL,
-                params=params,
-            )
-        except Exception as e:
-            raise SRTNetFunnelError(e) from e
+        return self._cached_key
 
-        netfunnel_resp = NetFunnelResponse.parse(resp.text)
+    def _fetch_key(self) -> str:
+        """
+        NetFunnel 서버에서 새 키를 발급받습니다. 대기열에 들어가면 통과할 때까지 기다립니다.
+        """
+
+        netfunnel_resp = self._request(self._get_key_params())
 
         netfunnel_key = netfunnel_resp.get("key")
         if netfunnel_key is None:
             raise SRTNetFunnelError("NetFunnel key not found in response")
 
         if netfunnel_resp.get("status") == self.WAIT_STATUS_FAIL:
-            # TODO: better logging
-            print("접속자가 많아 대기열에 들어갑니다.")
-
-            nwait = netfunnel_resp.get("nwait") or "<unknown>"
-
-            netfunnel_key = self._wait_until_complete(netfunnel_key, nwait)
-
-        self._cached_key = netfunnel_key
+            netfunnel_key = self._wait_until_complete(netfunnel_key, netfunnel_resp)
 
         return netfunnel_key
 
-    def _wait_until_complete(self, key: str, nwait: str) -> str:
+    def _wait_until_complete(self, key: str, netfunnel_resp: "NetFunnelResponse") -> str:
         """
         NetFunnel이 완료될 때까지 대기합니다.
-        """
-
-        params = {
-            "opcode": self.OP_CODE["chkEnter"],
-            "key": key,
-            "nfid": "0",
-            "prefix": f"NetFunnel.gRtype={self.OP_CODE['chkEnter']};",
-            "ttl": 1,
-            "sid": "service_1",
-            "aid": "act_10",
-            "js": "true",
-            self._get_timestamp_for_netfunnel(): "",
-        }
 
-        try:
-            resp = self.session.get(
-                self.NETFUNNEL_URL,
-                params=params,
-            )
-        except Exception as e:
-            raise SRTNetFunnelError(e) from e
+        서버가 알려준 대기 인원과 처리량으로 다음 확인 시점을 정하고,
+        확인할 때마다 ``on_wait`` 에 대기 상태를 전달합니다.
+        """
 
-        netfunnel_resp = NetFunnelResponse.parse(resp.text)
+        started = time.monotonic()
+        polls = 0
 
-        nwait_ = netfunnel_resp.get("nwait")
-        key_ = netfunnel_resp.get("key")
-        if key_ is None:
-            raise SRTNetFunnelError("NetFunnel key not found in response")
+        while True:
+            status = self._wait_status(netfunnel_resp, polls, time.monotonic() - started)
+            self.on_wait(status)
+            time.sleep(status.interval)
 
-        if nwait_ and nwait_ != "0":
-            print(f"대기인원: {nwait_}명")
+            netfunnel_resp = self._request(self._wait_params(key))
+            polls += 1
 
-            # 1 sec
-            # TODO: find how to calculate the re-try interval
-            time.sleep(1)
+            key = netfunnel_resp.get("key")
+            if key is None:
+                raise SRTNetFunnelError("NetFunnel key not found in response")
 
-            return self._wait_until_complete(key_, nwait_)
-        else:
-            return key_
+            nwait = netfunnel_resp.get("nwait")
+            if not nwait or nwait == "0":
+                return key
 
     def _set_complete(self, key: str):
         """
@@ -143,38 +363,184 @@ class NetFunnelHelper:
             key (str): NetFunnel 키
         """
 
-        params = {
-            "opcode": self.OP_CODE["setComplete"],
-            "key": key,
-            "nfid": "0",
-            "prefix": f"NetFunnel.gRtype={self.OP_CODE['setComplete']};",
-            "js": "true",
-            self._get_timestamp_for_netfunnel(): "",
-        }
+        netfunnel_resp = self._request(self._complete_params(key))
+        self._check_complete_response(netfunnel_resp)
 
+    def _request(self, params: dict) -> "NetFunnelResponse":
         try:
             resp = self.session.get(
                 self.NETFUNNEL_URL,
                 params=params,
+                timeout=self.transport.timeout_for("netfunnel"),
+                endpoint=self._endpoint_name(params),
             )
-
         except Exception as e:
             raise SRTNetFunnelError(e) from e
 
-        netfunnel_resp = NetFunnelResponse.parse(resp.text)
-        if netfunnel_resp.get("status") not in [
-            self.WAIT_STATUS_PASS,
-            self.ALREADY_COMPLETED,
-        ]:
-            raise SRTNetFunnelError(f"Failed to complete NetFunnel: {netfunnel_resp}")
+        return NetFunnelResponse.parse(resp.text)
 
-    def _get_timestamp_for_netfunnel(self):
-        return int(time.time() * 1000)
+
+class NetFunnelKeyManager(NetFunnelHelper):
+    """여러 스레드와 프로세스가 함께 사용하는 NetFunnel 키 관리 클래스
+
+    키의 발급 시각을 기록해 ``max_age`` 초가 지난 키는 새로 발급받습니다.
+    만료 ``refresh_ahead`` 초 전부터는 기존 키를 계속 사용하면서 백그라운드에서 새 키를 미리 받아두므로,
+    검색 요청이 키 발급을 기다리는 일이 거의 없습니다.
+    여러 스레드가 동시에 새 키를 요청하면 한 번만 발급받습니다.
+
+    ``store_path`` 를 지정하면 현재 키를 파일에 저장하고, 같은 파일을 사용하는 다른 워커 프로세스가
+    발급받은 키도 가져다 씁니다.
+
+    >>> helper = NetFunnelKeyManager(store_path="netfunnel_key.json")
+    >>> srt1 = SRT(id1, pw1, netfunnel_helper=helper)
+    >>> srt2 = SRT(id2, pw2, netfunnel_helper=helper)
+
+    Args:
+        transport (TransportConfig, optional): HTTP 연결 설정
+        max_age (float): 키를 사용할 최대 시간 (초)
+        refresh_ahead (float): 만료 몇 초 전부터 새 키를 미리 발급받을지
+        store_path (str, optional): 키를 공유할 파일 경로
+        complete_mode (str): 완료 요청 방식, :class:`NetFunnelHelper` 참고
+        on_wait (Callable[[NetFunnelWaitStatus], None], optional): 대기열 상태를 받을 함수
+    """
+
+    def __init__(
+        self,
+        transport: TransportConfig | None = None,
+        max_age: float = 600.0,
+        refresh_ahead: float = 60.0,
+        store_path: str | None = None,
+        complete_mode: str = COMPLETE_ONCE,
+        on_wait: Callable[["NetFunnelWaitStatus"], None] | None = None,
+        clock=time.time,
+    ):
+        super().__init__(transport, complete_mode, on_wait)
+        self.max_age = max_age
+        self.refresh_ahead = refresh_ahead
+        self.store_path = store_path
+        self._clock = clock
+
+        self._lock = threading.Lock()
+        self._entry: tuple[str, float] | None = None
+        self._refreshing = False
+
+    @property
+    def key_age(self) -> float | None:
+        """현재 키가 발급된 지 몇 초 지났는지 반환합니다. 키가 없으면 None"""
+        entry = self._entry
+        if entry is None:
+            return None
+        return self._clock() - entry[1]
+
+    def invalidate(self) -> None:
+        """현재 키를 버립니다. 다음 요청 시 새 키를 발급받습니다."""
+        with self._lock:
+            entry = self._entry
+            self._entry = None
+            self._cached_key = None
+
+            if entry is not None and self._load() == entry:
+                try:
+                    os.remove(self.store_path)
+                except OSError:
+                    pass
+
+    def _get_netfunnel_key(self, use_cache: bool) -> str:
+        """
+        NetFunnel 키를 반환합니다.
+
+        Args:
+            use_cache (bool): False이면 현재 키를 더 이상 사용할 수 없는 것으로 보고 새 키를 발급받습니다.
+                다른 스레드나 프로세스가 이미 새 키를 받아둔 경우에는 그 키를 사용합니다.
+
+        Returns:
+            str: NetFunnel 키
+        """
+
+        entry = self._entry
+        if use_cache and entry is not None:
+            key, issued_at = entry
+            age = self._clock() - issued_at
+            if age < self.max_age:
+                if age >= self.max_age - self.refresh_ahead:
+                    self._refresh_in_background(key)
+                return key
+
+        return self._refresh(reject=None if use_cache or entry is None else entry[0])
+
+    def _refresh(self, reject: str | None) -> str:
+        with self._lock:
+            entry = self._latest()
+            if entry is not None:
+                key, issued_at = entry
+                if key != reject and self._clock() - issued_at < self.max_age:
+                    return key
+
+            key = self._fetch_key()
+            self._store(key, self._clock())
+            return key
+
+    def _refresh_in_background(self, key: str) -> None:
+        with self._lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+
+        def refresh():
+            try:
+                self._refresh(reject=key)
+            except Exception:
+                # 기존 키가 아직 유효하므로 다음 요청에서 다시 시도합니다.
+                pass
+            finally:
+                self._refreshing = False
+
+        threading.Thread(target=refresh, daemon=True).start()
+
+    def _latest(self) -> tuple[str, float] | None:
+        # self._lock을 잡은 상태에서 호출해야 합니다.
+        entry = self._entry
+        stored = self._load()
+        if stored is not None and (entry is None or stored[1] > entry[1]):
+            self._entry = stored
+            self._cached_key = stored[0]
+            entry = stored
+        return entry
+
+    def _store(self, key: str, issued_at: float) -> None:
+        self._entry = (key, issued_at)
+        self._cached_key = key
+
+        if self.store_path is None:
+            return
+
+        tmp_path = f"{self.store_path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"key": key, "issued_at": issued_at}, f)
+            os.replace(tmp_path, self.store_path)
+        except OSError:
+            # 파일 공유는 최선을 다할 뿐이며, 실패해도 메모리의 키는 사용할 수 있습니다.
+            pass
+
+    def _load(self) -> tuple[str, float] | None:
+        if self.store_path is None:
+            return None
+
+        try:
+            with open(self.store_path, encoding="utf-8") as f:
+                stored = json.load(f)
+            return stored["key"], float(stored["issued_at"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
 
 
 class NetFunnelResponse:
     """
     Represents a NetFunnel response.
+
+    결과 값은 :func:`get` 으로 문자열 그대로 가져오거나, ``nwait`` / ``tps`` 같은 속성으로
+    변환된 값을 가져올 수 있습니다.
     """
 
     OP_CODE_KEY = "NetFunnel.gRtype"
@@ -191,6 +557,14 @@ class NetFunnelResponse:
         "msg",
     ]
 
+    # 응답을 한 번 훑으며 opcode와 result 값을 찾습니다.
+    _PATTERN = re.compile(
+        r"NetFunnel\.g(?:Rtype=(?P<opcode>[^;]*)|Control\.result='(?P<result>[^']*)')"
+    )
+    _SUBKEYS = frozenset(RESULT_SUBKEYS)
+
+    __slots__ = ("response", "data")
+
     def __init__(self, response: str, data: dict[str, str]):
         self.response = response
         self.data = data
@@ -209,37 +583,74 @@ class NetFunnelResponse:
         ```
         """
 
-        top_level_keys = [r.strip() for r in response.split(";")]
-
         data: dict[str, str] = {}
-        for top_level_key in top_level_keys:
-
-            if top_level_key.startswith(cls.OP_CODE_KEY):
-                data["opcode"] = top_level_key[len(cls.OP_CODE_KEY) + 1 :]
+        for match in cls._PATTERN.finditer(response):
+            opcode, result = match.group("opcode", "result")
+            if opcode is not None:
+                data["opcode"] = opcode.strip()
+                continue
 
-            if top_level_key.startswith(cls.RESULT_KEY):
-                results = top_level_key[len(cls.RESULT_KEY) + 1 :].strip("'").split(":")
+            parts = result.split(":", 2)
+            if len(parts) != 3:
+                raise SRTNetFunnelError(f"Invalid NetFunnel response format: {response}")
 
-                if len(results) != 3:
-                    raise SRTNetFunnelError(
-                        f"Invalid NetFunnel response format: {response}"
-                    )
+            data["next_code"] = parts[0]  # dunno what this is...
+            data["status"] = parts[1]
 
-                code, status, result = results
-                data["next_code"] = code  # dunno what this is...
-                data["status"] = status
-
-                result_keys = result.split("&")
-                for key in result_keys:
-                    for subkey in cls.RESULT_SUBKEYS:
-                        if key.startswith(subkey):
-                            data[subkey] = key.split("=")[1]
-                            break
+            for pair in parts[2].split("&"):
+                name, _, value = pair.partition("=")
+                if name in cls._SUBKEYS:
+                    data[name] = value
 
         return cls(response, data)
 
     def get(self, key: str):
         return self.data.get(key)
 
+    @property
+    def opcode(self) -> str | None:
+        return self.data.get("opcode")
+
+    @property
+    def status(self) -> str | None:
+        return self.data.get("status")
+
+    @property
+    def key(self) -> str | None:
+        return self.data.get("key")
+
+    @property
+    def nwait(self) -> int:
+        """앞에 남은 대기 인원"""
+        return int(_to_number(self.data.get("nwait")))
+
+    @property
+    def nnext(self) -> int:
+        """다음에 한꺼번에 입장시키는 인원"""
+        return int(_to_number(self.data.get("nnext")))
+
+    @property
+    def tps(self) -> float:
+        """초당 입장 인원"""
+        return _to_number(self.data.get("tps"))
+
+    @property
+    def ttl(self) -> float:
+        """서버가 알려준 재확인 간격 (초)"""
+        return _to_number(self.data.get("ttl"))
+
+    @property
+    def ip(self) -> str | None:
+        return self.data.get("ip")
+
+    @property
+    def port(self) -> int | None:
+        port = self.data.get("port")
+        return int(port) if port and port.isdigit() else None
+
+    @property
+    def msg(self) -> str | None:
+        return self.data.get("msg")
+
     def __str__(self):
         return self.response
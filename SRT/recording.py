@@ -0,0 +1,310 @@
+"""HTTP 요청/응답 녹화와 재생
+
+:class:`Recorder` 는 클라이언트가 주고받은 요청/응답을 gzip으로 압축한 JSONL 파일에 기록하고,
+:class:`Replay` 는 그 파일의 응답을 실제 서버 대신 돌려줍니다. 둘 다 :class:`TransportConfig` 에 지정하면
+SRT, NetFunnel, Korail 세션에 똑같이 적용되므로, 실제 서버에서 녹화한 뒤 오프라인에서
+``search_train``, ``reserve``, 웹 앱의 예약 매크로를 같은 응답으로 반복해서 측정할 수 있습니다.
+
+녹화 파일의 한 줄은 요청 하나입니다.
+
+    {"method": "POST", "url": "https://app.srail.or.kr/ara/selectListAra10007_n.do",
+     "query": [], "form": [["dptTm", "080000"], ...], "status": 200, "reason": "OK",
+     "content_type": "application/json;charset=UTF-8", "encoding": "UTF-8",
+     "body": "{...}", "elapsed_ms": 84.2}
+
+계정 ID/비밀번호, 회원번호, 휴대폰 번호, 카드 정보는 요청과 응답 본문 모두에서 ``SCRUB_FIELDS`` 와
+``SCRUB_NAME_PATTERN`` 으로 지우고,
+쿠키와 헤더는 기록하지 않습니다.
+"""
+
+import gzip
+import json
+import re
+import threading
+import time
+import zlib
+from collections import defaultdict
+from datetime import timedelta
+from typing import Any, Iterable, Iterator
+from urllib.parse import parse_qsl, urlsplit, urlunsplit
+
+import requests  # type: ignore[import]
+from requests.adapters import BaseAdapter  # type: ignore[import]
+from requests.structures import CaseInsensitiveDict  # type: ignore[import]
+
+REDACTED = "***"
+
+# 요청 파라미터와 응답 JSON에서 값을 지울 이름
+SCRUB_FIELDS = frozenset(
+    {
+        # SRT 로그인 요청/응답
+        "srchDvNm",
+        "hmpgPwdCphd",
+        "MB_CRD_NO",
+        "CUST_NM",
+        "MBL_PHONE",
+        # SRT 예약/결제 요청
+        "mbCrdNo",
+        "mblPhone",
+        "stlCrCrdNo1",
+        "vanPwd1",
+        "crdVlidTrm1",
+        "athnVal1",
+        # Korail 로그인 요청/응답 (Key는 로그인 세션 키)
+        "txtMemberNo",
+        "txtPwd",
+        "Key",
+        "strMbCrdNo",
+        "strCustNm",
+        "strEmailAdr",
+        "strCpNo",
+    }
+)
+
+# 승객/결제 수단마다 번호가 붙는 이름 (Korail 할인카드 txtCardNo_1, SRT 결제 카드 stlCrCrdNo1 등).
+# ``fields`` 와 상관없이 항상 지웁니다.
+SCRUB_NAME_PATTERN = r"txtCard(?:No|Pw)_\d+|(?:stlCrCrdNo|vanPwd|crdVlidTrm|athnVal)\d+"
+_SCRUB_NAME = re.compile(SCRUB_NAME_PATTERN)
+
+# 요청마다 바뀌어 재생할 때 비교하지 않는 파라미터 (NetFunnel 타임스탬프는 이름이 숫자, 값이 빈 문자열)
+VOLATILE_FIELDS = frozenset({"stlDmnDt"})
+
+
+def scrub_params(params: Iterable[tuple[str, str]], fields: frozenset[str] = SCRUB_FIELDS) -> list[list[str]]:
+    """``[(이름, 값)]`` 에서 ``fields`` 나 ``SCRUB_NAME_PATTERN`` 에 해당하는 값을 ``REDACTED`` 로 바꿉니다."""
+    return [
+        [name, REDACTED if value and (name in fields or _SCRUB_NAME.fullmatch(name)) else value]
+        for name, value in params
+    ]
+
+
+def scrub_body(text: str, fields: frozenset[str] = SCRUB_FIELDS) -> str:
+    """응답 본문의 JSON 문자열 값 중 ``fields`` 나 ``SCRUB_NAME_PATTERN`` 에 해당하는 값을 ``REDACTED`` 로 바꿉니다."""
+    return _body_pattern(fields).sub(lambda m: f'{m.group(1)}"{REDACTED}"', text)
+
+
+_BODY_PATTERNS: dict[frozenset[str], re.Pattern] = {}
+
+
+def _body_pattern(fields: frozenset[str]) -> re.Pattern:
+    pattern = _BODY_PATTERNS.get(fields)
+    if pattern is None:
+        names = "|".join([re.escape(name) for name in sorted(fields)] + [SCRUB_NAME_PATTERN])
+        pattern = _BODY_PATTERNS[fields] = re.compile(rf'("(?:{names})"\s*:\s*)"(?:[^"\\]|\\.)*"')
+    return pattern
+
+
+def read_recording(path: str) -> Iterator[dict[str, Any]]:
+    """녹화 파일의 요청을 기록된 순서대로 읽습니다. 녹화 중인 파일의 끝에 덜 쓴 부분이 있으면 무시합니다."""
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        try:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+        except (EOFError, zlib.error, json.JSONDecodeError):
+            return
+
+
+class Recorder:
+    """요청/응답을 gzip JSONL 파일에 기록
+
+    파일은 이어서 쓰며, 요청마다 flush 하므로 녹화 중에도 :func:`read_recording` 으로 읽을 수 있습니다.
+
+    >>> recorder = Recorder("srt_session.jsonl.gz")
+    >>> srt = SRT(srt_id, srt_pw, transport=TransportConfig(recorder=recorder))
+    >>> srt.search_train("수서", "부산", "20240101", "080000")
+    >>> recorder.close()
+
+    Args:
+        path (str): 녹화 파일 경로 (``.jsonl.gz``)
+        fields (frozenset[str]): 값을 지울 요청 파라미터/응답 JSON 이름 (default: ``SCRUB_FIELDS``)
+    """
+
+    def __init__(self, path: str, fields: frozenset[str] = SCRUB_FIELDS) -> None:
+        self.path = path
+        self.fields = fields
+        self.count = 0
+        self._lock = threading.Lock()
+        self._file = None
+
+    def wrap(self, adapter: BaseAdapter) -> BaseAdapter:
+        """``adapter`` 로 보내는 요청을 기록하는 어댑터를 반환합니다."""
+        return _RecordingAdapter(adapter, self)
+
+    def record(self, request: requests.PreparedRequest, response: requests.Response, elapsed: float) -> None:
+        """요청 하나를 기록합니다. ``elapsed`` 는 요청을 보내고 응답 본문까지 받는 데 걸린 시간 (초)"""
+        url, query = _split_url(request.url)
+        encoding = response.encoding or response.apparent_encoding or "utf-8"
+        entry = {
+            "method": request.method,
+            "url": url,
+            "query": scrub_params(query, self.fields),
+            "form": scrub_params(_form(request.body), self.fields),
+            "status": response.status_code,
+            "reason": response.reason,
+            "content_type": response.headers.get("Content-Type", ""),
+            "encoding": encoding,
+            "body": scrub_body(response.content.decode(encoding, "replace"), self.fields),
+            "elapsed_ms": round(elapsed * 1000, 3),
+        }
+        line = json.dumps(entry, ensure_ascii=False) + "\n"
+        with self._lock:
+            if self._file is None:
+                self._file = gzip.open(self.path, "at", encoding="utf-8")
+            self._file.write(line)
+            self._file.flush()
+            self.count += 1
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+class Replay:
+    """녹화 파일의 응답을 실제 서버 대신 돌려줌
+
+    요청마다 메서드, URL 경로, (``VOLATILE_FIELDS`` 와 NetFunnel 타임스탬프를 뺀) 파라미터가 모두 같은 기록을 찾고,
+    없으면 같은 메서드/경로의 기록을 사용합니다. 같은 요청의 기록이 여럿이면 녹화된 순서대로 돌아가며 반환하고,
+    끝까지 쓰면 처음부터 다시 반환합니다. 같은 경로의 기록이 하나도 없으면 ``requests.ConnectionError`` 를 발생시킵니다.
+    호스트는 비교하지 않으므로 모의 서버에서 녹화한 파일도 실제 서버 주소로 재생할 수 있습니다.
+
+    >>> transport = TransportConfig(replay=Replay("srt_session.jsonl.gz", latency=0.05))
+    >>> srt = SRT(srt_id, srt_pw, transport=transport)
+
+    Args:
+        path (str): 녹화 파일 경로
+        latency (float, optional): 응답마다 기다릴 시간 (초). ``None`` 이면 녹화된 응답 시간만큼 기다립니다 (default: 0)
+        fields (frozenset[str]): 녹화할 때 값을 지운 이름. 요청을 같은 방식으로 지운 뒤 비교합니다
+    """
+
+    def __init__(
+        self,
+        path: str,
+        latency: float | None = 0.0,
+        fields: frozenset[str] = SCRUB_FIELDS,
+    ) -> None:
+        self.path = path
+        self.latency = latency
+        self.fields = fields
+        self.served = 0
+        self.missed = 0
+        self._lock = threading.Lock()
+        self._exact: dict[tuple, list[dict[str, Any]]] = defaultdict(list)
+        self._routes: dict[tuple[str, str], list[dict[str, Any]]] = defaultdict(list)  # (메서드, 경로)
+        self._cursors: dict[tuple, int] = defaultdict(int)
+
+        for entry in read_recording(path):
+            params = entry["query"] + entry["form"]
+            path = urlsplit(entry["url"]).path
+            self._exact[_key(entry["method"], path, params)].append(entry)
+            self._routes[(entry["method"], path)].append(entry)
+
+    def __len__(self) -> int:
+        return sum(len(entries) for entries in self._routes.values())
+
+    def adapter(self) -> BaseAdapter:
+        """이 녹화로 응답하는 어댑터를 반환합니다."""
+        return _ReplayAdapter(self)
+
+    def lookup(self, request: requests.PreparedRequest) -> dict[str, Any] | None:
+        """``request`` 에 돌려줄 기록을 찾습니다."""
+        url, query = _split_url(request.url)
+        path = urlsplit(url).path
+        params = scrub_params(query, self.fields) + scrub_params(_form(request.body), self.fields)
+        exact = _key(request.method, path, params)
+        route = (request.method, path)
+
+        with self._lock:
+            if exact in self._exact:
+                key, entries = exact, self._exact[exact]
+            elif route in self._routes:
+                key, entries = route, self._routes[route]
+                self.missed += 1
+            else:
+                return None
+            index = self._cursors[key]
+            self._cursors[key] = (index + 1) % len(entries)
+            self.served += 1
+            return entries[index]
+
+    def response(self, request: requests.PreparedRequest, entry: dict[str, Any]) -> requests.Response:
+        delay = entry["elapsed_ms"] / 1000 if self.latency is None else self.latency
+        if delay > 0:
+            time.sleep(delay)
+
+        response = requests.Response()
+        response.status_code = entry["status"]
+        response.reason = entry["reason"]
+        response.headers = CaseInsensitiveDict()
+        if entry["content_type"]:
+            response.headers["Content-Type"] = entry["content_type"]
+        response.encoding = entry["encoding"]
+        response._content = entry["body"].encode(entry["encoding"], "replace")
+        response.url = request.url
+        response.request = request
+        response.elapsed = timedelta(seconds=delay)
+        return response
+
+
+class _RecordingAdapter(BaseAdapter):
+    def __init__(self, adapter: BaseAdapter, recorder: Recorder) -> None:
+        super().__init__()
+        self.adapter = adapter
+        self.recorder = recorder
+
+    def send(self, request, **kwargs):
+        started = time.perf_counter()
+        response = self.adapter.send(request, **kwargs)
+        response.content  # 응답 본문까지 받는 시간을 기록
+        self.recorder.record(request, response, time.perf_counter() - started)
+        return response
+
+    def close(self):
+        self.adapter.close()
+
+
+class _ReplayAdapter(BaseAdapter):
+    def __init__(self, replay: Replay) -> None:
+        super().__init__()
+        self.replay = replay
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        entry = self.replay.lookup(request)
+        if entry is None:
+            raise requests.ConnectionError(f"no recording for {request.method} {request.url}", request=request)
+        return self.replay.response(request, entry)
+
+    def close(self):
+        pass
+
+
+def _split_url(url: str) -> tuple[str, list[tuple[str, str]]]:
+    parts = urlsplit(url)
+    base = urlunsplit((parts.scheme, parts.netloc, parts.path, "", ""))
+    return base, parse_qsl(parts.query, keep_blank_values=True)
+
+
+def _form(body: bytes | str | None) -> list[tuple[str, str]]:
+    if not body:
+        return []
+    if isinstance(body, bytes):
+        body = body.decode("utf-8", "replace")
+    if not isinstance(body, str):  # 스트리밍 본문
+        return []
+    return parse_qsl(body, keep_blank_values=True)
+
+
+def _key(method: str, path: str, params: Iterable[list[str]]) -> tuple:
+    return (
+        method,
+        path,
+        tuple(
+            sorted(
+                (name, value)
+                for name, value in params
+                if name not in VOLATILE_FIELDS and not (name.isdigit() and not value)
+            )
+        ),
+    )
@@ -40,7 +40,13 @@ class SRTTicket:
 
 
 class SRTReservation:
-    def __init__(self, train, pay, tickets):
+    """예약 내역
+
+    ``tickets`` 대신 ``ticket_loader`` 를 주면 :attr:`tickets` 에 처음 접근할 때
+    ``ticket_loader()`` 를 호출해 티켓 정보를 가져옵니다.
+    """
+
+    def __init__(self, train, pay, tickets=None, ticket_loader=None):
         self.reservation_number = train["pnrNo"]
         self.total_cost = train["rcvdAmt"]
         self.seat_count = train["tkSpecNum"]
@@ -66,6 +72,7 @@ class SRTReservation:
 
         self.paid = pay["stlFlg"] == "Y"  # 결제 여부
         self._tickets = tickets
+        self._ticket_loader = ticket_loader
 
     def __str__(self):
         return self.dump()
@@ -79,12 +86,23 @@ class SRTReservation:
             f"{self.dep_date[4:6]}월 {self.dep_date[6:8]}일, "
             f"{self.dep_station_name}~{self.arr_station_name}"
             f"({self.dep_time[0:2]}:{self.dep_time[2:4]}~{self.arr_time[0:2]}:{self.arr_time[2:4]}) "
-            f"{self.total_cost}원({self.seat_count}석)"
         )
-        if not self.paid:
+        # 예약 응답만으로 만든 내역은 금액/구입기한이 비어 있을 수 있습니다.
+        if self.total_cost:
+            d += f"{self.total_cost}원({self.seat_count}석)"
+        else:
+            d += f"{self.seat_count}석"
+        if not self.paid and self.payment_date:
             d += f", 구입기한 {self.payment_date[4:6]}월 {self.payment_date[6:8]}일 {self.payment_time[0:2]}:{self.payment_time[2:4]}"
         return d
 
     @property
     def tickets(self):
+        if self._tickets is None and self._ticket_loader is not None:
+            self._tickets = self._ticket_loader()
+            self._ticket_loader = None
         return self._tickets
+
+    @property
+    def tickets_loaded(self) -> bool:
+        return self._tickets is not None or self._ticket_loader is None
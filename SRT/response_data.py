@@ -2,17 +2,31 @@ import json
 
 from .errors import SRTError, SRTResponseError
 
+try:
+    # 설치되어 있으면 더 빠른 orjson으로 응답을 해석합니다.
+    import orjson
+
+    json_loads = orjson.loads
+    JSON_BACKEND = "orjson"
+except ImportError:
+    json_loads = json.loads
+    JSON_BACKEND = "json"
+
 
 class SRTResponseData:
     """SRT Response data class
     parse JSON response from API request
+
+    응답은 한 번만 해석하며, :func:`out_data`, :func:`train_list`, :func:`pay_list`,
+    :func:`reserv_list` 는 복사하지 않고 해석된 값을 그대로 반환합니다 (항목이 없으면 새 빈 리스트).
+    반환된 값은 수정하지 말고 읽기 전용으로 사용해야 합니다.
     """
 
     STATUS_SUCCESS = "SUCC"
     STATUS_FAIL = "FAIL"
 
     def __init__(self, response):
-        self._json = json.loads(response)
+        self._json = json_loads(response)
         self._status = {}
 
         # parse response data
@@ -56,5 +70,22 @@ class SRTResponseData:
     def get_all(self):
         return self._json.copy()
 
+    # read-only views (no copy)
+    def out_data(self, name: str = "dsOutput1") -> list[dict]:
+        """``outDataSets`` 의 데이터셋 (열차 검색 결과는 ``dsOutput1``)"""
+        return self._json.get("outDataSets", {}).get(name, [])
+
+    def train_list(self) -> list[dict]:
+        """``trainListMap`` (예약 내역, 티켓 정보)"""
+        return self._json.get("trainListMap", [])
+
+    def pay_list(self) -> list[dict]:
+        """``payListMap`` (예약 내역의 결제 정보)"""
+        return self._json.get("payListMap", [])
+
+    def reserv_list(self) -> list[dict]:
+        """``reservListMap`` (예약 결과)"""
+        return self._json.get("reservListMap", [])
+
     def get_status(self):
         return self._status.copy()
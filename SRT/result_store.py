@@ -0,0 +1,250 @@
+import json
+import sqlite3
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from contextlib import closing
+from typing import Any, Callable, Iterable, Sequence
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    id TEXT PRIMARY KEY,
+    fields TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    created REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS result_rows (
+    id TEXT NOT NULL,
+    idx INTEGER NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (id, idx)
+);
+"""
+
+
+class _Result:
+    """같은 키를 가진 dict 목록을 키 목록 하나와 값 튜플들로 보관"""
+
+    __slots__ = ("fields", "rows", "created")
+
+    def __init__(self, fields: tuple[str, ...], rows: list[tuple], created: float):
+        self.fields = fields
+        self.rows = rows
+        self.created = created
+
+    def row(self, index: int) -> dict[str, Any]:
+        if not 0 <= index < len(self.rows):
+            raise IndexError("result row index out of range")
+        return dict(zip(self.fields, self.rows[index]))
+
+
+class ResultStore:
+    """검색 결과와 선택한 열차를 서버에 보관하는 저장소
+
+    결과는 ID로 찾으며, 세션(쿠키)에는 ID만 저장합니다. 같은 키를 가진 dict 목록은
+    키 목록을 한 번만 저장하고 행마다 값 튜플만 보관합니다.
+    메모리에는 가장 최근에 사용한 ``maxsize`` 개만 두고, ``path`` 를 지정하면 SQLite 파일에도 저장해
+    메모리에서 밀려난 결과나 다른 워커 프로세스가 저장한 결과를 읽을 수 있습니다.
+    :func:`rows` 는 필요한 행만 읽습니다.
+
+    >>> store = ResultStore(path="results.sqlite3")
+    >>> result_id = store.put([{"train_no": "301", "dep_time": "050000"}, ...])
+    >>> store.rows(result_id, [0, 3])
+    [{'train_no': '301', 'dep_time': '050000'}, ...]
+
+    Args:
+        maxsize (int): 메모리에 보관할 최대 결과 수
+        ttl (float): 결과를 보관할 시간 (초)
+        path (str, optional): SQLite 파일 경로
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 256,
+        ttl: float = 60 * 60,
+        path: str | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be positive")
+
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.path = path
+        self._clock = clock
+
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, _Result] = OrderedDict()
+
+        self._hits = 0
+        self._misses = 0
+        self._loads = 0
+
+        if path is not None:
+            with closing(sqlite3.connect(path)) as conn, conn:
+                conn.executescript(_SCHEMA)
+
+    def put(self, rows: Iterable[dict[str, Any]]) -> str:
+        """``rows`` 를 저장하고 새 ID를 반환합니다. 모든 행은 같은 키를 가져야 합니다."""
+        rows = list(rows)
+        fields = tuple(rows[0]) if rows else ()
+        try:
+            values = [tuple(row[field] for field in fields) for row in rows]
+        except KeyError as e:
+            raise ValueError(f"All rows must have the same keys, missing {e}") from None
+        if any(len(row) != len(fields) for row in rows):
+            raise ValueError("All rows must have the same keys")
+
+        result_id = uuid.uuid4().hex
+        result = _Result(fields, values, self._clock())
+
+        if self.path is not None:
+            self._save(result_id, result)
+
+        with self._lock:
+            self._entries[result_id] = result
+            self._entries.move_to_end(result_id)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+        return result_id
+
+    def get(self, result_id: str) -> list[dict[str, Any]] | None:
+        """저장한 행 전체를 반환합니다. 없거나 만료되었으면 ``None`` 을 반환합니다."""
+        result = self._result(result_id)
+        if result is None:
+            return None
+        return [dict(zip(result.fields, row)) for row in result.rows]
+
+    def rows(self, result_id: str, indices: Sequence[int]) -> list[dict[str, Any]] | None:
+        """``indices`` 번째 행만 순서대로 반환합니다. 없거나 만료되었으면 ``None`` 을 반환합니다.
+
+        메모리에 없는 결과는 SQLite 파일에서 해당 행만 읽습니다.
+
+        Raises:
+            IndexError: 범위를 벗어난 인덱스가 있는 경우
+        """
+        with self._lock:
+            result = self._cached(result_id)
+        if result is not None:
+            return [result.row(index) for index in indices]
+
+        if self.path is None:
+            return None
+        return self._load_rows(result_id, indices)
+
+    def delete(self, result_id: str) -> None:
+        with self._lock:
+            self._entries.pop(result_id, None)
+        if self.path is not None:
+            with closing(sqlite3.connect(self.path)) as conn, conn:
+                conn.execute("DELETE FROM results WHERE id = ?", (result_id,))
+                conn.execute("DELETE FROM result_rows WHERE id = ?", (result_id,))
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "rows": sum(len(result.rows) for result in self._entries.values()),
+                "hits": self._hits,
+                "misses": self._misses,
+                "loads": self._loads,
+            }
+
+    def _cached(self, result_id: str) -> _Result | None:
+        # self._lock을 잡은 상태에서 호출해야 합니다.
+        result = self._entries.get(result_id)
+        if result is not None and self._clock() - result.created > self.ttl:
+            del self._entries[result_id]
+            result = None
+
+        if result is None:
+            self._misses += 1
+            return None
+
+        self._entries.move_to_end(result_id)
+        self._hits += 1
+        return result
+
+    def _result(self, result_id: str) -> _Result | None:
+        with self._lock:
+            result = self._cached(result_id)
+        if result is not None or self.path is None:
+            return result
+
+        result = self._load(result_id)
+        if result is not None:
+            with self._lock:
+                self._entries[result_id] = result
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+        return result
+
+    def _save(self, result_id: str, result: _Result) -> None:
+        expired = self._clock() - self.ttl
+        with closing(sqlite3.connect(self.path)) as conn, conn:
+            conn.execute(
+                "INSERT INTO results (id, fields, size, created) VALUES (?, ?, ?, ?)",
+                (result_id, _dumps(result.fields), len(result.rows), result.created),
+            )
+            conn.executemany(
+                "INSERT INTO result_rows (id, idx, data) VALUES (?, ?, ?)",
+                [(result_id, index, _dumps(row)) for index, row in enumerate(result.rows)],
+            )
+            conn.execute(
+                "DELETE FROM result_rows WHERE id IN (SELECT id FROM results WHERE created < ?)",
+                (expired,),
+            )
+            conn.execute("DELETE FROM results WHERE created < ?", (expired,))
+
+    def _header(self, conn: sqlite3.Connection, result_id: str) -> tuple[tuple[str, ...], int, float] | None:
+        row = conn.execute(
+            "SELECT fields, size, created FROM results WHERE id = ?", (result_id,)
+        ).fetchone()
+        if row is None or self._clock() - row[2] > self.ttl:
+            return None
+        return tuple(json.loads(row[0])), row[1], row[2]
+
+    def _load(self, result_id: str) -> _Result | None:
+        with closing(sqlite3.connect(self.path)) as conn:
+            header = self._header(conn, result_id)
+            if header is None:
+                return None
+            fields, _, created = header
+            rows = [
+                tuple(json.loads(data))
+                for (data,) in conn.execute(
+                    "SELECT data FROM result_rows WHERE id = ? ORDER BY idx", (result_id,)
+                )
+            ]
+
+        with self._lock:
+            self._loads += 1
+        return _Result(fields, rows, created)
+
+    def _load_rows(self, result_id: str, indices: Sequence[int]) -> list[dict[str, Any]] | None:
+        with closing(sqlite3.connect(self.path)) as conn:
+            header = self._header(conn, result_id)
+            if header is None:
+                return None
+            fields, size, _ = header
+
+            wanted = sorted(set(indices))
+            if any(not 0 <= index < size for index in wanted):
+                raise IndexError("result row index out of range")
+            placeholders = ",".join("?" * len(wanted))
+            data = dict(
+                conn.execute(
+                    f"SELECT idx, data FROM result_rows WHERE id = ? AND idx IN ({placeholders})",
+                    (result_id, *wanted),
+                )
+            )
+
+        with self._lock:
+            self._loads += 1
+        return [dict(zip(fields, json.loads(data[index]))) for index in indices]
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
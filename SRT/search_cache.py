@@ -0,0 +1,134 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+
+class _Flight:
+    """진행 중인 조회 하나. 같은 키를 요청한 다른 스레드는 이 결과를 기다립니다."""
+
+    __slots__ = ("done", "value", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value: Any = None
+        self.error: BaseException | None = None
+
+
+class SearchCache:
+    """짧은 TTL의 열차 검색 결과 캐시
+
+    같은 조건의 검색을 ``ttl`` 초 동안 재사용하고, 가장 오래 사용하지 않은 항목부터
+    ``maxsize`` 개를 넘지 않도록 버립니다. 캐시에 없는 키를 여러 스레드가 동시에 요청하면
+    하나의 요청만 서버로 보내고 나머지는 그 결과를 함께 받습니다 (single-flight).
+
+    여러 :class:`SRT` / :class:`korail2.Korail` 인스턴스가 하나의 캐시를 공유할 수 있습니다.
+
+    >>> cache = SearchCache(ttl=1.0)
+    >>> srt = SRT(srt_id, srt_pw, search_cache=cache)
+    >>> cache.stats()
+    {'hits': 0, 'misses': 0, 'coalesced': 0, 'expired': 0, 'evictions': 0, 'errors': 0, 'size': 0}
+
+    Args:
+        ttl (float): 검색 결과를 재사용할 시간 (초)
+        maxsize (int): 최대 캐시 항목 수
+    """
+
+    def __init__(
+        self,
+        ttl: float = 1.0,
+        maxsize: int = 256,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be positive")
+
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._clock = clock
+
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._inflight: dict[Hashable, _Flight] = {}
+
+        self._hits = 0
+        self._misses = 0
+        self._coalesced = 0
+        self._expired = 0
+        self._evictions = 0
+        self._errors = 0
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """``key`` 에 해당하는 결과를 반환합니다. 없으면 ``loader()`` 로 조회해 저장합니다.
+
+        ``loader`` 가 예외를 던지면 결과를 저장하지 않고, 기다리던 모든 호출자에게
+        같은 예외를 던집니다.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > self._clock():
+                    self._hits += 1
+                    self._entries.move_to_end(key)
+                    return value
+                del self._entries[key]
+                self._expired += 1
+
+            flight = self._inflight.get(key)
+            if flight is not None:
+                self._coalesced += 1
+                leader = False
+            else:
+                self._misses += 1
+                flight = self._inflight[key] = _Flight()
+                leader = True
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value
+
+        try:
+            value = loader()
+        except BaseException as e:
+            with self._lock:
+                self._errors += 1
+                del self._inflight[key]
+            flight.error = e
+            flight.done.set()
+            raise
+
+        with self._lock:
+            self._entries[key] = (self._clock() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+            del self._inflight[key]
+        flight.value = value
+        flight.done.set()
+
+        return value
+
+    def invalidate(self, key: Hashable | None = None) -> None:
+        """``key`` 의 캐시를 지웁니다. ``key`` 가 없으면 전체를 지웁니다."""
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+    def stats(self) -> dict[str, int]:
+        """튜닝용 카운터를 반환합니다."""
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "coalesced": self._coalesced,
+                "expired": self._expired,
+                "evictions": self._evictions,
+                "errors": self._errors,
+                "size": len(self._entries),
+            }
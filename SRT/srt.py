@@ -1,18 +1,22 @@
 import json
 import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from datetime import datetime, timedelta
-
-import requests  # type: ignore[import]
+from typing import Iterator, NoReturn
 
 from . import constants
-from .constants import INVALID_NETFUNNEL_KEY, STATION_CODE, USER_AGENT
+from .constants import INVALID_NETFUNNEL_KEY, NOT_LOGGED_IN_MESSAGES, STATION_CODE, USER_AGENT
 from .errors import SRTError, SRTLoginError, SRTNotLoggedInError, SRTResponseError
 from .netfunnel import NetFunnelHelper
 from .passenger import Adult, Passenger
 from .reservation import SRTReservation, SRTTicket
 from .response_data import SRTResponseData
+from .search_cache import SearchCache
 from .seat_type import SeatType
+from .tracing import span, trace
 from .train import SRTTrain
+from .transport import DEFAULT_TRANSPORT, TransportConfig
 
 EMAIL_REGEX = re.compile(r"[^@]+@[^@]+\.[^@]+")
 PHONE_NUMBER_REGEX = re.compile(r"(\d{3})-(\d{3,4})-(\d{4})")
@@ -30,6 +34,357 @@ RESERVE_JOBID = {
     "STANDBY": "1102",  # 예약대기
 }
 
+# 티켓 정보를 한꺼번에 조회할 때 동시에 보낼 최대 요청 수
+TICKET_INFO_WORKERS = 4
+
+
+class _SliceSearchError(SRTResponseError):
+    """구간 조회 중 응답이 실패한 경우 (netfunnel 키 재발급 여부 판단용)"""
+
+
+# NOTE: 아래의 요청 데이터 생성/응답 해석 함수들은 :class:`SRT`와
+#       :class:`SRT.async_srt.AsyncSRT`가 함께 사용합니다.
+#       두 클라이언트의 동작이 달라지지 않도록 여기에서만 수정하세요.
+
+
+def _login_data(srt_id: str, srt_pw: str) -> dict[str, str]:
+    LOGIN_TYPES: dict[str, str] = {
+        "MEMBERSHIP_ID": "1",
+        "EMAIL": "2",
+        "PHONE_NUMBER": "3",
+    }
+
+    if EMAIL_REGEX.match(srt_id):
+        login_type = LOGIN_TYPES["EMAIL"]
+    elif PHONE_NUMBER_REGEX.match(srt_id):
+        login_type = LOGIN_TYPES["PHONE_NUMBER"]
+        srt_id = re.sub("-", "", srt_id)  # hyphen is not sent
+    else:
+        login_type = LOGIN_TYPES["MEMBERSHIP_ID"]
+
+    return {
+        "auto": "Y",
+        "check": "Y",
+        "page": "menu",
+        "deviceKey": "-",
+        "customerYn": "",
+        "login_referer": constants.API_ENDPOINTS["main"],
+        "srchDvCd": login_type,
+        "srchDvNm": srt_id,
+        "hmpgPwdCphd": srt_pw,
+    }
+
+
+def _parse_login_response(text: str) -> str:
+    """로그인 응답을 확인하고 멤버십 번호를 반환합니다.
+
+    Raises:
+        SRTLoginError: 로그인에 실패한 경우
+    """
+    if "존재하지않는 회원입니다" in text:
+        raise SRTLoginError(json.loads(text)["MSG"])
+
+    if "비밀번호 오류" in text:
+        raise SRTLoginError(json.loads(text)["MSG"])
+
+    if "Your IP Address Blocked due to abnormal access." in text:
+        raise SRTLoginError(text.strip())
+
+    return json.loads(text).get("userMap").get("MB_CRD_NO")
+
+
+def _parse_response(text: str) -> SRTResponseData:
+    try:
+        return SRTResponseData(text)
+    except Exception as e:
+        raise SRTResponseError(f"Failed to decode: invalid response ({text})") from e
+
+
+def _response_error(parser: SRTResponseData) -> SRTError:
+    """실패 응답에 해당하는 예외를 반환합니다.
+
+    서버에서 세션이 만료되어 로그인이 풀린 경우에는 :class:`SRTNotLoggedInError` 를 반환하므로,
+    :class:`ClientPool` 이 다시 로그인한 뒤 요청을 재시도합니다.
+    """
+    message = parser.message()
+    if any(text in message for text in NOT_LOGGED_IN_MESSAGES):
+        return SRTNotLoggedInError()
+    return SRTResponseError(message, parser.message_code())
+
+
+def _search_data(
+    date: str,
+    time: str,
+    dep_code: str | None,
+    arr_code: str | None,
+    netfunnelKey: str,
+) -> dict:
+    return {
+        # course (1: 직통, 2: 환승, 3: 왕복)
+        # TODO: support 환승, 왕복
+        "chtnDvCd": "1",
+        "arriveTime": "N",
+        "seatAttCd": "015",
+        # 검색 시에는 1명 기준으로 검색
+        "psgNum": 1,
+        "trnGpCd": 109,
+        # train type (05: 전체, 17: SRT)
+        "stlbTrnClsfCd": "05",
+        # departure date
+        "dptDt": date,
+        # departure time
+        "dptTm": time,
+        # arrival station code
+        "arvRsStnCd": arr_code,
+        # departure station code
+        "dptRsStnCd": dep_code,
+        "netfunnelKey": netfunnelKey,
+    }
+
+
+def _next_page_time(trains: list[SRTTrain]) -> str:
+    """다음 페이지 조회에 사용할 출발 시각 (마지막 열차 출발 시각 + 1초)"""
+    last_dep_time = datetime.strptime(trains[-1].dep_time, "%H%M%S")
+    next_dep_time = last_dep_time + timedelta(seconds=1)
+    return next_dep_time.strftime("%H%M%S")
+
+
+def _time_slices(start: str, end: str, slices: int) -> list[tuple[str, str]]:
+    """``start`` ~ ``end`` (hhmmss) 구간을 ``slices`` 개의 연속된 구간으로 나눕니다."""
+
+    def to_seconds(t: str) -> int:
+        return int(t[0:2]) * 3600 + int(t[2:4]) * 60 + int(t[4:6])
+
+    def to_time(seconds: int) -> str:
+        return f"{seconds // 3600:02d}{seconds // 60 % 60:02d}{seconds % 60:02d}"
+
+    begin, finish = to_seconds(start), to_seconds(end)
+    if finish <= begin:
+        return [(start, end)]
+
+    slices = max(1, min(slices, finish - begin))
+    step = (finish - begin) / slices
+    points = [begin + round(step * i) for i in range(slices)] + [finish]
+
+    return [
+        (to_time(points[i] if i == 0 else points[i] + 1), to_time(points[i + 1]))
+        for i in range(slices)
+    ]
+
+
+def _merge_train_pages(pages: list[list[SRTTrain]]) -> list[SRTTrain]:
+    """구간별 조회 결과를 합치고 (열차 번호, 출발 시각)이 같은 열차는 하나만 남깁니다."""
+    seen: set[tuple[str, str]] = set()
+    merged = []
+    for page in pages:
+        for train in page:
+            key = (train.train_number, train.dep_time)
+            if key in seen:
+                continue
+            seen.add(key)
+            merged.append(train)
+
+    merged.sort(key=lambda t: t.dep_time)
+    return merged
+
+
+def _filter_trains(
+    trains: list[SRTTrain], available_only: bool, time_limit: str | None
+) -> list[SRTTrain]:
+    # Filter SRT only, drop KTX, ITX, ...
+    trains = list(filter(lambda t: t.train_name == "SRT", trains))
+
+    if available_only:
+        trains = list(filter(lambda t: t.seat_available(), trains))
+
+    if time_limit:
+        trains = list(filter(lambda t: t.dep_time <= time_limit, trains))
+
+    return trains
+
+
+def _validate_reserve_train(train: SRTTrain) -> None:
+    if not isinstance(train, SRTTrain):
+        raise TypeError('"train" parameter must be a SRTTrain instance')
+
+    if train.train_name != "SRT":
+        raise ValueError(f'"SRT" expected for a train name, {train.train_name} given')
+
+
+def _is_special_seat(train: SRTTrain, special_seat: SeatType) -> bool | None:
+    # 일반식 / 특실 좌석 선택 옵션에 따라 결정.
+    is_special_seat = None
+    if special_seat == SeatType.GENERAL_ONLY:  # 일반실만
+        is_special_seat = False
+    elif special_seat == SeatType.SPECIAL_ONLY:  # 특실만
+        is_special_seat = True
+    elif special_seat == SeatType.GENERAL_FIRST:  # 일반실 우선
+        if train.general_seat_available():
+            is_special_seat = False
+        else:
+            is_special_seat = True
+    elif special_seat == SeatType.SPECIAL_FIRST:  # 특실 우선
+        if train.special_seat_available():
+            is_special_seat = True
+        else:
+            is_special_seat = False
+    return is_special_seat
+
+
+def _reserve_data(
+    jobid: str,
+    train: SRTTrain,
+    passengers: list[Passenger],
+    is_special_seat: bool | None,
+    mblPhone: str | None,
+    window_seat: bool | None,
+    netfunnelKey: str,
+) -> dict:
+    data = {
+        "jobId": jobid,
+        "jrnyCnt": "1",
+        "jrnyTpCd": "11",
+        "jrnySqno1": "001",
+        "stndFlg": "N",
+        "trnGpCd1": "300",  # 열차그룹코드 (좌석선택은 SRT만 가능하기때문에 무조건 300을 셋팅한다)"
+        "trnGpCd": "109",  # 열차그룹코드
+        "grpDv": "0",  # 단체 구분 (1: 단체)
+        "rtnDv": "0",  # 편도 구분 (0: 편도, 1: 왕복)
+        "stlbTrnClsfCd1": train.train_code,  # 역무열차종별코드1 (열차 목록 값)
+        "dptRsStnCd1": train.dep_station_code,  # 출발역코드1 (열차 목록 값)
+        "dptRsStnCdNm1": train.dep_station_name,  # 출발역이름1 (열차 목록 값)
+        "arvRsStnCd1": train.arr_station_code,  # 도착역코드1 (열차 목록 값)
+        "arvRsStnCdNm1": train.arr_station_name,  # 도착역이름1 (열차 목록 값)
+        "dptDt1": train.dep_date,  # 출발일자1 (열차 목록 값)
+        "dptTm1": train.dep_time,  # 출발일자1 (열차 목록 값)
+        "arvTm1": train.arr_time,  # 도착일자1 (열차 목록 값)
+        "trnNo1": "%05d" % int(train.train_number),  # 열차번호1 (열차 목록 값)
+        "runDt1": train.dep_date,  # 운행일자1 (열차 목록 값)
+        "dptStnConsOrdr1": train.dep_station_constitution_order,  # 출발역구성순서1 (열차 목록 값)
+        "arvStnConsOrdr1": train.arr_station_constitution_order,  # 도착역구성순서1 (열차 목록 값)
+        "dptStnRunOrdr1": train.dep_station_run_order,  # 출발역운행순서1 (열차 목록 값)
+        "arvStnRunOrdr1": train.arr_station_run_order,  # 도착역운행순서1 (열차 목록 값)
+        "mblPhone": mblPhone,
+        "netfunnelKey": netfunnelKey,
+    }
+
+    # jobid가 RESERVE_JOBID["PERSONAL"]일 경우, data에 reserveType 추가
+    if jobid == RESERVE_JOBID["PERSONAL"]:
+        data.update(
+            {
+                "reserveType": "11",
+            }
+        )
+
+    data.update(
+        Passenger.get_passenger_dict(
+            passengers, special_seat=is_special_seat, window_seat=window_seat
+        )
+    )
+
+    return data
+
+
+def _reservations_from_response(
+    parser: SRTResponseData, paid_only: bool
+) -> list[tuple[dict, dict]]:
+    """예약 내역 응답에서 (train, pay) 쌍을 추출합니다."""
+    train_data = parser.train_list()
+    pay_data = parser.pay_list()
+    pairs = []
+    for train, pay in zip(train_data, pay_data):
+        if (
+            paid_only and pay["stlFlg"] == "N"
+        ):  # paid_only가 참이면 결제된 예약내역만 보여줌
+            continue
+        pairs.append((train, pay))
+    return pairs
+
+
+def _reservation_from_result(
+    result: dict,
+    train: SRTTrain,
+    passengers: list[Passenger],
+    ticket_loader=None,
+) -> SRTReservation:
+    """예약 응답(reservListMap)과 예약한 열차 정보만으로 예약 내역을 만듭니다.
+
+    결제 금액과 구입 기한은 응답에 포함된 경우에만 채워지므로,
+    결제에는 :func:`SRT.get_reservations` 로 조회한 예약 내역을 사용하세요.
+    """
+    train_data = {
+        "pnrNo": result["pnrNo"],
+        "rcvdAmt": result.get("rcvdAmt", ""),
+        "tkSpecNum": result.get("tkSpecNum", Passenger.total_count(passengers)),
+    }
+    pay_data = {
+        "stlbTrnClsfCd": train.train_code,
+        "trnNo": train.train_number,
+        "dptDt": train.dep_date,
+        "dptTm": train.dep_time,
+        "dptRsStnCd": train.dep_station_code,
+        "arvTm": train.arr_time,
+        "arvRsStnCd": train.arr_station_code,
+        "iseLmtDt": result.get("iseLmtDt", ""),
+        "iseLmtTm": result.get("iseLmtTm", ""),
+        "stlFlg": "N",
+    }
+    return SRTReservation(train_data, pay_data, ticket_loader=ticket_loader)
+
+
+def _payment_data(
+    reservation: SRTReservation,
+    membership_number: str,
+    number: str,
+    password: str,
+    validation_number: str,
+    expire_date: str,
+    installment: int,
+    card_type: str,
+) -> dict:
+    return {
+        "stlDmnDt": datetime.now().strftime("%Y%m%d"),  # 날짜 (yyyyMMdd)
+        "mbCrdNo": membership_number,  # 회원번호
+        "stlMnsSqno1": "1",  # 결제수단 일련번호1 (1고정값인듯)
+        "ststlGridcnt": "1",  # 결제수단건수 (1고정값인듯)
+        "totNewStlAmt": reservation.total_cost,  # 총 신규 결제금액
+        "athnDvCd1": card_type,  # 카드타입 (J : 개인, S : 법인)
+        "vanPwd1": password,  # 카드비밀번호 앞 2자리
+        "crdVlidTrm1": expire_date,  # 카드유효기간(YYMM)
+        "stlMnsCd1": "02",  # 결제수단코드1: (02:신용카드, 11:전자지갑, 12:포인트)
+        "rsvChgTno": "0",  # 예약변경번호 (0 고정값인듯)
+        "chgMcs": "0",  # 변경마이크로초 (0고정값인듯)
+        "ismtMnthNum1": installment,  # 할부선택 (0, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 24)
+        "ctlDvCd": "3102",  # 조정구분코드(3102 고정값인듯)
+        "cgPsId": "korail",  # korail 고정
+        "pnrNo": reservation.reservation_number,  # 예약번호
+        "totPrnb": reservation.seat_count,  # 승차인원
+        "mnsStlAmt1": reservation.total_cost,  # 결제금액1
+        "crdInpWayCd1": "@",  # 카드입력방식코드 (@: 신용카드/ok포인트, "": 전자지갑)
+        "athnVal1": validation_number,  # 생년월일/사업자번호
+        "stlCrCrdNo1": number,  # 결제신용카드번호1
+        "jrnyCnt": "1",  # 여정수(1 고정)
+        "strJobId": "3102",  # 업무구분코드(3102 고정값인듯)
+        "inrecmnsGridcnt": "1",  # 1 고정값인듯
+        "dptTm": reservation.dep_time,  # 출발시간
+        "arvTm": reservation.arr_time,  # 도착시간
+        "dptStnConsOrdr2": "000000",  # 출발역구성순서2 (000000 고정)
+        "arvStnConsOrdr2": "000000",  # 도착역구성순서2 (000000 고정)
+        "trnGpCd": "300",  # 열차그룹코드(300 고정)
+        "pageNo": "-",  # 페이지번호(- 고정)
+        "rowCnt": "-",  # 한페이지당건수(- 고정)
+        "pageUrl": "",  # 페이지URL (빈값 고정)
+    }
+
+
+def _check_payment_response(text: str) -> None:
+    parser = json.loads(text)
+
+    if parser.get("outDataSets").get("dsOutput0")[0].get("strResult") == RESULT_FAIL:
+        raise SRTResponseError(
+            parser.get("outDataSets").get("dsOutput0")[0].get("msgTxt")
+        )
+
 
 class SRT:
     """SRT 클라이언트 클래스
@@ -40,6 +395,8 @@ class SRT:
         auto_login (bool): :func:`login` 함수 호출 여부
         verbose (bool): 디버깅용 로그 출력 여부
         netfunnel_helper (NetFunnelHelper, optional): netfunnel 키 를 관리합니다. 자세한 사항은 `advanced.md`의 '여러 SRT 간, netFunnelKey 공유하기'를 참고하세요
+        search_cache (SearchCache, optional): 열차 검색 결과 캐시, 여러 SRT 간에 공유하면 같은 조건의 검색을 한 번만 요청합니다
+        transport (TransportConfig, optional): 커넥션 풀, 타임아웃, 워밍업 설정. 직접 만든 netfunnel_helper에는 적용되지 않습니다
 
     >>> srt = SRT("1234567890", YOUR_PASSWORD) # with membership number
     >>> srt = SRT("def6488@gmail.com", YOUR_PASSWORD) # with email
@@ -53,19 +410,30 @@ class SRT:
         auto_login: bool = True,
         verbose: bool = False,
         netfunnel_helper: NetFunnelHelper | None = None,
+        search_cache: SearchCache | None = None,
+        transport: TransportConfig | None = None,
     ) -> None:
-        self._session = requests.session()
-        self._session.headers.update(DEFAULT_HEADERS)
+        self.transport = transport if transport is not None else DEFAULT_TRANSPORT
+        self._session = self.transport.create_session(DEFAULT_HEADERS)
         self.netfunnel_helper = (
-            netfunnel_helper if netfunnel_helper is not None else NetFunnelHelper()
+            netfunnel_helper
+            if netfunnel_helper is not None
+            else NetFunnelHelper(transport=self.transport)
         )
 
+        self.search_cache = search_cache
+
         self.srt_id: str = srt_id
         self.srt_pw: str = srt_pw
         self.verbose: bool = verbose
 
         self.is_login: bool = False
 
+        if self.transport.warmup:
+            self.transport.warmup_session(
+                self._session, [constants.SRT_MOBILE], background=True
+            )
+
         if auto_login:
             self.login(srt_id, srt_pw)
 
@@ -73,6 +441,24 @@ class SRT:
         if self.verbose:
             print("[*] " + msg)
 
+    def _raise_for_failure(self, parser: SRTResponseData) -> NoReturn:
+        """실패 응답의 예외를 던집니다. 세션이 만료된 경우 로그인 상태를 해제합니다."""
+        error = _response_error(parser)
+        if isinstance(error, SRTNotLoggedInError):
+            self.is_login = False
+        raise error
+
+    def warmup(self) -> int:
+        """SRT 서버와 NetFunnel 서버에 미리 연결을 열어둡니다.
+
+        예매 시작 직전에 호출하면 첫 요청에서 TCP/TLS 연결을 맺는 시간을 줄일 수 있습니다.
+
+        Returns:
+            int: 연결에 성공한 수
+        """
+        opened = self.transport.warmup_session(self._session, [constants.SRT_MOBILE])
+        return opened + self.netfunnel_helper.warmup()
+
     def login(self, srt_id: str | None = None, srt_pw: str | None = None):
         """SRT 서버에 로그인합니다.
 
@@ -96,49 +482,19 @@ class SRT:
         else:
             self.srt_pw = srt_pw
 
-        LOGIN_TYPES: dict[str, str] = {
-            "MEMBERSHIP_ID": "1",
-            "EMAIL": "2",
-            "PHONE_NUMBER": "3",
-        }
-
-        if EMAIL_REGEX.match(srt_id):
-            login_type = LOGIN_TYPES["EMAIL"]
-        elif PHONE_NUMBER_REGEX.match(srt_id):
-            login_type = LOGIN_TYPES["PHONE_NUMBER"]
-            srt_id = re.sub("-", "", srt_id)  # hyphen is not sent
-        else:
-            login_type = LOGIN_TYPES["MEMBERSHIP_ID"]
-
         url = constants.API_ENDPOINTS["login"]
-        data: dict[str, str] = {
-            "auto": "Y",
-            "check": "Y",
-            "page": "menu",
-            "deviceKey": "-",
-            "customerYn": "",
-            "login_referer": constants.API_ENDPOINTS["main"],
-            "srchDvCd": login_type,
-            "srchDvNm": srt_id,
-            "hmpgPwdCphd": srt_pw,
-        }
+        data = _login_data(srt_id, srt_pw)
 
         r = self._session.post(url=url, data=data)
         self._log(r.text)
-        if "존재하지않는 회원입니다" in r.text:
-            self.is_login = False
-            raise SRTLoginError(r.json()["MSG"])
-
-        if "비밀번호 오류" in r.text:
-            self.is_login = False
-            raise SRTLoginError(r.json()["MSG"])
-
-        if "Your IP Address Blocked due to abnormal access." in r.text:
+        try:
+            membership_number = _parse_login_response(r.text)
+        except SRTLoginError:
             self.is_login = False
-            raise SRTLoginError(r.text.strip())
+            raise
 
         self.is_login = True
-        self.membership_number = json.loads(r.text).get("userMap").get("MB_CRD_NO")
+        self.membership_number = membership_number
 
         return True
 
@@ -169,9 +525,19 @@ class SRT:
         time: str | None = None,
         time_limit: str | None = None,
         available_only: bool = True,
+        parallel_slices: int = 1,
+        max_workers: int | None = None,
     ) -> list[SRTTrain]:
         """주어진 출발지에서 도착지로 향하는 SRT 열차를 검색합니다.
 
+        ``search_cache`` 가 설정되어 있으면 같은 조건의 검색 결과를 캐시에서 가져옵니다.
+
+        ``parallel_slices`` 가 2 이상이면 조회 구간(``time`` ~ ``time_limit``, 기본값은 하루 전체)을
+        그 수만큼 나누어 동시에 조회합니다. 페이지를 하나씩 이어서 요청하는 대신 구간별로
+        요청하므로, 하루 전체 조회 시간이 대략 가장 느린 구간의 조회 시간으로 줄어듭니다.
+
+        >>> srt.search_train("수서", "부산", "20240101", parallel_slices=6)
+
         Args:
             dep (str): 출발역
             arr (str): 도착역
@@ -179,6 +545,8 @@ class SRT:
             time (str, optional): 출발 시각 (hhmmss) (default: 0시 0분 0초)
             time_limit (str, optional): 출발 시각 조회 한도 (hhmmss)
             available_only (bool, optional): 매진되지 않은 열차만 검색합니다 (default: True)
+            parallel_slices (int, optional): 조회 구간을 나눌 개수 (default: 1, 순차 조회)
+            max_workers (int, optional): 동시에 요청할 최대 개수 (default: ``parallel_slices``)
 
         Returns:
             list[:class:`SRTTrain`]: 열차 리스트
@@ -197,20 +565,86 @@ class SRT:
         if time is None:
             time = "000000"
 
-        trains = self._search_train(
-            dep=dep,
-            arr=arr,
+        def search() -> list[SRTTrain]:
+            if parallel_slices > 1:
+                return self._search_train_sliced(
+                    date=date,
+                    time=time,
+                    time_limit=time_limit,
+                    arr_code=arr_code,
+                    dep_code=dep_code,
+                    available_only=available_only,
+                    slices=parallel_slices,
+                    max_workers=max_workers,
+                )
+
+            return self._search_train(
+                dep=dep,
+                arr=arr,
+                date=date,
+                time=time,
+                time_limit=time_limit,
+                arr_code=arr_code,
+                dep_code=dep_code,
+                available_only=available_only,
+                use_netfunnel_cache=True,
+            )
+
+        if self.search_cache is None:
+            return search()
+
+        key = ("SRT", dep_code, arr_code, date, time, time_limit, available_only)
+        # 캐시된 리스트를 호출자가 수정하지 않도록 복사해서 반환
+        return list(self.search_cache.get_or_load(key, search))
+
+    def iter_trains(
+        self,
+        dep: str,
+        arr: str,
+        date: str | None = None,
+        time: str | None = None,
+        time_limit: str | None = None,
+        available_only: bool = True,
+    ) -> Iterator[SRTTrain]:
+        """:func:`search_train` 과 같은 조건으로 열차를 검색해 응답 페이지가 도착하는 대로 하나씩 반환합니다.
+
+        페이지마다 SRT 열차, ``available_only``, ``time_limit`` 조건을 바로 적용합니다.
+        다음 페이지는 앞 페이지의 열차를 모두 꺼낸 뒤에 요청하므로, 반복을 멈추면 나머지
+        페이지는 요청하지 않습니다. 검색 캐시는 사용하지 않습니다.
+
+        >>> train = next(srt.iter_trains("수서", "부산", "20240101", "080000"), None)
+
+        Args:
+            dep (str): 출발역
+            arr (str): 도착역
+            date (str, optional): 출발 날짜 (yyyyMMdd) (default: 당일)
+            time (str, optional): 출발 시각 (hhmmss) (default: 0시 0분 0초)
+            time_limit (str, optional): 출발 시각 조회 한도 (hhmmss)
+            available_only (bool, optional): 매진되지 않은 열차만 검색합니다 (default: True)
+
+        Returns:
+            Iterator[:class:`SRTTrain`]: 출발 시각 순의 열차
+        """
+
+        if dep not in STATION_CODE:
+            raise ValueError(f'Station "{dep}" not exists')
+        if arr not in STATION_CODE:
+            raise ValueError(f'Station "{arr}" not exists')
+
+        if date is None:
+            date = datetime.now().strftime("%Y%m%d")
+        if time is None:
+            time = "000000"
+
+        return self._iter_trains(
             date=date,
             time=time,
             time_limit=time_limit,
-            arr_code=arr_code,
-            dep_code=dep_code,
+            dep_code=STATION_CODE[dep],
+            arr_code=STATION_CODE[arr],
             available_only=available_only,
-            use_netfunnel_cache=True,
         )
 
-        return trains
-
     def _search_train(
         self,
         dep: str,
@@ -240,98 +674,160 @@ class SRT:
             list[:class:`SRTTrain`]: 열차 리스트
         """
 
+        return list(
+            self._iter_trains(
+                date=date,
+                time=time,
+                time_limit=time_limit,
+                dep_code=dep_code,
+                arr_code=arr_code,
+                available_only=available_only,
+                use_netfunnel_cache=use_netfunnel_cache,
+            )
+        )
+
+    def _iter_trains(
+        self,
+        date: str,
+        time: str,
+        time_limit: str | None,
+        dep_code: str,
+        arr_code: str,
+        available_only: bool,
+        use_netfunnel_cache: bool = True,
+    ) -> Iterator[SRTTrain]:
+        """netfunnel_key를 발급받아 열차를 한 페이지씩 검색하는 내부 제너레이터입니다.
+
+        다음 페이지는 이전 페이지의 열차를 모두 반환한 뒤에 요청합니다.
+        """
+
         netfunnelKey = self.netfunnel_helper.generate_netfunnel_key(use_netfunnel_cache)
 
         url = constants.API_ENDPOINTS["search_schedule"]
-        data = {
-            # course (1: 직통, 2: 환승, 3: 왕복)
-            # TODO: support 환승, 왕복
-            "chtnDvCd": "1",
-            "arriveTime": "N",
-            "seatAttCd": "015",
-            # 검색 시에는 1명 기준으로 검색
-            "psgNum": 1,
-            "trnGpCd": 109,
-            # train type (05: 전체, 17: SRT)
-            "stlbTrnClsfCd": "05",
-            # departure date
-            "dptDt": date,
-            # departure time
-            "dptTm": time,
-            # arrival station code
-            "arvRsStnCd": arr_code,
-            # departure station code
-            "dptRsStnCd": dep_code,
-            "netfunnelKey": netfunnelKey,
-        }
+        data = _search_data(date, time, dep_code, arr_code, netfunnelKey)
 
         r = self._session.post(url=url, data=data)
-        try:
-            parser = SRTResponseData(r.text)
-        except Exception as e:
-            raise SRTResponseError(
-                f"Failed to decode: invalid response ({r.text})"
-            ) from e
+        parser = _parse_response(r.text)
 
         if not parser.success():
             message_code = parser.message_code()
             if message_code == INVALID_NETFUNNEL_KEY and use_netfunnel_cache:
                 self._log(f"Invalid netfunnel key: {netfunnelKey}, regenerating...")
 
-                return self._search_train(
-                    dep=dep,
-                    arr=arr,
+                yield from self._iter_trains(
                     date=date,
                     time=time,
                     time_limit=time_limit,
-                    arr_code=arr_code,
                     dep_code=dep_code,
+                    arr_code=arr_code,
                     available_only=available_only,
                     use_netfunnel_cache=False,
                 )
+                return
             else:
                 message = parser.message()
                 raise SRTResponseError(message, message_code)
 
         self._log(parser.message())
-        all_trains = parser.get_all()["outDataSets"]["dsOutput1"]
-        trains = [SRTTrain(train) for train in all_trains]
 
         # Note: updated api returns subarray of all trains,
         #       therefore, to retrieve all trains, retry unless there are no more trains
-        while trains:
-            # Break if the last train's departure time is over the time_limit
-            if time_limit and trains[-1].dep_time > time_limit:
-                break
-
-            last_dep_time = datetime.strptime(trains[-1].dep_time, "%H%M%S")
-            next_dep_time = last_dep_time + timedelta(seconds=1)
-            data["dptTm"] = next_dep_time.strftime("%H%M%S")
+        while True:
+            page = [SRTTrain(train) for train in parser.out_data()]
+            yield from _filter_trains(page, available_only, time_limit)
+
+            # Break if the last train's departure time reaches the time_limit,
+            # the next page would start after it
+            if not page or (time_limit and page[-1].dep_time >= time_limit):
+                return
+
+            data["dptTm"] = _next_page_time(page)
             r = self._session.post(url=url, data=data)
-            try:
-                parser = SRTResponseData(r.text)
-            except Exception as e:
-                raise SRTResponseError(
-                    f"Failed to decode: invalid response ({r.text})"
-                ) from e
+            parser = _parse_response(r.text)
 
             # When there is no more train, return code will be FAIL
             if not parser.success():
-                break
+                return
+
+    def _search_train_sliced(
+        self,
+        date: str,
+        time: str,
+        time_limit: str | None,
+        arr_code: str,
+        dep_code: str,
+        available_only: bool,
+        slices: int,
+        max_workers: int | None = None,
+        use_netfunnel_cache: bool = True,
+    ) -> list[SRTTrain]:
+        """조회 구간을 나누어 동시에 열차를 검색하는 내부 함수입니다.
 
-            _all_trains = parser.get_all()["outDataSets"]["dsOutput1"]
-            trains.extend([SRTTrain(train) for train in _all_trains])
+        각 구간은 구간 시작 시각부터 페이지를 이어서 요청하다가 마지막 열차가 구간을 넘어서면
+        멈춥니다. 구간 경계에서 겹치는 열차는 (열차 번호, 출발 시각) 기준으로 한 번만 남깁니다.
 
-        # Filter SRT only, drop KTX, ITX, ...
-        trains = list(filter(lambda t: t.train_name == "SRT", trains))
+        Returns:
+            list[:class:`SRTTrain`]: 출발 시각 순으로 정렬된 열차 리스트
+        """
+
+        netfunnelKey = self.netfunnel_helper.generate_netfunnel_key(use_netfunnel_cache)
+
+        url = constants.API_ENDPOINTS["search_schedule"]
+        bounds = _time_slices(time, time_limit or "235959", slices)
+
+        def fetch_slice(index: int) -> list[SRTTrain]:
+            start, end = bounds[index]
+            data = _search_data(date, start, dep_code, arr_code, netfunnelKey)
+            trains: list[SRTTrain] = []
+            while True:
+                r = self._session.post(url=url, data=data)
+                parser = _parse_response(r.text)
+
+                if not parser.success():
+                    # 첫 구간이 비어 있으면 순차 조회와 같이 오류로 처리하고,
+                    # 나머지 구간은 더 이상 열차가 없는 것으로 봅니다.
+                    message_code = parser.message_code()
+                    if not trains and (
+                        index == 0 or message_code == INVALID_NETFUNNEL_KEY
+                    ):
+                        raise _SliceSearchError(parser.message(), message_code)
+                    return trains
+
+                page = [
+                    SRTTrain(train)
+                    for train in parser.out_data()
+                ]
+                trains.extend(page)
+
+                if not page or trains[-1].dep_time > end:
+                    return trains
+
+                data["dptTm"] = _next_page_time(trains)
+
+        workers = max_workers or slices
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                pages = list(executor.map(fetch_slice, range(len(bounds))))
+        except _SliceSearchError as e:
+            if e.message_code == INVALID_NETFUNNEL_KEY and use_netfunnel_cache:
+                self._log(f"Invalid netfunnel key: {netfunnelKey}, regenerating...")
 
-        if available_only:
-            trains = list(filter(lambda t: t.seat_available(), trains))
+                return self._search_train_sliced(
+                    date=date,
+                    time=time,
+                    time_limit=time_limit,
+                    arr_code=arr_code,
+                    dep_code=dep_code,
+                    available_only=available_only,
+                    slices=slices,
+                    max_workers=max_workers,
+                    use_netfunnel_cache=False,
+                )
+            raise SRTResponseError(e.msg, e.message_code) from e
 
-        if time_limit:
-            trains = list(filter(lambda t: t.dep_time <= time_limit, trains))
+        trains = _merge_train_pages(pages)
 
-        return trains
+        return _filter_trains(trains, available_only, time_limit)
 
     def reserve(
         self,
@@ -339,6 +835,7 @@ class SRT:
         passengers: list[Passenger] | None = None,
         special_seat: SeatType = SeatType.GENERAL_FIRST,
         window_seat: bool | None = None,
+        fetch_details: bool = True,
     ) -> SRTReservation:
         """열차를 예약합니다.
 
@@ -350,6 +847,8 @@ class SRT:
             passengers (list[:class:`Passenger`], optional): 예약 인원 (default: 어른 1명)
             special_seat (:class:`SeatType`): 일반실/특실 선택 유형 (default: 일반실 우선)
             window_seat (bool, optional): 창가 자리 우선 예약 여부
+            fetch_details (bool, optional): 예약 성공 후 예약 내역을 조회할지 여부,
+                False이면 서버가 예약 성공을 응답하는 즉시 예약 응답만으로 만든 내역을 반환합니다 (default: True)
 
         Returns:
             :class:`SRTReservation`: 예약 내역
@@ -362,6 +861,7 @@ class SRT:
             special_seat,
             window_seat=window_seat,
             use_netfunnel_cache=True,
+            fetch_details=fetch_details,
         )
 
     def reserve_standby(
@@ -370,6 +870,7 @@ class SRT:
         passengers: list[Passenger] | None = None,
         special_seat: SeatType = SeatType.GENERAL_FIRST,
         mblPhone: str | None = None,
+        fetch_details: bool = True,
     ) -> SRTReservation:
         """예약대기 신청 합니다.
 
@@ -381,13 +882,19 @@ class SRT:
             passengers (list[:class:`Passenger`], optional): 예약 인원 (default: 어른 1명)
             special_seat (:class:`SeatType`): 일반실/특실 선택 유형 (default: 일반실 우선)
             mblPhone (str, optional): 휴대폰 번호
+            fetch_details (bool, optional): 예약 성공 후 예약 내역을 조회할지 여부 (default: True)
 
         Returns:
             :class:`SRTReservation`: 예약 내역
         """
 
         return self._reserve(
-            RESERVE_JOBID["STANDBY"], train, passengers, special_seat, mblPhone=mblPhone
+            RESERVE_JOBID["STANDBY"],
+            train,
+            passengers,
+            special_seat,
+            mblPhone=mblPhone,
+            fetch_details=fetch_details,
         )
 
     def _reserve(
@@ -399,6 +906,7 @@ class SRT:
         mblPhone: str | None = None,
         window_seat: bool | None = None,
         use_netfunnel_cache: bool = True,
+        fetch_details: bool = True,
     ) -> SRTReservation:
         """예약 신청 요청 공통 함수
 
@@ -409,6 +917,7 @@ class SRT:
             mblPhone (str, optional): 휴대폰 번호 | jobid가 RESERVE_JOBID["STANDBY"]일 경우에만 사용
             window_seat (bool, optional): 창가 자리 우선 예약 여부 | jobid가 RESERVE_JOBID["PERSONAL"]일 경우에만 사용
             use_netfunnel_cache (bool, optional): netfunnel 캐시 사용 여부, 사용하지 않으면 요청 시마다 새로 netfunnel 키를 요청합니다 (default: True)
+            fetch_details (bool, optional): 예약 성공 후 예약 내역을 조회할지 여부 (default: True)
 
         Returns:
             :class:`SRTReservation`: 예약 내역
@@ -416,102 +925,69 @@ class SRT:
         if not self.is_login:
             raise SRTNotLoggedInError()
 
-        if not isinstance(train, SRTTrain):
-            raise TypeError('"train" parameter must be a SRTTrain instance')
-
-        if train.train_name != "SRT":
-            raise ValueError(
-                f'"SRT" expected for a train name, {train.train_name} given'
-            )
-
-        if passengers is None:
-            passengers = [Adult()]
-        passengers = Passenger.combine(passengers)
-
-        # 일반식 / 특실 좌석 선택 옵션에 따라 결정.
-        is_special_seat = None
-        if special_seat == SeatType.GENERAL_ONLY:  # 일반실만
-            is_special_seat = False
-        elif special_seat == SeatType.SPECIAL_ONLY:  # 특실만
-            is_special_seat = True
-        elif special_seat == SeatType.GENERAL_FIRST:  # 일반실 우선
-            if train.general_seat_available():
-                is_special_seat = False
-            else:
-                is_special_seat = True
-        elif special_seat == SeatType.SPECIAL_FIRST:  # 특실 우선
-            if train.special_seat_available():
-                is_special_seat = True
-            else:
-                is_special_seat = False
-
-        netfunnelKey = self.netfunnel_helper.generate_netfunnel_key(use_netfunnel_cache)
-
-        url = constants.API_ENDPOINTS["reserve"]
-        data = {
-            "jobId": jobid,
-            "jrnyCnt": "1",
-            "jrnyTpCd": "11",
-            "jrnySqno1": "001",
-            "stndFlg": "N",
-            "trnGpCd1": "300",  # 열차그룹코드 (좌석선택은 SRT만 가능하기때문에 무조건 300을 셋팅한다)"
-            "trnGpCd": "109",  # 열차그룹코드
-            "grpDv": "0",  # 단체 구분 (1: 단체)
-            "rtnDv": "0",  # 편도 구분 (0: 편도, 1: 왕복)
-            "stlbTrnClsfCd1": train.train_code,  # 역무열차종별코드1 (열차 목록 값)
-            "dptRsStnCd1": train.dep_station_code,  # 출발역코드1 (열차 목록 값)
-            "dptRsStnCdNm1": train.dep_station_name,  # 출발역이름1 (열차 목록 값)
-            "arvRsStnCd1": train.arr_station_code,  # 도착역코드1 (열차 목록 값)
-            "arvRsStnCdNm1": train.arr_station_name,  # 도착역이름1 (열차 목록 값)
-            "dptDt1": train.dep_date,  # 출발일자1 (열차 목록 값)
-            "dptTm1": train.dep_time,  # 출발일자1 (열차 목록 값)
-            "arvTm1": train.arr_time,  # 도착일자1 (열차 목록 값)
-            "trnNo1": "%05d" % int(train.train_number),  # 열차번호1 (열차 목록 값)
-            "runDt1": train.dep_date,  # 운행일자1 (열차 목록 값)
-            "dptStnConsOrdr1": train.dep_station_constitution_order,  # 출발역구성순서1 (열차 목록 값)
-            "arvStnConsOrdr1": train.arr_station_constitution_order,  # 도착역구성순서1 (열차 목록 값)
-            "dptStnRunOrdr1": train.dep_station_run_order,  # 출발역운행순서1 (열차 목록 값)
-            "arvStnRunOrdr1": train.arr_station_run_order,  # 도착역운행순서1 (열차 목록 값)
-            "mblPhone": mblPhone,
-            "netfunnelKey": netfunnelKey,
-        }
-
-        # jobid가 RESERVE_JOBID["PERSONAL"]일 경우, data에 reserveType 추가
-        if jobid == RESERVE_JOBID["PERSONAL"]:
-            data.update(
-                {
-                    "reserveType": "11",
-                }
-            )
-
-        data.update(
-            Passenger.get_passenger_dict(
-                passengers, special_seat=is_special_seat, window_seat=window_seat
-            )
-        )
-
-        r = self._session.post(url=url, data=data)
-        try:
-            parser = SRTResponseData(r.text)
-        except Exception as e:
-            raise SRTResponseError(
-                f"Failed to decode: invalid response ({r.text})"
-            ) from e
+        _validate_reserve_train(train)
+
+        with trace(
+            self.transport.tracer,
+            "srt.reserve",
+            jobid=jobid,
+            train_number=train.train_number,
+            dep=f"{train.dep_date}{train.dep_time}",
+        ) as root:
+            with span("passengers.combine"):
+                if passengers is None:
+                    passengers = [Adult()]
+                passengers = Passenger.combine(passengers)
+
+            is_special_seat = _is_special_seat(train, special_seat)
+
+            with span("netfunnel"):
+                netfunnelKey = self.netfunnel_helper.generate_netfunnel_key(use_netfunnel_cache)
+
+            url = constants.API_ENDPOINTS["reserve"]
+            with span("reserve.form"):
+                data = _reserve_data(
+                    jobid,
+                    train,
+                    passengers,
+                    is_special_seat,
+                    mblPhone,
+                    window_seat,
+                    netfunnelKey,
+                )
 
-        if not parser.success():
-            raise SRTResponseError(parser.message())
+            with span("reserve.post"):
+                r = self._session.post(url=url, data=data)
+            with span("reserve.decode"):
+                parser = _parse_response(r.text)
 
-        self._log(parser.message())
-        reservation_result = parser.get_all()["reservListMap"][0]
+            if not parser.success():
+                self._raise_for_failure(parser)
+
+            self._log(parser.message())
+            reservation_result = parser.reserv_list()[0]
+            pnr_no = reservation_result["pnrNo"]
+            if root is not None:
+                root.set(pnr_no=pnr_no)
+
+            if not fetch_details:
+                return _reservation_from_result(
+                    reservation_result,
+                    train,
+                    passengers,
+                    ticket_loader=partial(self.ticket_info, pnr_no),
+                )
 
-        # find corresponding ticket and return it
-        tickets = self.get_reservations()
-        for ticket in tickets:
-            if ticket.reservation_number == reservation_result["pnrNo"]:
-                return ticket
+            # find corresponding reservation and return it,
+            # tickets are fetched only when accessed
+            with span("get_reservations"):
+                reservations = self.get_reservations(lazy_tickets=True)
+            for reservation in reservations:
+                if reservation.reservation_number == pnr_no:
+                    return reservation
 
-        # if ticket not found, it's an error
-        raise SRTError("Ticket not found: check reservation status")
+            # if ticket not found, it's an error
+            raise SRTError("Ticket not found: check reservation status")
 
     def reserve_standby_option_settings(
         self,
@@ -553,11 +1029,22 @@ class SRT:
 
         return r.status_code == 200
 
-    def get_reservations(self, paid_only: bool = False) -> list[SRTReservation]:
+    def get_reservations(
+        self,
+        paid_only: bool = False,
+        lazy_tickets: bool = False,
+        max_workers: int = TICKET_INFO_WORKERS,
+    ) -> list[SRTReservation]:
         """전체 예약 정보를 얻습니다.
 
+        각 예약의 티켓 정보는 최대 ``max_workers`` 개씩 동시에 조회합니다.
+        ``lazy_tickets`` 가 참이면 티켓 정보를 미리 조회하지 않고,
+        :attr:`SRTReservation.tickets` 에 처음 접근할 때 조회합니다.
+
         Args:
             paid_only (bool): 결제된 예약 내역만 가져올지 여부
+            lazy_tickets (bool): 티켓 정보를 접근할 때 조회할지 여부 (default: False)
+            max_workers (int): 티켓 정보를 동시에 조회할 최대 개수
 
         Returns:
             list[:class:`SRTReservation`]: 예약 리스트
@@ -569,31 +1056,51 @@ class SRT:
         data = {"pageNo": "0"}
 
         r = self._session.post(url=url, data=data)
-        try:
-            parser = SRTResponseData(r.text)
-        except Exception as e:
-            raise SRTResponseError(
-                f"Failed to decode: invalid response ({r.text})"
-            ) from e
+        parser = _parse_response(r.text)
 
         if not parser.success():
-            raise SRTResponseError(parser.message())
+            self._raise_for_failure(parser)
 
         self._log(parser.message())
 
-        train_data = parser.get_all()["trainListMap"]
-        pay_data = parser.get_all()["payListMap"]
-        reservations = []
-        for train, pay in zip(train_data, pay_data):
-            if (
-                paid_only and pay["stlFlg"] == "N"
-            ):  # paid_only가 참이면 결제된 예약내역만 보여줌
-                continue
-            ticket = self.ticket_info(train["pnrNo"])
-            reservation = SRTReservation(train, pay, ticket)
-            reservations.append(reservation)
+        pairs = _reservations_from_response(parser, paid_only)
+
+        if lazy_tickets:
+            return [
+                SRTReservation(
+                    train, pay, ticket_loader=partial(self.ticket_info, train["pnrNo"])
+                )
+                for train, pay in pairs
+            ]
+
+        tickets = self.ticket_infos(
+            [train["pnrNo"] for train, _ in pairs], max_workers=max_workers
+        )
+
+        return [
+            SRTReservation(train, pay, ticket)
+            for (train, pay), ticket in zip(pairs, tickets)
+        ]
+
+    def ticket_infos(
+        self,
+        reservations: list[SRTReservation | int],
+        max_workers: int = TICKET_INFO_WORKERS,
+    ) -> list[list[SRTTicket]]:
+        """여러 예약의 티켓 정보를 동시에 조회합니다.
+
+        Args:
+            reservations (list[:class:`SRTReservation` or int]): 예약 번호 리스트
+            max_workers (int): 동시에 조회할 최대 개수
+
+        Returns:
+            list[list[:class:`SRTTicket`]]: ``reservations`` 와 같은 순서의 티켓 리스트
+        """
+        if len(reservations) <= 1 or max_workers <= 1:
+            return [self.ticket_info(reservation) for reservation in reservations]
 
-        return reservations
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self.ticket_info, reservations))
 
     def ticket_info(self, reservation: SRTReservation | int) -> list[SRTTicket]:
         """예약에 포함된 티켓 정보를 반환합니다.
@@ -622,17 +1129,12 @@ class SRT:
         data = {"pnrNo": reservation, "jrnySqno": "1"}
 
         r = self._session.post(url=url, data=data)
-        try:
-            parser = SRTResponseData(r.text)
-        except Exception as e:
-            raise SRTResponseError(
-                f"Failed to decode: invalid response ({r.text})"
-            ) from e
+        parser = _parse_response(r.text)
 
         if not parser.success():
-            raise SRTResponseError(parser.message())
+            self._raise_for_failure(parser)
 
-        tickets = [SRTTicket(ticket) for ticket in parser.get_all()["trainListMap"]]
+        tickets = [SRTTicket(ticket) for ticket in parser.train_list()]
 
         return tickets
 
@@ -660,15 +1162,10 @@ class SRT:
         data = {"pnrNo": reservation, "jrnyCnt": "1", "rsvChgTno": "0"}
 
         r = self._session.post(url=url, data=data)
-        try:
-            parser = SRTResponseData(r.text)
-        except Exception as e:
-            raise SRTResponseError(
-                f"Failed to decode: invalid response ({r.text})"
-            ) from e
+        parser = _parse_response(r.text)
 
         if not parser.success():
-            raise SRTResponseError(parser.message())
+            self._raise_for_failure(parser)
 
         self._log(parser.message())
 
@@ -706,50 +1203,18 @@ class SRT:
 
         url = constants.API_ENDPOINTS["payment"]
 
-        data = {
-            "stlDmnDt": datetime.now().strftime("%Y%m%d"),  # 날짜 (yyyyMMdd)
-            "mbCrdNo": self.membership_number,  # 회원번호
-            "stlMnsSqno1": "1",  # 결제수단 일련번호1 (1고정값인듯)
-            "ststlGridcnt": "1",  # 결제수단건수 (1고정값인듯)
-            "totNewStlAmt": reservation.total_cost,  # 총 신규 결제금액
-            "athnDvCd1": card_type,  # 카드타입 (J : 개인, S : 법인)
-            "vanPwd1": password,  # 카드비밀번호 앞 2자리
-            "crdVlidTrm1": expire_date,  # 카드유효기간(YYMM)
-            "stlMnsCd1": "02",  # 결제수단코드1: (02:신용카드, 11:전자지갑, 12:포인트)
-            "rsvChgTno": "0",  # 예약변경번호 (0 고정값인듯)
-            "chgMcs": "0",  # 변경마이크로초 (0고정값인듯)
-            "ismtMnthNum1": installment,  # 할부선택 (0, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 24)
-            "ctlDvCd": "3102",  # 조정구분코드(3102 고정값인듯)
-            "cgPsId": "korail",  # korail 고정
-            "pnrNo": reservation.reservation_number,  # 예약번호
-            "totPrnb": reservation.seat_count,  # 승차인원
-            "mnsStlAmt1": reservation.total_cost,  # 결제금액1
-            "crdInpWayCd1": "@",  # 카드입력방식코드 (@: 신용카드/ok포인트, "": 전자지갑)
-            "athnVal1": validation_number,  # 생년월일/사업자번호
-            "stlCrCrdNo1": number,  # 결제신용카드번호1
-            "jrnyCnt": "1",  # 여정수(1 고정)
-            "strJobId": "3102",  # 업무구분코드(3102 고정값인듯)
-            "inrecmnsGridcnt": "1",  # 1 고정값인듯
-            "dptTm": reservation.dep_time,  # 출발시간
-            "arvTm": reservation.arr_time,  # 도착시간
-            "dptStnConsOrdr2": "000000",  # 출발역구성순서2 (000000 고정)
-            "arvStnConsOrdr2": "000000",  # 도착역구성순서2 (000000 고정)
-            "trnGpCd": "300",  # 열차그룹코드(300 고정)
-            "pageNo": "-",  # 페이지번호(- 고정)
-            "rowCnt": "-",  # 한페이지당건수(- 고정)
-            "pageUrl": "",  # 페이지URL (빈값 고정)
-        }
+        data = _payment_data(
+            reservation,
+            self.membership_number,
+            number,
+            password,
+            validation_number,
+            expire_date,
+            installment,
+            card_type,
+        )
 
         r = self._session.post(url=url, data=data)
-
-        parser = json.loads(r.text)
-
-        if (
-            parser.get("outDataSets").get("dsOutput0")[0].get("strResult")
-            == RESULT_FAIL
-        ):
-            raise SRTResponseError(
-                parser.get("outDataSets").get("dsOutput0")[0].get("msgTxt")
-            )
+        _check_payment_response(r.text)
 
         return True
\ No newline at end of file
@@ -0,0 +1,49 @@
+"""Tracer가 기록한 예약 trace 파일의 구간별 p50/p95/p99 요약
+
+    python -m SRT.trace_report reserve_traces.jsonl
+    python -m SRT.trace_report reserve_traces.jsonl --name srt.reserve --errors
+"""
+
+import argparse
+
+from .tracing import read_traces, summarize
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="예약 trace 파일의 구간별 p50/p95/p99 (ms)")
+    parser.add_argument("path", help="Tracer가 기록한 JSONL 파일")
+    parser.add_argument("--name", help="이 이름의 trace만 요약 (srt.reserve, korail.reserve)")
+    parser.add_argument("--errors", action="store_true", help="오류로 끝난 trace만 요약")
+    parser.add_argument("--ok", action="store_true", help="성공한 trace만 요약")
+    args = parser.parse_args(argv)
+
+    traces = [
+        record
+        for record in read_traces(args.path)
+        if (args.name is None or record["name"] == args.name)
+        and (not args.errors or "error" in record)
+        and (not args.ok or "error" not in record)
+    ]
+    if not traces:
+        print("no traces")
+        return
+
+    rows = summarize(traces)
+    width = max(len(_label(row["span"])) for row in rows)
+    print(f"traces: {len(traces)}")
+    print(f"{'span':<{width}}{'count':>8}{'errors':>8}{'p50':>10}{'p95':>10}{'p99':>10}{'max':>10}")
+    for row in rows:
+        print(
+            f"{_label(row['span']):<{width}}{row['count']:>8}{row['errors']:>8}"
+            f"{row['p50']:>10.1f}{row['p95']:>10.1f}{row['p99']:>10.1f}{row['max']:>10.1f}"
+        )
+
+
+def _label(path: str) -> str:
+    # 하위 구간은 깊이만큼 들여써서 이름만 표시
+    depth = path.count("/")
+    return "  " * depth + path.rsplit("/", 1)[-1]
+
+
+if __name__ == "__main__":
+    main()
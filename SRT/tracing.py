@@ -0,0 +1,181 @@
+"""예약 시도 한 번의 구간(span) 트리 기록과 요약 (요약 CLI: ``python -m SRT.trace_report``)"""
+
+import json
+import threading
+import time
+import uuid
+from collections import defaultdict
+from contextlib import contextmanager, nullcontext
+from datetime import datetime
+from typing import Any, Callable, ContextManager, Iterable, Iterator
+
+_LOCAL = threading.local()
+
+
+class Span:
+    """측정 구간 하나. 시작/끝 시각은 ``Tracer`` 의 clock 기준 (초)"""
+
+    __slots__ = ("name", "attrs", "start", "end", "error", "children")
+
+    def __init__(self, name: str, attrs: dict[str, Any], start: float):
+        self.name = name
+        self.attrs = attrs
+        self.start = start
+        self.end: float | None = None
+        self.error: str | None = None
+        self.children: list["Span"] = []
+
+    def set(self, **attrs: Any) -> None:
+        """구간에 속성을 덧붙입니다."""
+        self.attrs.update(attrs)
+
+    def to_dict(self, origin: float) -> dict[str, Any]:
+        data: dict[str, Any] = {
+            "name": self.name,
+            "start_ms": round((self.start - origin) * 1000, 3),
+            "duration_ms": round(((self.end or self.start) - self.start) * 1000, 3),
+        }
+        if self.attrs:
+            data["attrs"] = self.attrs
+        if self.error is not None:
+            data["error"] = self.error
+        if self.children:
+            data["children"] = [child.to_dict(origin) for child in self.children]
+        return data
+
+
+class Tracer:
+    """예약 시도 한 번의 구간 트리를 JSONL 파일에 한 줄씩 기록
+
+    :func:`trace` 블록 안에서 같은 스레드가 :func:`span` 으로 연 구간은 모두 하위 구간으로 기록됩니다.
+    :class:`TransportConfig` 의 ``tracer`` 로 지정하면 :func:`SRT.reserve` 와 :func:`Korail.reserve` 가
+    NetFunnel 키 발급/완료, 승객 정리, 요청 데이터 생성, 예약 요청, 응답 해석, 예약 내역 조회를 기록합니다.
+
+    >>> transport = TransportConfig(tracer=Tracer("reserve_traces.jsonl"))
+    >>> srt = SRT(srt_id, srt_pw, transport=transport)
+    >>> srt.reserve(train)  # reserve_traces.jsonl 에 한 줄 추가
+
+    Args:
+        path (str): 기록할 JSONL 파일 경로 (이어서 씀)
+    """
+
+    def __init__(self, path: str, clock: Callable[[], float] = time.perf_counter) -> None:
+        self.path = path
+        self._clock = clock
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def trace(self, name: str, **attrs: Any) -> Iterator[Span]:
+        """최상위 구간을 열고, 블록이 끝나면 구간 트리를 파일에 기록합니다.
+
+        이미 다른 trace 안이면 하위 구간으로 기록합니다.
+        """
+        if getattr(_LOCAL, "stack", None):
+            with span(name, **attrs) as current:
+                yield current
+            return
+
+        started_at = time.time()
+        root = Span(name, attrs, self._clock())
+        _LOCAL.stack = [root]
+        _LOCAL.clock = self._clock
+        try:
+            yield root
+        except BaseException as e:
+            root.error = _error(e)
+            raise
+        finally:
+            root.end = self._clock()
+            _LOCAL.stack = None
+            self._write(root, started_at)
+
+    def _write(self, root: Span, started_at: float) -> None:
+        record = {
+            "trace_id": uuid.uuid4().hex,
+            "started_at": datetime.fromtimestamp(started_at).isoformat(timespec="milliseconds"),
+            **root.to_dict(root.start),
+        }
+        del record["start_ms"]
+        line = json.dumps(record, ensure_ascii=False) + "\n"
+        with self._lock, open(self.path, "a", encoding="utf-8") as f:
+            f.write(line)
+
+
+def trace(tracer: Tracer | None, name: str, **attrs: Any) -> ContextManager[Span | None]:
+    """``tracer`` 가 있으면 :func:`Tracer.trace`, 없으면 아무것도 하지 않는 블록"""
+    if tracer is None:
+        return nullcontext()
+    return tracer.trace(name, **attrs)
+
+
+@contextmanager
+def span(name: str, **attrs: Any) -> Iterator[Span | None]:
+    """현재 스레드의 trace 안이면 하위 구간을 기록합니다. trace 밖에서는 ``None`` 을 반환하고 아무것도 하지 않습니다."""
+    stack = getattr(_LOCAL, "stack", None)
+    if not stack:
+        yield None
+        return
+
+    clock = _LOCAL.clock
+    current = Span(name, attrs, clock())
+    stack[-1].children.append(current)
+    stack.append(current)
+    try:
+        yield current
+    except BaseException as e:
+        current.error = _error(e)
+        raise
+    finally:
+        current.end = clock()
+        stack.pop()
+
+
+def _error(e: BaseException) -> str:
+    return f"{type(e).__name__}: {e}" if str(e) else type(e).__name__
+
+
+def read_traces(path: str) -> Iterator[dict[str, Any]]:
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def summarize(traces: Iterable[dict[str, Any]]) -> list[dict[str, Any]]:
+    """구간 경로(``srt.reserve/netfunnel/netfunnel.get_key``)별 횟수, 오류 수, p50/p95/p99/최대 시간(ms)
+
+    경로는 처음 나타난 순서대로 반환합니다.
+    """
+    durations: dict[str, list[float]] = defaultdict(list)
+    errors: dict[str, int] = defaultdict(int)
+
+    def visit(node: dict[str, Any], prefix: str) -> None:
+        path = f"{prefix}/{node['name']}" if prefix else node["name"]
+        durations[path].append(node["duration_ms"])
+        if "error" in node:
+            errors[path] += 1
+        for child in node.get("children", ()):
+            visit(child, path)
+
+    for record in traces:
+        visit(record, "")
+
+    return [
+        {
+            "span": path,
+            "count": len(values),
+            "errors": errors[path],
+            "p50": _percentile(values, 0.50),
+            "p95": _percentile(values, 0.95),
+            "p99": _percentile(values, 0.99),
+            "max": max(values),
+        }
+        for path, values in durations.items()
+    ]
+
+
+def _percentile(values: list[float], q: float) -> float:
+    # nearest-rank
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * q // 1))
+    return ordered[int(rank) - 1]
@@ -2,10 +2,31 @@ from .constants import STATION_NAME, TRAIN_NAME
 
 
 class Train:
-    pass
+    __slots__ = ()
 
 
 class SRTTrain(Train):
+    __slots__ = (
+        "train_code",
+        "train_name",
+        "train_number",
+        "dep_date",
+        "dep_time",
+        "dep_station_code",
+        "dep_station_name",
+        "arr_date",
+        "arr_time",
+        "arr_station_code",
+        "arr_station_name",
+        "general_seat_state",
+        "special_seat_state",
+        "reserve_wait_possible_code",
+        "arr_station_run_order",
+        "arr_station_constitution_order",
+        "dep_station_run_order",
+        "dep_station_constitution_order",
+    )
+
     def __init__(self, data):
         self.train_code = data["stlbTrnClsfCd"]
         self.train_name = TRAIN_NAME.get(
@@ -29,7 +50,6 @@ class SRTTrain(Train):
         self.reserve_wait_possible_code = data["rsvWaitPsbCd"]
         self.arr_station_run_order = data["arvStnRunOrdr"]
         self.arr_station_constitution_order = data["arvStnConsOrdr"]
-        self.arr_station_constitution_order = data["arvStnConsOrdr"]
         self.dep_station_run_order = data["dptStnRunOrdr"]
         self.dep_station_constitution_order = data["dptStnConsOrdr"]
 
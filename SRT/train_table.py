@@ -0,0 +1,175 @@
+from array import array
+from typing import Iterable, Iterator, Sequence
+
+from .train import SRTTrain
+
+try:
+    # 설치되어 있으면 열 연산에 numpy를 사용합니다.
+    import numpy as np
+except ImportError:
+    np = None
+
+# SRTTrain 에 필요한 응답 필드 (열 이름 = 응답 키)
+FIELDS = (
+    "stlbTrnClsfCd",
+    "trnNo",
+    "dptDt",
+    "dptTm",
+    "dptRsStnCd",
+    "arvDt",
+    "arvTm",
+    "arvRsStnCd",
+    "gnrmRsvPsbStr",
+    "sprmRsvPsbStr",
+    "rsvWaitPsbCd",
+    "arvStnRunOrdr",
+    "arvStnConsOrdr",
+    "dptStnRunOrdr",
+    "dptStnConsOrdr",
+)
+
+Mask = Sequence[bool]
+
+
+class TrainTable:
+    """열차 검색 결과를 열 단위로 보관하는 표
+
+    문자열 필드는 열마다 하나의 리스트로, 필터에 쓰는 출발 시각과 좌석 상태는
+    숫자 배열(numpy가 있으면 ``numpy.ndarray``, 없으면 :mod:`array`)로 보관합니다.
+    필터는 열 전체에 대해 한 번에 계산하고, :class:`SRTTrain` 객체는 접근할 때만 만듭니다.
+
+    >>> table = TrainTable.from_rows(parser.out_data())
+    >>> morning = table.where(table.seat_available(), table.departing_between("060000", "100000"))
+    >>> for train in morning:
+    ...     print(train)
+
+    Args:
+        columns (dict[str, list[str]]): :data:`FIELDS` 의 각 키에 대한 값 리스트
+    """
+
+    __slots__ = ("columns", "dep_time", "general", "special", "standby", "_size")
+
+    def __init__(self, columns: dict[str, list[str]]):
+        self.columns = columns
+        self._size = len(columns[FIELDS[0]])
+
+        self.dep_time = _int_column(int(t) for t in columns["dptTm"])
+        self.general = _bool_column("예약가능" in s for s in columns["gnrmRsvPsbStr"])
+        self.special = _bool_column("예약가능" in s for s in columns["sprmRsvPsbStr"])
+        self.standby = _bool_column("9" in s for s in columns["rsvWaitPsbCd"])
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[dict]) -> "TrainTable":
+        """검색 응답의 열차 목록(``outDataSets.dsOutput1``)으로 표를 만듭니다."""
+        rows = rows if isinstance(rows, (list, tuple)) else list(rows)
+        return cls({field: [row[field] for row in rows] for field in FIELDS})
+
+    @classmethod
+    def from_trains(cls, trains: Iterable[SRTTrain]) -> "TrainTable":
+        """:class:`SRTTrain` 목록으로 표를 만듭니다."""
+        return cls.from_rows(_train_row(train) for train in trains)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, index: int) -> SRTTrain:
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("train index out of range")
+        return SRTTrain({field: values[index] for field, values in self.columns.items()})
+
+    def __iter__(self) -> Iterator[SRTTrain]:
+        for index in range(self._size):
+            yield self[index]
+
+    def trains(self) -> list[SRTTrain]:
+        """모든 행을 :class:`SRTTrain` 으로 만듭니다."""
+        return list(self)
+
+    # masks
+    def general_seat_available(self) -> Mask:
+        return self.general
+
+    def special_seat_available(self) -> Mask:
+        return self.special
+
+    def seat_available(self) -> Mask:
+        return _or(self.general, self.special)
+
+    def reserve_standby_available(self) -> Mask:
+        return self.standby
+
+    def departing_between(self, start: str = "000000", end: str = "235959") -> Mask:
+        """출발 시각이 ``start`` ~ ``end`` (hhmmss) 인 열차"""
+        low, high = int(start), int(end)
+        if np is not None:
+            return (self.dep_time >= low) & (self.dep_time <= high)
+        return bytearray(low <= t <= high for t in self.dep_time)
+
+    def train_code_in(self, codes: Iterable[str]) -> Mask:
+        """열차 종류 코드(``stlbTrnClsfCd``)가 ``codes`` 중 하나인 열차 (SRT는 ``"17"``)"""
+        codes = set(codes)
+        return _bool_column(code in codes for code in self.columns["stlbTrnClsfCd"])
+
+    def where(self, *masks: Mask) -> "TrainTable":
+        """모든 ``masks`` 를 만족하는 행만 남긴 표를 반환합니다."""
+        if not masks:
+            return self
+
+        mask = masks[0]
+        for other in masks[1:]:
+            mask = _and(mask, other)
+
+        if np is not None:
+            indices = np.flatnonzero(mask).tolist()
+        else:
+            indices = [i for i, selected in enumerate(mask) if selected]
+
+        return TrainTable(
+            {field: [values[i] for i in indices] for field, values in self.columns.items()}
+        )
+
+
+def _int_column(values: Iterable[int]):
+    if np is not None:
+        return np.fromiter(values, dtype=np.int32)
+    return array("i", values)
+
+
+def _bool_column(values: Iterable[bool]):
+    if np is not None:
+        return np.fromiter(values, dtype=bool)
+    return bytearray(values)
+
+
+def _and(a: Mask, b: Mask) -> Mask:
+    if np is not None:
+        return np.logical_and(a, b)
+    return bytearray(x and y for x, y in zip(a, b))
+
+
+def _or(a: Mask, b: Mask) -> Mask:
+    if np is not None:
+        return np.logical_or(a, b)
+    return bytearray(x or y for x, y in zip(a, b))
+
+
+def _train_row(train: SRTTrain) -> dict:
+    return {
+        "stlbTrnClsfCd": train.train_code,
+        "trnNo": train.train_number,
+        "dptDt": train.dep_date,
+        "dptTm": train.dep_time,
+        "dptRsStnCd": train.dep_station_code,
+        "arvDt": train.arr_date,
+        "arvTm": train.arr_time,
+        "arvRsStnCd": train.arr_station_code,
+        "gnrmRsvPsbStr": train.general_seat_state,
+        "sprmRsvPsbStr": train.special_seat_state,
+        "rsvWaitPsbCd": train.reserve_wait_possible_code,
+        "arvStnRunOrdr": train.arr_station_run_order,
+        "arvStnConsOrdr": train.arr_station_constitution_order,
+        "dptStnRunOrdr": train.dep_station_run_order,
+        "dptStnConsOrdr": train.dep_station_constitution_order,
+    }
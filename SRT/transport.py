@@ -0,0 +1,271 @@
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Iterable, Iterator, Mapping
+from urllib.parse import urlsplit
+
+import requests  # type: ignore[import]
+from requests.adapters import HTTPAdapter  # type: ignore[import]
+from urllib3.util.retry import Retry
+
+from . import constants
+from .metrics import CLIENT_METRICS, ClientMetrics, parse_result
+from .recording import Recorder, Replay
+from .tracing import Tracer
+
+Timeout = tuple[float, float]
+
+# 이름별 (connect, read) 타임아웃 기본값. 예약/결제는 서버 처리가 길어 read 타임아웃을 넉넉히 둡니다.
+DEFAULT_ENDPOINT_TIMEOUTS: dict[str, Timeout] = {
+    "reserve": (3.05, 30.0),
+    "payment": (3.05, 30.0),
+    "korail_reserve": (3.05, 30.0),
+    "korail_payment": (3.05, 30.0),
+}
+
+_ENDPOINTS: list[Mapping[str, str]] = []
+
+
+def register_endpoints(endpoints: Mapping[str, str]) -> None:
+    """``{이름: URL}`` 을 등록해 :attr:`TransportConfig.endpoint_timeouts` 에서 이름으로 찾을 수 있게 합니다.
+
+    등록한 매핑 객체를 그대로 참조하므로, 나중에 URL을 바꿔도 바뀐 URL로 찾습니다.
+    """
+    if not any(registered is endpoints for registered in _ENDPOINTS):
+        _ENDPOINTS.append(endpoints)
+
+
+def endpoint_name(url: str) -> str | None:
+    """``url`` 에 해당하는 등록된 엔드포인트 이름을 반환합니다."""
+    base = url.split("?", 1)[0]
+    for endpoints in _ENDPOINTS:
+        for name, endpoint in endpoints.items():
+            if endpoint.split("?", 1)[0] == base:
+                return name
+    return None
+
+
+register_endpoints(constants.API_ENDPOINTS)
+
+_COUNTERS = threading.local()
+
+
+@contextmanager
+def count_requests() -> Iterator[Counter]:
+    """블록 안에서 현재 스레드가 보낸 HTTP 요청 수를 엔드포인트 이름별로 셉니다.
+
+    :func:`TransportConfig.create_session` 으로 만든 세션의 요청만 셉니다.
+    등록되지 않은 URL은 쿼리를 뺀 URL로 셉니다. 블록을 중첩하면 바깥 블록에도 함께 셉니다.
+
+    >>> with count_requests() as sent:
+    ...     srt.search_train("수서", "부산", "20240101", "080000", time_limit="080000")
+    >>> sent["search_schedule"]
+    1
+    """
+    counter: Counter = Counter()
+    stack = _COUNTERS.__dict__.setdefault("stack", [])
+    stack.append(counter)
+    try:
+        yield counter
+    finally:
+        stack.remove(counter)
+
+
+@dataclass
+class TransportConfig:
+    """HTTP 연결 설정
+
+    :class:`SRT`, :class:`NetFunnelHelper`, :class:`korail2.Korail` 이 만드는 세션의
+    커넥션 풀 크기, 재시도, 타임아웃, keep-alive, 워밍업과 요청 지표/예약 trace를 기록할 곳,
+    요청/응답 녹화와 재생을 설정합니다.
+
+    >>> transport = TransportConfig(read_timeout=5, endpoint_timeouts={"search_schedule": (1, 3)}, warmup=True)
+    >>> srt = SRT(srt_id, srt_pw, transport=transport)
+
+    Args:
+        pool_connections (int): 호스트별 커넥션 풀 개수
+        pool_maxsize (int): 풀 하나에 유지할 최대 연결 수 (구간 병렬 검색의 동시 요청 수 이상으로 설정)
+        connect_retries (int): 연결 실패 시 재시도 횟수. 요청이 전송된 뒤의 실패는 재시도하지 않습니다
+        backoff_factor (float): 재시도 간격 계수
+        connect_timeout (float): 기본 연결 타임아웃 (초)
+        read_timeout (float): 기본 응답 타임아웃 (초)
+        endpoint_timeouts (dict[str, tuple[float, float]]): 엔드포인트 이름별 (connect, read) 타임아웃, ``DEFAULT_ENDPOINT_TIMEOUTS`` 에 덧붙입니다
+        keep_alive (bool): 연결 재사용 여부
+        warmup (bool): 클라이언트 생성 시 백그라운드에서 미리 연결을 열어둘지 여부
+        warmup_connections (int): 워밍업 시 호스트별로 열어둘 연결 수
+        metrics (ClientMetrics, optional): 요청 지표를 기록할 곳. 기본값은 ``CLIENT_METRICS``, ``None`` 이면 기록하지 않습니다
+        tracer (Tracer, optional): 예약 시도마다 구간 트리를 기록할 곳 (default: 기록하지 않음)
+        recorder (Recorder, optional): 요청/응답을 녹화할 곳 (default: 녹화하지 않음)
+        replay (Replay, optional): 지정하면 서버에 요청하지 않고 녹화된 응답을 돌려줍니다
+    """
+
+    pool_connections: int = 4
+    pool_maxsize: int = 16
+    connect_retries: int = 2
+    backoff_factor: float = 0.1
+    connect_timeout: float = 3.05
+    read_timeout: float = 15.0
+    endpoint_timeouts: dict[str, Timeout] = field(default_factory=dict)
+    keep_alive: bool = True
+    warmup: bool = False
+    warmup_connections: int = 1
+    metrics: ClientMetrics | None = CLIENT_METRICS
+    tracer: Tracer | None = None
+    recorder: Recorder | None = None
+    replay: Replay | None = None
+
+    def __post_init__(self) -> None:
+        self.endpoint_timeouts = {**DEFAULT_ENDPOINT_TIMEOUTS, **self.endpoint_timeouts}
+
+    def timeout_for(self, url_or_name: str) -> Timeout:
+        """URL 또는 엔드포인트 이름에 적용할 (connect, read) 타임아웃을 반환합니다."""
+        timeout = self.endpoint_timeouts.get(url_or_name)
+        if timeout is None:
+            name = endpoint_name(url_or_name)
+            if name is not None:
+                timeout = self.endpoint_timeouts.get(name)
+        if timeout is None:
+            timeout = (self.connect_timeout, self.read_timeout)
+        return timeout
+
+    def create_session(self, headers: Mapping[str, str] | None = None) -> requests.Session:
+        """이 설정을 적용한 세션을 만듭니다. 타임아웃을 주지 않은 요청에는 :func:`timeout_for` 를 적용합니다."""
+        session = _TransportSession(self)
+
+        if self.replay is not None:
+            adapter = self.replay.adapter()
+        else:
+            retry = Retry(
+                total=self.connect_retries,
+                connect=self.connect_retries,
+                read=0,
+                status=0,
+                other=0,
+                backoff_factor=self.backoff_factor,
+                raise_on_status=False,
+            )
+            adapter = HTTPAdapter(
+                pool_connections=self.pool_connections,
+                pool_maxsize=self.pool_maxsize,
+                max_retries=retry,
+            )
+        if self.recorder is not None:
+            adapter = self.recorder.wrap(adapter)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+
+        if headers:
+            session.headers.update(headers)
+        if not self.keep_alive:
+            session.headers["Connection"] = "close"
+
+        return session
+
+    def warmup_session(
+        self,
+        session: requests.Session,
+        urls: Iterable[str],
+        verify: bool = True,
+        background: bool = False,
+    ) -> int | threading.Thread:
+        """``urls`` 의 호스트마다 ``warmup_connections`` 개의 연결을 미리 열어 풀에 넣어둡니다.
+
+        TCP/TLS 핸드셰이크를 미리 끝내두므로 이후 첫 요청이 빨라집니다.
+        요청은 호스트 루트에 대한 HEAD 요청이며, 실패는 무시합니다.
+        ``verify`` 는 실제 요청과 같아야 같은 커넥션 풀을 사용합니다.
+
+        Returns:
+            int: 연결에 성공한 수. ``background`` 이면 워밍업 중인 스레드
+        """
+        if not self.keep_alive or self.replay is not None:
+            return 0
+
+        origins = []
+        for url in urls:
+            parts = urlsplit(url)
+            origin = f"{parts.scheme}://{parts.netloc}/"
+            if origin not in origins:
+                origins.append(origin)
+
+        if background:
+            thread = threading.Thread(
+                target=self.warmup_session, args=(session, origins, verify), daemon=True
+            )
+            thread.start()
+            return thread
+
+        def connect(origin: str) -> bool:
+            try:
+                session.head(
+                    origin,
+                    timeout=(self.connect_timeout, self.connect_timeout),
+                    verify=verify,
+                    allow_redirects=False,
+                )
+            except requests.RequestException:
+                return False
+            return True
+
+        targets = [
+            origin for origin in origins for _ in range(max(1, self.warmup_connections))
+        ]
+        with ThreadPoolExecutor(max_workers=len(targets) or 1) as executor:
+            return sum(executor.map(connect, targets))
+
+
+class _TransportSession(requests.Session):
+    def __init__(self, config: TransportConfig):
+        super().__init__()
+        self.transport = config
+
+    def request(self, method, url, *args, endpoint=None, **kwargs):
+        """``endpoint`` 로 등록되지 않은 URL의 엔드포인트 이름을 지정할 수 있습니다."""
+        name = endpoint or endpoint_name(url) or url.split("?", 1)[0]
+
+        counters = getattr(_COUNTERS, "stack", None)
+        if counters:
+            for counter in counters:
+                counter[name] += 1
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = self.transport.timeout_for(endpoint or url)
+
+        metrics = self.transport.metrics
+        if metrics is None:
+            return super().request(method, url, *args, **kwargs)
+
+        started = time.perf_counter()
+        try:
+            response = super().request(method, url, *args, **kwargs)
+        except requests.RequestException as e:
+            sent = _body_size(e.request.body) if e.request is not None else 0
+            metrics.observe_error(name, time.perf_counter() - started, e, sent)
+            raise
+
+        result, code = parse_result(response.content)
+        metrics.observe(
+            name,
+            time.perf_counter() - started,
+            response.status_code,
+            result,
+            code,
+            sent=_body_size(response.request.body),
+            received=len(response.content),
+        )
+        return response
+
+
+def _body_size(body) -> int:
+    if body is None:
+        return 0
+    if isinstance(body, str):
+        return len(body.encode("utf-8"))
+    try:
+        return len(body)
+    except TypeError:  # 스트리밍 본문
+        return 0
+
+
+DEFAULT_TRANSPORT = TransportConfig()
@@ -0,0 +1,282 @@
+"""벤치마크용 로컬 SRT 로그인/검색/예약/NetFunnel 엔드포인트
+
+실제 서버처럼 ``dptTm`` 이후의 열차를 한 페이지(10개)씩 돌려주고, 더 이상 열차가 없으면
+``FAIL`` 을 반환합니다. 로그인은 항상 성공하고, 예약은 항상 잔여석없음으로 실패합니다.
+:class:`MockSRTServer` 는 요청마다 ``latency`` 초만큼 지연해 네트워크 왕복 시간을 흉내 내고,
+:class:`MockTransport` 는 같은 응답을 소켓 없이 돌려줘 클라이언트 코드만의 시간을 측정합니다.
+"""
+
+import json
+import threading
+import time
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import requests  # type: ignore[import]
+from requests.adapters import BaseAdapter  # type: ignore[import]
+from requests.structures import CaseInsensitiveDict  # type: ignore[import]
+
+from SRT.jobs import Job
+from SRT.transport import TransportConfig
+
+PAGE_SIZE = 10
+
+
+def make_train(dep_time: str, number: int, date: str = "20250101") -> dict:
+    return {
+        "stlbTrnClsfCd": "17",
+        "trnNo": f"{number:05d}",
+        "dptDt": date,
+        "dptTm": dep_time,
+        "dptRsStnCd": "0551",
+        "arvDt": date,
+        "arvTm": dep_time,
+        "arvRsStnCd": "0020",
+        "gnrmRsvPsbStr": "예약가능" if number % 3 else "매진",
+        "sprmRsvPsbStr": "매진",
+        "rsvWaitPsbCd": "-1",
+        "arvStnRunOrdr": "000010",
+        "arvStnConsOrdr": "000010",
+        "dptStnRunOrdr": "000001",
+        "dptStnConsOrdr": "000001",
+    }
+
+
+def make_schedule(count: int = 120) -> list[dict]:
+    """05:00 부터 23:50 사이에 고르게 배치된 ``count`` 개의 열차"""
+    begin, end = 5 * 3600, 23 * 3600 + 50 * 60
+    step = (end - begin) // max(1, count - 1)
+    trains = []
+    for i in range(count):
+        t = begin + step * i
+        trains.append(make_train(f"{t // 3600:02d}{t // 60 % 60:02d}00", 300 + i))
+    return trains
+
+
+def selection(train) -> dict:
+    """웹 앱이 검색 결과에서 선택한 열차로 저장하는 것과 같은 형태의 ``train``"""
+    return {
+        "train_name": train.train_name,
+        "dep_date": train.dep_date, "dep_time": train.dep_time,
+        "arr_date": train.arr_date, "arr_time": train.arr_time,
+        "dep_station_name": train.dep_station_name,
+        "arr_station_name": train.arr_station_name,
+        "special_seat_available": train.special_seat_available(),
+        "general_seat_available": train.general_seat_available(),
+        "train_number": train.train_number,
+        "run_date": train.dep_date,
+        "dep_station_code": train.dep_station_code,
+        "arr_station_code": train.arr_station_code,
+    }
+
+
+class NoWaitJob(Job):
+    """사이클 사이에 기다리지 않는 매크로 작업"""
+
+    def wait(self, timeout: float) -> bool:
+        return self.cancelled
+
+
+class _HTTPServer(ThreadingHTTPServer):
+    # 부하 테스트에서 동시에 연결이 몰려도 끊지 않도록 accept 대기열을 늘림
+    request_queue_size = 1024
+    daemon_threads = True
+
+
+class MockSRTServer:
+    """``with MockSRTServer() as server:`` 로 사용하는 로컬 HTTP 서버"""
+
+    def __init__(self, schedule: list[dict] | None = None, latency: float = 0.05):
+        self.schedule = schedule if schedule is not None else make_schedule()
+        self.latency = latency
+        self.requests = 0
+        self._lock = threading.Lock()
+        self._server = _HTTPServer(("127.0.0.1", 0), self._handler())
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_address[1]}"
+
+    def __enter__(self) -> "MockSRTServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.requests = 0
+
+    def search_page(self, dep_time: str) -> dict:
+        return search_page(self.schedule, dep_time)
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def _send(self, body: str, content_type: str) -> None:
+                time.sleep(server.latency)
+                payload = body.encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", f"{content_type}; charset=utf-8")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def do_GET(self):
+                query = parse_qs(urlparse(self.path).query)
+                self._send(netfunnel_body(query.get("opcode", ["5101"])[0]), "text/javascript")
+
+            def do_POST(self):
+                with server._lock:
+                    server.requests += 1
+                length = int(self.headers.get("Content-Length", 0))
+                form = parse_qs(self.rfile.read(length).decode("utf-8"))
+                body = srt_body(server.schedule, urlparse(self.path).path, form)
+                self._send(body, "application/json")
+
+        return Handler
+
+
+class _MockAdapter(BaseAdapter):
+    def __init__(self, transport: "MockTransport") -> None:
+        super().__init__()
+        self.transport = transport
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        parts = urlparse(request.url)
+        if request.method == "POST":
+            body = request.body.decode("utf-8") if isinstance(request.body, bytes) else request.body or ""
+            text = srt_body(self.transport.schedule, parts.path, parse_qs(body))
+            content_type = "application/json"
+        elif request.method == "GET":
+            text = netfunnel_body(parse_qs(parts.query).get("opcode", ["5101"])[0])
+            content_type = "text/javascript"
+        else:  # 워밍업 HEAD
+            text, content_type = "", "text/html"
+        with self.transport.lock:
+            self.transport.requests += 1
+
+        response = requests.Response()
+        response.status_code = 200
+        response.reason = "OK"
+        response.headers = CaseInsensitiveDict({"Content-Type": f"{content_type}; charset=utf-8"})
+        response.encoding = "utf-8"
+        response._content = text.encode("utf-8")
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
+@dataclass
+class MockTransport(TransportConfig):
+    """:class:`MockSRTServer` 와 같은 응답을 소켓 없이 돌려주는 세션을 만드는 :class:`TransportConfig`
+
+    >>> transport = MockTransport(schedule=make_schedule(120))
+    >>> srt = SRT("bench", "bench", transport=transport, netfunnel_helper=NetFunnelHelper(transport=transport))
+
+    Args:
+        schedule (list[dict]): 검색에 돌려줄 열차 (default: ``make_schedule()``)
+    """
+
+    schedule: list[dict] = field(default_factory=lambda: make_schedule())
+    requests: int = 0
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def create_session(self, headers=None) -> "requests.Session":
+        session = super().create_session(headers)
+        adapter = _MockAdapter(self)
+        if self.recorder is not None:
+            adapter = self.recorder.wrap(adapter)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+
+def search_page(schedule: list[dict], dep_time: str) -> dict:
+    """``dep_time`` 이후의 열차 한 페이지. 없으면 ``FAIL``"""
+    rows = [t for t in schedule if t["dptTm"] >= dep_time][:PAGE_SIZE]
+    if not rows:
+        return {
+            "resultMap": [
+                {"strResult": "FAIL", "msgCd": "WRR800029", "msgTxt": "no result"}
+            ]
+        }
+    return {
+        "resultMap": [{"strResult": "SUCC", "msgCd": "S000001", "msgTxt": "ok"}],
+        "outDataSets": {"dsOutput1": rows},
+    }
+
+
+def srt_body(schedule: list[dict], path: str, form: dict[str, list[str]]) -> str:
+    """SRT 엔드포인트 ``path`` 의 응답 본문"""
+    if path.endswith(_endpoint_path("login")):
+        body = {"userMap": {"MB_CRD_NO": "0000000000"}}
+    elif path.endswith(_endpoint_path("reserve")):
+        body = {
+            "resultMap": [
+                {"strResult": "FAIL", "msgCd": "WRR800028", "msgTxt": "잔여석없음"}
+            ]
+        }
+    else:
+        body = search_page(schedule, form.get("dptTm", ["000000"])[0])
+    return json.dumps(body, ensure_ascii=False)
+
+
+def netfunnel_body(opcode: str) -> str:
+    """바로 통과하는 NetFunnel 응답 본문"""
+    return (
+        f"NetFunnel.gRtype={opcode};"
+        "NetFunnel.gControl.result='5002:200:key=MOCKKEY&nwait=0&nnext=0"
+        "&tps=0&ttl=0&ip=127.0.0.1&port=80';"
+        "NetFunnel.gControl._showResult();"
+    )
+
+
+def _endpoint_path(name: str) -> str:
+    from SRT import constants
+
+    return urlparse(constants.API_ENDPOINTS[name]).path
+
+
+def point_at(base_url: str) -> None:
+    """:mod:`SRT.constants` 의 엔드포인트, NetFunnel 주소, ``korail2`` 의 ``KORAIL_*`` 주소를 ``base_url`` 로 바꿉니다.
+
+    이후에 만드는 모든 클라이언트(앱의 ``CLIENT_POOL`` 포함)가 모의 서버로 요청합니다.
+    프로세스를 새로 띄울 때는 환경 변수 ``SRT_BASE_URL``, ``NETFUNNEL_URL``, ``KORAIL_BASE_URL`` 로도 지정할 수 있습니다.
+    """
+    from SRT import constants
+    from SRT.netfunnel import _NetFunnelBase
+
+    for name, url in list(constants.API_ENDPOINTS.items()):
+        constants.API_ENDPOINTS[name] = url.replace(constants.SRT_MOBILE, base_url)
+    constants.SRT_MOBILE = base_url
+    _NetFunnelBase.NETFUNNEL_URL = f"{base_url}/ts.wseq"
+
+    try:
+        from korail2 import korail2
+    except ImportError:  # pycryptodome 없이 SRT만 측정하는 경우
+        return
+    domain = korail2.KORAIL_DOMAIN
+    for name in dir(korail2):
+        value = getattr(korail2, name)
+        if name.startswith("KORAIL_") and isinstance(value, str) and value.startswith(domain):
+            setattr(korail2, name, base_url + value[len(domain):])
+    for name, url in list(korail2.KORAIL_ENDPOINTS.items()):
+        korail2.KORAIL_ENDPOINTS[name] = base_url + url[len(domain):]
+
+
+def point_client_at(srt, base_url: str) -> None:
+    """``srt`` 와 :mod:`SRT.constants` 의 엔드포인트를 ``base_url`` 로 바꿉니다."""
+    point_at(base_url)
+    srt.netfunnel_helper.NETFUNNEL_URL = f"{base_url}/ts.wseq"
@@ -0,0 +1,690 @@
+"""SRT/NetFunnel/Korail 모의 서버: 접속 대기열, 매진과 취소표, IP별 요청 제한을 흉내 냄
+
+    python -m benchmarks.mock_server --port 8080 --netfunnel-tps 5 --release-rate 0.5 --rate-limit 10
+
+실제 서버에 부하를 주거나 IP가 차단되지 않고 매크로 설정을 시험할 수 있도록, 클라이언트가 사용하는
+``constants.API_ENDPOINTS``, ``NetFunnelHelper.NETFUNNEL_URL``, ``KORAIL_*`` 엔드포인트를 한 포트에서 제공합니다.
+클라이언트와 웹 앱은 환경 변수로 이 서버를 가리키게 합니다.
+
+    SRT_BASE_URL=http://127.0.0.1:8080 NETFUNNEL_URL=http://127.0.0.1:8080/ts.wseq \\
+        KORAIL_BASE_URL=http://127.0.0.1:8080 python srt_main_web.py
+
+- 열차: 노선/날짜마다 ``--trains`` 개의 열차를 고르게 배치하고, ``--sold-out`` 비율은 매진, 나머지는
+  1 ~ ``--seats`` 석으로 시작합니다. 검색은 실제 서버처럼 요청한 시각 이후 10개씩 돌려줍니다.
+- 취소표: 초당 평균 ``--release-rate`` 번, 지금까지 검색된 열차 중 하나에 좌석이 한 석 생깁니다.
+- 예약: 좌석이 남아 있으면 예약 번호를 발급하고 좌석을 줄입니다. 없으면 잔여석없음으로 실패합니다.
+- NetFunnel: ``--netfunnel-tps`` 를 지정하면 초당 그만큼만 키를 통과시키고, 나머지는 대기 인원(nwait)과
+  함께 기다리게 합니다. 통과하지 않은 키로 검색/예약하면 NET000001 로 실패합니다.
+- 요청 제한: ``--rate-limit`` 을 지정하면 IP별로 초당 그 이상(순간 ``--burst`` 까지) SRT/Korail 요청을 보낸
+  IP를 ``--block-time`` 초 동안 "Your IP Address Blocked due to abnormal access." 로 차단합니다.
+"""
+
+import argparse
+import json
+import random
+import threading
+import time
+import uuid
+import zlib
+from collections import Counter
+from http.server import BaseHTTPRequestHandler
+from urllib.parse import parse_qs, urlsplit
+
+from ._mock_srt import PAGE_SIZE, _HTTPServer, make_train
+
+BLOCKED_MESSAGE = "Your IP Address Blocked due to abnormal access."
+
+# 하루 운행 시간 (초)
+FIRST_DEPARTURE = 5 * 3600
+LAST_DEPARTURE = 23 * 3600 + 50 * 60
+TRAVEL_TIME = 2 * 3600 + 30 * 60
+
+
+class _Train:
+    __slots__ = ("number", "date", "dep_time", "arr_time", "general", "special")
+
+    def __init__(self, number: int, date: str, dep: int, general: int, special: int):
+        self.number = number
+        self.date = date
+        self.dep_time = _hhmmss(dep)
+        self.arr_time = _hhmmss(min(dep + TRAVEL_TIME, 24 * 3600 - 1))
+        self.general = general
+        self.special = special
+
+
+class _Reservation:
+    __slots__ = ("pnr", "route", "train", "special", "count")
+
+    def __init__(self, pnr: str, route: tuple, train: _Train, special: bool, count: int):
+        self.pnr = pnr
+        self.route = route
+        self.train = train
+        self.special = special
+        self.count = count
+
+
+def _hhmmss(seconds: int) -> str:
+    return f"{seconds // 3600:02d}{seconds // 60 % 60:02d}{seconds % 60:02d}"
+
+
+def _station_code(name: str) -> str:
+    # Korail 역 코드 대신 이름에서 만든 고정 코드
+    return f"{zlib.crc32(name.encode('utf-8')) % 10000:04d}"
+
+
+class MockServer:
+    """``with MockServer() as server:`` 로 사용하거나 :func:`serve_forever` 로 실행하는 모의 서버
+
+    Args:
+        host (str): 바인드할 주소
+        port (int): 포트 (0이면 빈 포트)
+        latency (float): 요청마다 기다릴 시간 (초)
+        trains (int): 노선/날짜별 열차 수
+        sold_out (float): 처음부터 매진인 열차 비율
+        seats (int): 매진이 아닌 열차의 최대 잔여석
+        release_rate (float): 초당 평균 취소표 수
+        netfunnel_tps (float): 초당 통과시킬 NetFunnel 키 수 (0이면 대기열 없음)
+        rate_limit (float): IP별 초당 요청 수 상한 (0이면 제한 없음)
+        burst (int, optional): 순간적으로 허용할 요청 수 (default: ``rate_limit``)
+        block_time (float): 요청 제한을 넘은 IP를 차단할 시간 (초)
+        seed (int): 열차 배치와 취소표의 난수 시드
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0,
+        trains: int = 60,
+        sold_out: float = 0.7,
+        seats: int = 2,
+        release_rate: float = 0.0,
+        netfunnel_tps: float = 0.0,
+        rate_limit: float = 0.0,
+        burst: int | None = None,
+        block_time: float = 60.0,
+        seed: int = 0,
+        clock=time.monotonic,
+    ):
+        self.latency = latency
+        self.trains = trains
+        self.sold_out = sold_out
+        self.seats = seats
+        self.release_rate = release_rate
+        self.netfunnel_tps = netfunnel_tps
+        self.rate_limit = rate_limit
+        self.burst = burst if burst is not None else max(1, int(rate_limit))
+        self.block_time = block_time
+        self.seed = seed
+        self._clock = clock
+
+        self.requests: Counter = Counter()
+        self.reserved = 0
+        self.sold_out_replies = 0
+        self.released = 0
+        self.blocked = 0
+
+        self._lock = threading.Lock()
+        self._random = random.Random(seed)
+        self._schedules: dict[tuple, list[_Train]] = {}
+        self._stations: dict[str, str] = {}  # Korail 역 코드 → 이름
+        self._next_release = self._schedule_release(clock())
+
+        self._sessions: dict[str, str] = {}  # 로그인 토큰 → 계정 ID
+        self._reservations: dict[str, list[_Reservation]] = {}  # 계정 ID → 예약
+        self._next_pnr = 1
+
+        self._netfunnel_keys: dict[str, float] = {}  # 키 → 통과 시각
+        self._netfunnel_slot = 0.0
+
+        self._buckets: dict[str, tuple[float, float]] = {}  # IP → (토큰, 갱신 시각)
+        self._blocked_until: dict[str, float] = {}
+
+        self._server = _HTTPServer((host, port), self._handler())
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def netfunnel_url(self) -> str:
+        return f"{self.base_url}/ts.wseq"
+
+    def environ(self) -> dict[str, str]:
+        """클라이언트와 웹 앱이 이 서버로 요청하게 하는 환경 변수"""
+        return {
+            "SRT_BASE_URL": self.base_url,
+            "NETFUNNEL_URL": self.netfunnel_url,
+            "KORAIL_BASE_URL": self.base_url,
+        }
+
+    def __enter__(self) -> "MockServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def serve_forever(self) -> None:
+        self._server.serve_forever()
+
+    def close(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "requests": dict(self.requests),
+                "reserved": self.reserved,
+                "sold_out": self.sold_out_replies,
+                "released": self.released,
+                "blocked": self.blocked,
+                "netfunnel_waiting": sum(
+                    1 for ready in self._netfunnel_keys.values() if ready > self._clock()
+                ),
+            }
+
+    # ── 열차와 좌석 ───────────────────────────────────────────────────
+
+    def _schedule(self, route: tuple) -> list[_Train]:
+        # self._lock을 잡은 상태에서 호출해야 합니다. route는 (서비스, 출발역, 도착역, 날짜)
+        schedule = self._schedules.get(route)
+        if schedule is None:
+            rng = random.Random(f"{self.seed}:{':'.join(route)}")
+            step = (LAST_DEPARTURE - FIRST_DEPARTURE) // max(1, self.trains - 1)
+            schedule = []
+            for i in range(self.trains):
+                if rng.random() < self.sold_out:
+                    general = special = 0
+                else:
+                    general = rng.randint(1, self.seats)
+                    special = rng.randint(0, self.seats)
+                schedule.append(_Train(300 + i, route[3], FIRST_DEPARTURE + step * i, general, special))
+            self._schedules[route] = schedule
+        return schedule
+
+    def _schedule_release(self, now: float) -> float:
+        if self.release_rate <= 0:
+            return float("inf")
+        return now + self._random.expovariate(self.release_rate)
+
+    def _release_seats(self, now: float) -> None:
+        # self._lock을 잡은 상태에서 호출해야 합니다. 지난 호출 이후 생긴 취소표를 반영
+        while now >= self._next_release:
+            self._next_release = self._schedule_release(self._next_release)
+            if not self._schedules:
+                continue
+            schedule = self._random.choice(list(self._schedules.values()))
+            train = self._random.choice(schedule)
+            if self._random.random() < 0.25:
+                train.special += 1
+            else:
+                train.general += 1
+            self.released += 1
+
+    def _find_train(self, route: tuple, number: int) -> _Train | None:
+        return next((t for t in self._schedule(route) if t.number == number), None)
+
+    def _reserve(self, user: str, route: tuple, number: int, special: bool, count: int) -> _Reservation | None:
+        """좌석이 남아 있으면 예약을 만들고, 없으면 ``None``"""
+        with self._lock:
+            self._release_seats(self._clock())
+            train = self._find_train(route, number)
+            left = 0 if train is None else (train.special if special else train.general)
+            if left < count:
+                self.sold_out_replies += 1
+                return None
+            if special:
+                train.special -= count
+            else:
+                train.general -= count
+            reservation = _Reservation(f"{self._next_pnr:010d}", route, train, special, count)
+            self._next_pnr += 1
+            self._reservations.setdefault(user, []).append(reservation)
+            self.reserved += 1
+            return reservation
+
+    def _cancel(self, user: str, pnr: str) -> bool:
+        with self._lock:
+            reservations = self._reservations.get(user, [])
+            for reservation in reservations:
+                if reservation.pnr == pnr:
+                    reservations.remove(reservation)
+                    if reservation.special:
+                        reservation.train.special += reservation.count
+                    else:
+                        reservation.train.general += reservation.count
+                    return True
+            return False
+
+    def _page(self, route: tuple, dep_time: str) -> list[_Train]:
+        with self._lock:
+            self._release_seats(self._clock())
+            return [t for t in self._schedule(route) if t.dep_time >= dep_time][:PAGE_SIZE]
+
+    def _login(self, user: str) -> str:
+        token = uuid.uuid4().hex
+        with self._lock:
+            self._sessions[token] = user
+        return token
+
+    def _user(self, token: str | None) -> str | None:
+        with self._lock:
+            return self._sessions.get(token or "")
+
+    # ── NetFunnel 대기열 ───────────────────────────────────────────────
+
+    def _netfunnel_issue(self, now: float) -> tuple[str, float]:
+        """새 키와 통과 시각. 초당 netfunnel_tps 개씩 순서대로 통과"""
+        key = uuid.uuid4().hex.upper()
+        with self._lock:
+            if self.netfunnel_tps > 0:
+                ready = max(now, self._netfunnel_slot + 1 / self.netfunnel_tps)
+                self._netfunnel_slot = ready
+            else:
+                ready = now
+            self._netfunnel_keys[key] = ready
+        return key, ready
+
+    def _netfunnel_waiting(self, key: str, now: float) -> int | None:
+        """``key`` 앞의 대기 인원. 통과했으면 0, 모르는 키면 ``None``"""
+        with self._lock:
+            ready = self._netfunnel_keys.get(key)
+        if ready is None:
+            return None
+        if ready <= now:
+            return 0
+        return max(1, round((ready - now) * self.netfunnel_tps))
+
+    def _netfunnel_passed(self, key: str | None) -> bool:
+        return self._netfunnel_waiting(key or "", self._clock()) == 0
+
+    # ── IP별 요청 제한 ─────────────────────────────────────────────────
+
+    def _allow(self, ip: str) -> bool:
+        if self.rate_limit <= 0:
+            return True
+        now = self._clock()
+        with self._lock:
+            if self._blocked_until.get(ip, 0) > now:
+                self.blocked += 1
+                return False
+            tokens, updated = self._buckets.get(ip, (float(self.burst), now))
+            tokens = min(float(self.burst), tokens + (now - updated) * self.rate_limit)
+            if tokens < 1:
+                self._blocked_until[ip] = now + self.block_time
+                self._buckets.pop(ip, None)
+                self.blocked += 1
+                return False
+            self._buckets[ip] = (tokens - 1, now)
+            return True
+
+    # ── HTTP ─────────────────────────────────────────────────────────
+
+    def _handler(self):
+        server = self
+        srt_routes = _srt_routes()
+        korail_routes = _korail_routes()
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def _send(self, body: str, content_type: str = "application/json", cookie: str | None = None) -> None:
+                payload = body.encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", f"{content_type}; charset=utf-8")
+                self.send_header("Content-Length", str(len(payload)))
+                if cookie is not None:
+                    self.send_header("Set-Cookie", f"JSESSIONID={cookie}; Path=/")
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def _params(self) -> dict[str, str]:
+                parts = urlsplit(self.path)
+                params = {k: v[0] for k, v in parse_qs(parts.query, keep_blank_values=True).items()}
+                length = int(self.headers.get("Content-Length", 0))
+                if length:
+                    body = self.rfile.read(length).decode("utf-8")
+                    params.update({k: v[0] for k, v in parse_qs(body, keep_blank_values=True).items()})
+                return params
+
+            def _session_token(self) -> str | None:
+                for part in self.headers.get("Cookie", "").split(";"):
+                    name, _, value = part.strip().partition("=")
+                    if name == "JSESSIONID":
+                        return value
+                return None
+
+            def _dispatch(self) -> None:
+                if server.latency > 0:
+                    time.sleep(server.latency)
+                path = urlsplit(self.path).path
+                params = self._params()
+
+                if path == "/ts.wseq":
+                    with server._lock:
+                        server.requests["netfunnel"] += 1
+                    return self._send(server._netfunnel(params), "text/javascript")
+
+                name = srt_routes.get(path) or korail_routes.get(path) or path
+                with server._lock:
+                    server.requests[name] += 1
+                if not server._allow(self.client_address[0]):
+                    return self._send(BLOCKED_MESSAGE, "text/html")
+
+                if name in korail_routes.values():
+                    return self._send(json.dumps(server._korail(name, params), ensure_ascii=False))
+                body, cookie = server._srt(name, params, self._session_token())
+                self._send(json.dumps(body, ensure_ascii=False), cookie=cookie)
+
+            do_GET = _dispatch
+            do_POST = _dispatch
+
+        return Handler
+
+    def _netfunnel(self, params: dict[str, str]) -> str:
+        opcode = params.get("opcode", "5101")
+        now = self._clock()
+        if opcode == "5101":  # getTidchkEnter
+            key, ready = self._netfunnel_issue(now)
+            nwait = self._netfunnel_waiting(key, now) or 0
+        elif opcode == "5002":  # chkEnter
+            key = params.get("key", "")
+            nwait = self._netfunnel_waiting(key, now)
+            if nwait is None:
+                key, ready = self._netfunnel_issue(now)
+                nwait = self._netfunnel_waiting(key, now) or 0
+        else:  # setComplete
+            key, nwait = params.get("key", ""), 0
+        status = "201" if nwait else "200"
+        tps = f"{self.netfunnel_tps:g}" if self.netfunnel_tps > 0 else "0"
+        return (
+            f"NetFunnel.gRtype={opcode};"
+            f"NetFunnel.gControl.result='5002:{status}:key={key}&nwait={nwait}&nnext={min(nwait, 1)}"
+            f"&tps={tps}&ttl={1 if nwait else 0}&ip=127.0.0.1&port=80';"
+            "NetFunnel.gControl._showResult();"
+        )
+
+    # ── SRT ─────────────────────────────────────────────────────────
+
+    def _srt(self, name: str, params: dict[str, str], token: str | None) -> tuple[dict, str | None]:
+        """(응답 JSON, 새로 발급한 세션 쿠키)"""
+        if name == "login":
+            user = params.get("srchDvNm", "")
+            return {"userMap": {"MB_CRD_NO": f"{zlib.crc32(user.encode()) % 10**10:010d}", "CUST_NM": "모의"}}, self._login(user)
+
+        user = self._user(token)
+        if name == "search_schedule":
+            if self.netfunnel_tps > 0 and not self._netfunnel_passed(params.get("netfunnelKey")):
+                return _srt_fail("NET000001", "유효하지 않은 접속 키입니다."), None
+            route = ("srt", params.get("dptRsStnCd", ""), params.get("arvRsStnCd", ""), params.get("dptDt", ""))
+            page = self._page(route, params.get("dptTm", "000000"))
+            if not page:
+                return _srt_fail("WRR800029", "조회 결과가 없습니다."), None
+            return {"resultMap": [_srt_ok()], "outDataSets": {"dsOutput1": [_srt_row(route, t) for t in page]}}, None
+
+        if user is None and name not in ("main", "logout"):
+            return _srt_fail("WRR800012", "로그인 후 사용하십시오."), None
+
+        if name == "reserve":
+            if self.netfunnel_tps > 0 and not self._netfunnel_passed(params.get("netfunnelKey")):
+                return _srt_fail("NET000001", "유효하지 않은 접속 키입니다."), None
+            route = ("srt", params.get("dptRsStnCd1", ""), params.get("arvRsStnCd1", ""), params.get("dptDt1", ""))
+            reservation = self._reserve(
+                user, route, int(params.get("trnNo1", "0") or 0),
+                special=params.get("psrmClCd1") == "2", count=int(params.get("totPrnb", "1") or 1),
+            )
+            if reservation is None:
+                return _srt_fail("WRR800028", "잔여석없음"), None
+            return {"resultMap": [_srt_ok()], "reservListMap": [{"pnrNo": reservation.pnr}]}, None
+
+        if name == "tickets":
+            with self._lock:
+                reservations = list(self._reservations.get(user, []))
+            return {
+                "resultMap": [_srt_ok()],
+                "trainListMap": [
+                    {"pnrNo": r.pnr, "rcvdAmt": str(r.count * 50000), "tkSpecNum": str(r.count)} for r in reservations
+                ],
+                "payListMap": [_srt_pay(r) for r in reservations],
+            }, None
+
+        if name == "ticket_info":
+            with self._lock:
+                reservation = next((r for r in self._reservations.get(user, []) if r.pnr == params.get("pnrNo")), None)
+            if reservation is None:
+                return _srt_fail("WRR800030", "예약 내역이 없습니다."), None
+            return {
+                "resultMap": [_srt_ok()],
+                "trainListMap": [
+                    {
+                        "scarNo": "5", "seatNo": f"{i + 1}A", "psrmClCd": "2" if reservation.special else "1",
+                        "psgTpCd": "1", "rcvdAmt": "50000", "stdrPrc": "50000", "dcntPrc": "0",
+                    }
+                    for i in range(reservation.count)
+                ],
+            }, None
+
+        if name == "cancel":
+            if not self._cancel(user, params.get("pnrNo", "")):
+                return _srt_fail("WRR800030", "예약 내역이 없습니다."), None
+
+        return {"resultMap": [_srt_ok()]}, None
+
+    # ── Korail ──────────────────────────────────────────────────────
+
+    def _korail(self, name: str, params: dict[str, str]) -> dict:
+        if name == "korail_code":
+            return {
+                "strResult": "SUCC",
+                "app.login.cphd": {"idx": "1", "key": "0123456789abcdef0123456789abcdef"},
+            }
+        if name == "korail_login":
+            user = params.get("txtMemberNo", "")
+            return {
+                **_korail_ok(),
+                "Key": self._login(user),
+                "strMbCrdNo": f"{zlib.crc32(user.encode()) % 10**10:010d}",
+                "strCustNm": "모의",
+                "strEmailAdr": "mock@example.com",
+            }
+        if name == "korail_search_schedule":
+            dep, arr = params.get("txtGoStart", ""), params.get("txtGoEnd", "")
+            with self._lock:
+                self._stations[_station_code(dep)] = dep
+                self._stations[_station_code(arr)] = arr
+            route = ("korail", dep, arr, params.get("txtGoAbrdDt", ""))
+            page = self._page(route, params.get("txtGoHour", "000000"))
+            if not page:
+                return _korail_fail("P100", "조회 결과가 없습니다.")
+            return {**_korail_ok(), "trn_infos": {"trn_info": [_korail_row(route, t) for t in page]}}
+
+        user = self._user(params.get("Key"))
+        if user is None and name != "korail_logout":
+            return _korail_fail("P058", "로그인 후 사용하십시오.")
+
+        if name == "korail_reserve":
+            with self._lock:
+                dep = self._stations.get(params.get("txtDptRsStnCd1", ""), "")
+                arr = self._stations.get(params.get("txtArvRsStnCd1", ""), "")
+            route = ("korail", dep, arr, params.get("txtDptDt1", ""))
+            reservation = self._reserve(
+                user, route, int(params.get("txtTrnNo1", "0") or 0),
+                special=params.get("txtPsrmClCd1") == "2", count=int(params.get("txtTotPsgCnt", "1") or 1),
+            )
+            if reservation is None:
+                return _korail_fail("ERR211161", "잔여석이 없습니다.")
+            return {**_korail_ok(), "h_pnr_no": reservation.pnr}
+
+        if name == "korail_reservations":
+            with self._lock:
+                reservations = list(self._reservations.get(user, []))
+            reservations = [r for r in reservations if r.route[0] == "korail"]
+            if not reservations:
+                return _korail_fail("P100", "예약 내역이 없습니다.")
+            return {
+                **_korail_ok(),
+                "jrny_infos": {
+                    "jrny_info": [
+                        {"train_infos": {"train_info": [_korail_reservation(r)]}} for r in reservations
+                    ]
+                },
+            }
+
+        if name in ("korail_tickets", "korail_ticket_info"):
+            return _korail_fail("P100", "조회 결과가 없습니다.")
+
+        if name == "korail_cancel":
+            if not self._cancel(user, params.get("txtPnrNo", "")):
+                return _korail_fail("P100", "예약 내역이 없습니다.")
+
+        return _korail_ok()
+
+
+def _srt_routes() -> dict[str, str]:
+    """URL 경로 → ``API_ENDPOINTS`` 이름"""
+    from SRT import constants
+
+    return {urlsplit(url).path: name for name, url in constants.API_ENDPOINTS.items()}
+
+
+def _korail_routes() -> dict[str, str]:
+    """URL 경로 → ``KORAIL_ENDPOINTS`` 이름"""
+    try:
+        from korail2 import korail2
+    except ImportError:  # pycryptodome 없이 SRT만 흉내 내는 경우
+        return {}
+    return {urlsplit(url).path: name for name, url in korail2.KORAIL_ENDPOINTS.items()}
+
+
+def _srt_ok() -> dict:
+    return {"strResult": "SUCC", "msgCd": "S000001", "msgTxt": "정상 처리되었습니다."}
+
+
+def _srt_fail(code: str, message: str) -> dict:
+    return {"resultMap": [{"strResult": "FAIL", "msgCd": code, "msgTxt": message}]}
+
+
+def _srt_row(route: tuple, train: _Train) -> dict:
+    row = make_train(train.dep_time, train.number, train.date)
+    row.update(
+        {
+            "dptRsStnCd": route[1],
+            "arvRsStnCd": route[2],
+            "arvTm": train.arr_time,
+            "gnrmRsvPsbStr": "예약가능" if train.general else "매진",
+            "sprmRsvPsbStr": "예약가능" if train.special else "매진",
+        }
+    )
+    return row
+
+
+def _srt_pay(reservation: _Reservation) -> dict:
+    train = reservation.train
+    return {
+        "stlbTrnClsfCd": "17",
+        "trnNo": f"{train.number:05d}",
+        "dptDt": train.date,
+        "dptTm": train.dep_time,
+        "dptRsStnCd": reservation.route[1],
+        "arvTm": train.arr_time,
+        "arvRsStnCd": reservation.route[2],
+        "iseLmtDt": train.date,
+        "iseLmtTm": "235959",
+        "stlFlg": "N",
+    }
+
+
+def _korail_ok() -> dict:
+    return {"strResult": "SUCC", "h_msg_cd": "IRZ000001", "h_msg_txt": "정상 처리되었습니다."}
+
+
+def _korail_fail(code: str, message: str) -> dict:
+    return {"strResult": "FAIL", "h_msg_cd": code, "h_msg_txt": message}
+
+
+def _korail_row(route: tuple, train: _Train) -> dict:
+    _, dep, arr, date = route
+    return {
+        "h_trn_clsf_cd": "00",
+        "h_trn_clsf_nm": "KTX",
+        "h_trn_gp_cd": "100",
+        "h_trn_no": f"{train.number:05d}",
+        "h_expct_dlay_hr": "0000",
+        "h_dpt_rs_stn_nm": dep,
+        "h_dpt_rs_stn_cd": _station_code(dep),
+        "h_dpt_dt": date,
+        "h_dpt_tm": train.dep_time,
+        "h_arv_rs_stn_nm": arr,
+        "h_arv_rs_stn_cd": _station_code(arr),
+        "h_arv_dt": date,
+        "h_arv_tm": train.arr_time,
+        "h_run_dt": date,
+        "h_rsv_psb_flg": "Y" if train.general or train.special else "N",
+        "h_rsv_psb_nm": "예약가능" if train.general or train.special else "매진",
+        "h_spe_rsv_cd": "11" if train.special else "13",
+        "h_gen_rsv_cd": "11" if train.general else "13",
+        "h_wait_rsv_flg": "-2" if train.general else "0",
+    }
+
+
+def _korail_reservation(reservation: _Reservation) -> dict:
+    row = _korail_row(reservation.route, reservation.train)
+    return {
+        # 예약 조회 결과에는 잔여석 필드가 없음
+        **{name: value for name, value in row.items() if not name.startswith(("h_rsv_psb", "h_spe", "h_gen", "h_wait"))},
+        "h_pnr_no": reservation.pnr,
+        "h_tot_seat_cnt": f"{reservation.count:03d}",
+        "h_ntisu_lmt_dt": reservation.train.date,
+        "h_ntisu_lmt_tm": "235959",
+        "h_rsv_amt": f"{reservation.count * 50000:08d}",
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", type=float, default=0.05, help="요청당 지연 (초)")
+    parser.add_argument("--trains", type=int, default=60, help="노선/날짜별 열차 수")
+    parser.add_argument("--sold-out", type=float, default=0.7, help="처음부터 매진인 열차 비율")
+    parser.add_argument("--seats", type=int, default=2, help="매진이 아닌 열차의 최대 잔여석")
+    parser.add_argument("--release-rate", type=float, default=0.2, help="초당 평균 취소표 수")
+    parser.add_argument("--netfunnel-tps", type=float, default=0, help="초당 통과시킬 NetFunnel 키 수 (0: 대기열 없음)")
+    parser.add_argument("--rate-limit", type=float, default=0, help="IP별 초당 요청 수 상한 (0: 제한 없음)")
+    parser.add_argument("--burst", type=int, default=None, help="순간적으로 허용할 요청 수 (기본값: --rate-limit)")
+    parser.add_argument("--block-time", type=float, default=60, help="요청 제한을 넘은 IP를 차단할 시간 (초)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    server = MockServer(
+        host=args.host,
+        port=args.port,
+        latency=args.latency,
+        trains=args.trains,
+        sold_out=args.sold_out,
+        seats=args.seats,
+        release_rate=args.release_rate,
+        netfunnel_tps=args.netfunnel_tps,
+        rate_limit=args.rate_limit,
+        burst=args.burst,
+        block_time=args.block_time,
+        seed=args.seed,
+    )
+    print(f"mock server: {server.base_url}")
+    print(" ".join(f"{name}={value}" for name, value in server.environ().items()))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server._server.server_close()
+        print(json.dumps(server.stats(), ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""NetFunnelResponse.parse: 단일 패스 파서 vs 이전 파서
+
+    python -m benchmarks.netfunnel_parse --number 20000 --repeat 5
+"""
+
+import argparse
+import timeit
+
+from SRT.errors import SRTNetFunnelError
+from SRT.netfunnel import NetFunnelResponse
+
+# 실제 응답 형식 (키와 IP만 바꿈)
+RESPONSES = {
+    "5101 pass": (
+        "NetFunnel.gRtype=5101;"
+        "NetFunnel.gControl.result='5002:200:key=A1B2C3D4E5F60718293A4B5C6D7E8F90"
+        "&nwait=0&nnext=0&tps=0&ttl=0&ip=nf.letskorail.com&port=443';"
+        "NetFunnel.gControl._showResult();"
+    ),
+    "5101 wait": (
+        "NetFunnel.gRtype=5101;"
+        "NetFunnel.gControl.result='5002:201:key=A1B2C3D4E5F60718293A4B5C6D7E8F90"
+        "&nwait=1532&nnext=48&tps=11.247706&ttl=1&ip=nf.letskorail.com&port=443';"
+        "NetFunnel.gControl._showResult();"
+    ),
+    "5002 wait": (
+        "NetFunnel.gRtype=5002;"
+        "NetFunnel.gControl.result='5002:201:key=A1B2C3D4E5F60718293A4B5C6D7E8F90"
+        "&nwait=37&nnext=1021&tps=12.5&ttl=1&ip=nf.letskorail.com&port=443';"
+        "NetFunnel.gControl._showResult();"
+    ),
+    "5004 pass": (
+        "NetFunnel.gRtype=5004;"
+        "NetFunnel.gControl.result='5004:200:key=A1B2C3D4E5F60718293A4B5C6D7E8F90"
+        "&ip=nf.letskorail.com&port=443';"
+        "NetFunnel.gControl._showResult();"
+    ),
+    "5004 done": (
+        "NetFunnel.gRtype=5004;"
+        "NetFunnel.gControl.result='5004:502:msg=\"Already Completed\"';"
+        "NetFunnel.gControl._showResult();"
+    ),
+}
+
+
+def legacy_parse(response: str) -> dict[str, str]:
+    """비교용: 단일 패스로 바꾸기 전의 NetFunnelResponse.parse"""
+    cls = NetFunnelResponse
+    top_level_keys = [r.strip() for r in response.split(";")]
+
+    data: dict[str, str] = {}
+    for top_level_key in top_level_keys:
+        if top_level_key.startswith(cls.OP_CODE_KEY):
+            data["opcode"] = top_level_key[len(cls.OP_CODE_KEY) + 1 :]
+
+        if top_level_key.startswith(cls.RESULT_KEY):
+            results = top_level_key[len(cls.RESULT_KEY) + 1 :].strip("'").split(":")
+
+            if len(results) != 3:
+                raise SRTNetFunnelError(f"Invalid NetFunnel response format: {response}")
+
+            code, status, result = results
+            data["next_code"] = code
+            data["status"] = status
+
+            for key in result.split("&"):
+                for subkey in cls.RESULT_SUBKEYS:
+                    if key.startswith(subkey):
+                        data[subkey] = key.split("=")[1]
+                        break
+
+    return data
+
+
+def best_ops(fn, response: str, number: int, repeat: int) -> float:
+    best = min(timeit.repeat(lambda: fn(response), number=number, repeat=repeat))
+    return number / best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=20000, help="측정 1회당 파싱 횟수")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'response':<12}{'legacy ops/s':>15}{'new ops/s':>15}{'speedup':>9}")
+    for name, response in RESPONSES.items():
+        assert NetFunnelResponse.parse(response).data == legacy_parse(response), name
+
+        legacy = best_ops(legacy_parse, response, args.number, args.repeat)
+        new = best_ops(NetFunnelResponse.parse, response, args.number, args.repeat)
+        print(f"{name:<12}{legacy:>15,.0f}{new:>15,.0f}{new / legacy:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
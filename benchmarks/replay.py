@@ -0,0 +1,153 @@
+"""녹화된 응답으로 search_train / reserve / 예약 매크로 한 사이클을 오프라인에서 측정
+
+    python -m benchmarks.replay record srt_session.jsonl.gz      # 모의 서버와의 요청/응답을 녹화
+    python -m benchmarks.replay run srt_session.jsonl.gz --latency recorded --repeat 20
+
+실제 서버의 녹화는 웹 앱을 HTTP_RECORD_FILE=srt_session.jsonl.gz 로 실행해 로그인 → 검색 → 예약 매크로를
+한 번 돌려서 만듭니다. run 은 녹화의 첫 검색 요청(출발/도착역, 날짜, 시각)으로 검색하고,
+찾은 열차 중 일반실이 있는 첫 열차로 예약과 웹 앱의 예약 매크로(srt_main_web._reservation_macro)를
+반복합니다. 매크로의 사이클 사이 대기는 뺍니다.
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def record(args) -> None:
+    from SRT import SRT, Recorder, SRTError, TransportConfig
+
+    from ._mock_srt import MockSRTServer, point_client_at
+
+    recorder = Recorder(args.path)
+    with MockSRTServer(latency=args.mock_latency) as server:
+        srt = SRT("bench", "bench", auto_login=False, transport=TransportConfig(recorder=recorder))
+        point_client_at(srt, server.base_url)
+        srt.login()
+        trains = srt.search_train("수서", "부산", "20250101", "000000", available_only=False)
+        for _ in range(3):
+            try:
+                srt.reserve(trains[1])
+            except SRTError:
+                pass
+    recorder.close()
+    print(f"recorded {recorder.count} requests to {args.path}")
+
+
+def search_params(path: str) -> tuple[str, str, str, str]:
+    """녹화의 첫 검색 요청의 (출발역, 도착역, 날짜, 시각)"""
+    from SRT.constants import API_ENDPOINTS, STATION_NAME
+    from SRT.recording import read_recording
+
+    path_suffix = API_ENDPOINTS["search_schedule"].rsplit("/", 1)[-1]
+    for entry in read_recording(path):
+        if entry["url"].endswith(path_suffix):
+            form = dict(entry["form"])
+            return (
+                STATION_NAME[form["dptRsStnCd"]],
+                STATION_NAME[form["arvRsStnCd"]],
+                form["dptDt"],
+                form["dptTm"],
+            )
+    sys.exit("recording has no search_schedule request")
+
+
+def measure(fn, repeat: int) -> list[float]:
+    elapsed = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        elapsed.append(time.perf_counter() - started)
+    return elapsed
+
+
+def run(args) -> None:
+    latency = "recorded" if args.latency == "recorded" else str(float(args.latency))
+    path = os.path.abspath(args.path)
+
+    # 웹 앱은 import 할 때 녹화/재생 설정을 환경 변수에서 읽음.
+    # 앱 로그 파일(srt_app.log)이 저장소에 쌓이지 않도록 별도 작업 디렉터리에서 import
+    os.environ["HTTP_REPLAY_FILE"] = path
+    os.environ["HTTP_REPLAY_LATENCY"] = latency
+    os.chdir(tempfile.mkdtemp(prefix="replay"))
+    sys.path.insert(0, ROOT)
+    import srt_main_web as web
+    from SRT import SRT, SRTError
+    from SRT.seat_type import SeatType
+
+    from ._mock_srt import NoWaitJob, selection
+
+    dep, arr, date, dep_time = search_params(path)
+    srt = SRT("bench", "bench", transport=web.TRANSPORT)
+    trains = srt.search_train(dep, arr, date, dep_time, available_only=False)
+    if not trains:
+        sys.exit("replayed search returned no trains")
+    train = next((t for t in trains if t.general_seat_available()), trains[0])
+
+    def reserve() -> None:
+        try:
+            srt.reserve(train)
+        except SRTError:
+            pass
+
+    selected = [selection(train)]
+
+    def macro_cycles() -> list[float]:
+        # 선택 열차가 하나이므로 "[" 로 시작하는 진행 메시지 하나가 한 사이클
+        elapsed = []
+        while len(elapsed) < args.repeat:
+            job = NoWaitJob("bench", "bench")
+            started = time.perf_counter()
+            for message in web._reservation_macro(job, "bench", "bench", selected, SeatType.GENERAL_FIRST):
+                if message.startswith("["):
+                    elapsed.append(time.perf_counter() - started)
+                    started = time.perf_counter()
+                    if len(elapsed) >= args.repeat:
+                        job.cancel()
+        return elapsed
+
+    results = {
+        "search_train": measure(
+            lambda: srt.search_train(dep, arr, date, dep_time, available_only=False), args.repeat
+        ),
+        "reserve": measure(reserve, args.repeat),
+        "macro cycle": macro_cycles(),
+    }
+
+    print(f"recording: {len(web.REPLAY)} responses, latency {latency}, "
+          f"search {dep}→{arr} {date} {dep_time}, train {train.train_number}")
+    print(f"{'benchmark':<14}{'median(ms)':>12}{'p95(ms)':>10}{'runs':>6}")
+    for name, elapsed in results.items():
+        ordered = sorted(elapsed)
+        p95 = ordered[min(len(ordered) - 1, int(0.95 * len(ordered)))]
+        print(f"{name:<14}{statistics.median(elapsed) * 1000:>12.2f}{p95 * 1000:>10.2f}{len(elapsed):>6}")
+    print(f"replayed {web.REPLAY.served} responses ({web.REPLAY.missed} without an exact match)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    recording = commands.add_parser("record", help="모의 서버와의 요청/응답을 녹화")
+    recording.add_argument("path")
+    recording.add_argument("--mock-latency", type=float, default=0.02, help="모의 서버 요청당 지연 (초)")
+
+    replaying = commands.add_parser("run", help="녹화된 응답으로 측정")
+    replaying.add_argument("path")
+    replaying.add_argument("--latency", default="0", help="응답마다 기다릴 초, recorded 이면 녹화된 응답 시간")
+    replaying.add_argument("--repeat", type=int, default=20)
+
+    args = parser.parse_args()
+    if args.command == "record":
+        record(args)
+    else:
+        run(args)
+
+
+if __name__ == "__main__":
+    main()
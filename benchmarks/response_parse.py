@@ -0,0 +1,100 @@
+"""SRTResponseData: 응답 해석과 데이터 접근 (json/orjson, 복사 vs 뷰)
+
+    python -m benchmarks.response_parse --number 2000 --repeat 5
+"""
+
+import argparse
+import json
+import timeit
+
+from SRT import response_data
+from SRT.response_data import SRTResponseData
+
+from ._mock_srt import make_schedule
+
+SUCCESS = [{"strResult": "SUCC", "msgCd": "S000001", "msgTxt": "정상적으로 조회 되었습니다."}]
+
+
+def search_page(count: int) -> str:
+    return json.dumps(
+        {"resultMap": SUCCESS, "outDataSets": {"dsOutput1": make_schedule(count)}},
+        ensure_ascii=False,
+    )
+
+
+def reservations_page(count: int) -> str:
+    train = {"pnrNo": "0000000000", "rcvdAmt": "52600", "tkSpecNum": "1"}
+    pay = {
+        "stlbTrnClsfCd": "17",
+        "trnNo": "00301",
+        "dptDt": "20250101",
+        "dptTm": "050000",
+        "dptRsStnCd": "0551",
+        "arvTm": "073000",
+        "arvRsStnCd": "0020",
+        "iseLmtDt": "20250101",
+        "iseLmtTm": "120000",
+        "stlFlg": "N",
+    }
+    return json.dumps(
+        {"resultMap": SUCCESS, "trainListMap": [train] * count, "payListMap": [pay] * count},
+        ensure_ascii=False,
+    )
+
+
+def legacy_search(text: str):
+    # 이전 방식: stdlib json + get_all() 복사
+    parser = SRTResponseData(text)
+    return parser.get_all()["outDataSets"]["dsOutput1"]
+
+
+def view_search(text: str):
+    return SRTResponseData(text).out_data()
+
+
+def legacy_reservations(text: str):
+    parser = SRTResponseData(text)
+    return parser.get_all()["trainListMap"], parser.get_all()["payListMap"]
+
+
+def view_reservations(text: str):
+    parser = SRTResponseData(text)
+    return parser.train_list(), parser.pay_list()
+
+
+def measure(fn, text: str, loads, number: int, repeat: int) -> float:
+    original = response_data.json_loads
+    response_data.json_loads = loads
+    try:
+        best = min(timeit.repeat(lambda: fn(text), number=number, repeat=repeat))
+    finally:
+        response_data.json_loads = original
+    return number / best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=2000, help="측정 1회당 해석 횟수")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    cases = [
+        ("search x10", search_page(10), legacy_search, view_search),
+        ("search x200", search_page(200), legacy_search, view_search),
+        ("reserv x50", reservations_page(50), legacy_reservations, view_reservations),
+    ]
+
+    print(f"backend: {response_data.JSON_BACKEND}")
+    print(f"{'response':<14}{'bytes':>9}{'legacy/s':>12}{'json view/s':>13}{'fast view/s':>13}{'speedup':>9}")
+    for name, text, legacy, view in cases:
+        base = measure(legacy, text, json.loads, args.number, args.repeat)
+        stdlib = measure(view, text, json.loads, args.number, args.repeat)
+        fast = measure(view, text, response_data.json_loads, args.number, args.repeat)
+        print(
+            f"{name:<14}{len(text.encode()):>9}{base:>12,.0f}{stdlib:>13,.0f}"
+            f"{fast:>13,.0f}{fast / base:>9.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
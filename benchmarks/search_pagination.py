@@ -0,0 +1,54 @@
+"""하루 전체 검색: 순차 페이지 조회 vs 구간 병렬 조회
+
+    python -m benchmarks.search_pagination --latency 0.05 --trains 120 --repeat 5
+"""
+
+import argparse
+import statistics
+import time
+
+from SRT import SRT
+
+from ._mock_srt import MockSRTServer, make_schedule, point_client_at
+
+
+def run(srt: SRT, server: MockSRTServer, repeat: int, **kwargs) -> tuple[float, int, int]:
+    elapsed = []
+    for _ in range(repeat):
+        server.reset()
+        started = time.perf_counter()
+        trains = srt.search_train(
+            "수서", "부산", "20250101", "000000", available_only=False, **kwargs
+        )
+        elapsed.append(time.perf_counter() - started)
+    return statistics.median(elapsed), server.requests, len(trains)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--latency", type=float, default=0.05, help="요청당 지연 (초)")
+    parser.add_argument("--trains", type=int, default=120, help="하루 열차 수")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--slices", type=int, nargs="+", default=[2, 4, 8, 12])
+    args = parser.parse_args()
+
+    with MockSRTServer(make_schedule(args.trains), latency=args.latency) as server:
+        srt = SRT("bench", "bench", auto_login=False)
+        point_client_at(srt, server.base_url)
+
+        baseline, requests, count = run(srt, server, args.repeat)
+        print(f"{'mode':<12}{'median(ms)':>12}{'requests':>10}{'trains':>8}{'speedup':>9}")
+        print(f"{'serial':<12}{baseline * 1000:>12.1f}{requests:>10}{count:>8}{1:>9.2f}")
+
+        for slices in args.slices:
+            median, requests, count = run(
+                srt, server, args.repeat, parallel_slices=slices
+            )
+            print(
+                f"{f'slices={slices}':<12}{median * 1000:>12.1f}{requests:>10}"
+                f"{count:>8}{baseline / median:>9.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+"""SSE 부하 테스트: serve.py 로 실행한 SRT 앱에 예약 스트림 N개를 동시에 연결
+
+    python -m benchmarks.sse_load --streams 300 --duration 20
+
+모의 SRT 서버를 띄우고, serve.py 로 SRT 앱을 별도 프로세스에서 실행해 모의 서버로 요청하게 합니다.
+클라이언트마다 다른 계정으로 로그인 → 검색 → 열차 선택 → /start_reservation 스트림을 엽니다.
+모의 서버는 예약에 항상 잔여석없음을 반환하므로 매크로가 계속 돌며 진행 메시지를 보냅니다.
+모든 스트림이 연결된 뒤 --duration 초 동안 유지하고, 앱에 SIGTERM을 보내 모든 스트림이 end 이벤트로
+끝나는 데 걸린 시간을 잽니다. 로그인/검색 페이지는 CPU를 쓰므로 --ramp 초에 걸쳐 나눠 연결할 수 있습니다.
+"""
+
+import argparse
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def run_server(args) -> None:
+    # 자식 프로세스: 앱을 import 하기 전에 gevent 패치
+    import serve
+
+    serve.patch()
+    module = serve.load_app("srt", args.macro_workers)
+
+    from ._mock_srt import point_at
+
+    point_at(args.serve)
+    serve.serve(module, "127.0.0.1", args.port, args.connections, args.grace)
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def percentile(values: list[float], q: float) -> float:
+    if not values:
+        return float("nan")
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+
+async def open_stream(base_url: str, index: int, result: dict, delay: float) -> None:
+    import asyncio
+
+    import aiohttp
+
+    await asyncio.sleep(delay)
+
+    jar = aiohttp.CookieJar(unsafe=True)
+    timeout = aiohttp.ClientTimeout(total=None, sock_connect=30)
+    async with aiohttp.ClientSession(base_url, cookie_jar=jar, timeout=timeout) as http:
+        started = time.perf_counter()
+        try:
+            for path, data in (
+                ("/", {"srt_id": f"load{index:05d}", "srt_pw": "pw"}),
+                ("/", {"dep": "수서", "arr": "부산", "date": "2025-01-01", "time": "08:00"}),
+                ("/reserve_select", {"train_indices[]": "0", "reserve_option": "GENERAL_FIRST"}),
+            ):
+                async with http.post(path, data=data) as resp:
+                    resp.raise_for_status()
+                    await resp.read()
+            result["setup"] = time.perf_counter() - started
+
+            async with http.get("/start_reservation") as resp:
+                resp.raise_for_status()
+                async for line in resp.content:
+                    if line.startswith(b"data:"):
+                        if "first_event" not in result:
+                            result["first_event"] = time.perf_counter() - started
+                            result["connected"].set()
+                        result["events"] = result.get("events", 0) + 1
+                    elif line.startswith(b": heartbeat"):
+                        result["heartbeats"] = result.get("heartbeats", 0) + 1
+                    elif line.startswith(b"event: end"):
+                        result["ended"] = time.perf_counter()
+        except Exception as e:
+            result["error"] = f"{type(e).__name__}: {e}"
+        finally:
+            result["connected"].set()
+
+
+async def run_clients(base_url: str, args, server: subprocess.Popen) -> tuple[list[dict], float]:
+    import asyncio
+
+    results = [{"connected": asyncio.Event()} for _ in range(args.streams)]
+    tasks = [
+        asyncio.create_task(
+            open_stream(base_url, i, results[i], args.ramp * i / args.streams)
+        )
+        for i in range(args.streams)
+    ]
+
+    # 모든 스트림이 첫 메시지를 받은 뒤(또는 실패한 뒤) duration 초 동안 유지
+    await asyncio.gather(*(result["connected"].wait() for result in results))
+    await asyncio.sleep(args.duration)
+    stop_started = time.perf_counter()
+    server.terminate()
+    await asyncio.wait(tasks, timeout=args.grace + 30)
+    for task in tasks:
+        task.cancel()
+    return results, stop_started
+
+
+def wait_ready(base_url: str, server: subprocess.Popen, timeout: float = 30) -> None:
+    import urllib.request
+
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            sys.exit(f"server exited with {server.returncode}")
+        try:
+            urllib.request.urlopen(f"{base_url}/jobs", timeout=1).read()
+            return
+        except OSError:
+            time.sleep(0.2)
+    sys.exit("server did not start")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--streams", type=int, default=200, help="동시 SSE 스트림 수")
+    parser.add_argument("--duration", type=float, default=15,
+                        help="모든 스트림이 연결된 뒤 유지할 시간 (초)")
+    parser.add_argument("--ramp", type=float, default=0, help="클라이언트 연결을 나눠 시작할 시간 (초)")
+    parser.add_argument("--latency", type=float, default=0.05, help="모의 서버 요청당 지연 (초)")
+    parser.add_argument("--connections", type=int, default=1000, help="serve.py --connections")
+    parser.add_argument("--macro-workers", type=int, default=None,
+                        help="serve.py --macro-workers (기본값: --streams)")
+    parser.add_argument("--grace", type=float, default=5, help="serve.py --grace")
+    parser.add_argument("--verbose", action="store_true", help="앱 로그 출력")
+    parser.add_argument("--serve", metavar="MOCK_URL", help=argparse.SUPPRESS)
+    parser.add_argument("--port", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.serve:
+        run_server(args)
+        return
+
+    import asyncio
+
+    from ._mock_srt import MockSRTServer
+
+    with MockSRTServer(latency=args.latency) as mock:
+        port = free_port()
+        base_url = f"http://127.0.0.1:{port}"
+        workdir = tempfile.mkdtemp(prefix="sse_load")
+        command = [
+            sys.executable, "-m", "benchmarks.sse_load",
+            "--serve", mock.base_url, "--port", str(port),
+            "--connections", str(args.connections),
+            "--macro-workers", str(args.macro_workers or args.streams),
+            "--grace", str(args.grace),
+        ]
+        output = None if args.verbose else subprocess.DEVNULL
+        # 앱 로그 파일(srt_app.log)이 저장소에 쌓이지 않도록 별도 작업 디렉터리에서 실행
+        server = subprocess.Popen(
+            command, cwd=workdir, stdout=output, stderr=output,
+            env={**os.environ, "PYTHONPATH": ROOT},
+        )
+        try:
+            wait_ready(base_url, server)
+            results, stop_started = asyncio.run(run_clients(base_url, args, server))
+            server.wait(timeout=args.grace + 30)
+            exited = time.perf_counter() - stop_started
+        finally:
+            if server.poll() is None:
+                server.kill()
+        requests = mock.requests
+
+    ok = [r for r in results if "error" not in r and "first_event" in r]
+    errors = [r["error"] for r in results if "error" in r]
+    ended = [r["ended"] - stop_started for r in results if "ended" in r]
+    setup = [r["setup"] for r in ok]
+    first = [r["first_event"] for r in ok]
+
+    print(f"streams: {args.streams}, connected: {len(ok)}, errors: {len(errors)}")
+    print(f"setup (login+search+select) ms  p50 {percentile(setup, 0.5) * 1000:8.1f}"
+          f"  p95 {percentile(setup, 0.95) * 1000:8.1f}")
+    print(f"first event ms                  p50 {percentile(first, 0.5) * 1000:8.1f}"
+          f"  p95 {percentile(first, 0.95) * 1000:8.1f}")
+    print(f"events/stream                   p50 {percentile([r.get('events', 0) for r in ok], 0.5):8.0f}"
+          f"  heartbeats {sum(r.get('heartbeats', 0) for r in ok)}")
+    print(f"mock backend requests: {requests}")
+    print(f"shutdown: streams ended {len(ended)}/{len(ok)}, last end {max(ended, default=0):.2f}s,"
+          f" server exit {exited:.2f}s (code {server.returncode})")
+    for error in sorted(set(errors))[:5]:
+        print(f"  error: {error}")
+
+
+if __name__ == "__main__":
+    main()
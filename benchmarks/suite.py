@@ -0,0 +1,315 @@
+"""핫 패스 벤치마크 모음: JSON 기준선 저장과 성능 저하 검사
+
+    python -m benchmarks.suite run --output baseline.json          # 측정해서 기준선으로 저장
+    python -m benchmarks.suite compare baseline.json               # 지금 측정해서 기준선과 비교
+    python -m benchmarks.suite compare baseline.json current.json --threshold 0.3
+
+compare 는 어느 벤치마크든 기준선보다 ``--threshold`` (비율) 넘게 느려지면 종료 코드 1로 끝납니다.
+``-k`` 로 이름에 그 문자열이 들어간 벤치마크만 실행합니다.
+
+기준선은 같은 기기, 같은 Python, 같은 JSON 백엔드(orjson 유무)에서 측정한 것과 비교해야 의미가 있습니다.
+다른 작업과 CPU를 나눠 쓰는 기기에서는 프로세스마다 10~20% 차이가 나므로 ``--threshold`` 를 더 크게 줍니다.
+각 벤치마크는 0.2초 이상 걸리도록 반복 횟수를 정해 ``--repeat`` 번 측정하고 가장 빠른 값을 씁니다.
+검색과 매크로는 :class:`MockTransport` 로 소켓 없이 응답을 받아 클라이언트 코드만의 시간을 잽니다.
+"""
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import sys
+import tempfile
+import timeit
+from typing import Callable
+
+from SRT import SRT, SRTError
+from SRT import response_data
+from SRT.netfunnel import NetFunnelHelper, NetFunnelResponse
+from SRT.passenger import Adult, Child, Passenger, Senior
+from SRT.response_data import SRTResponseData
+from SRT.train import SRTTrain
+
+from ._mock_srt import MockTransport, NoWaitJob, make_schedule, selection
+from .netfunnel_parse import RESPONSES
+from .response_parse import reservations_page, search_page
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 하루 전체 검색에 쓸 열차 수 (10개씩 13페이지)
+DAY_TRAINS = 120
+
+BENCHMARKS: dict[str, Callable[[], Callable[[], object]]] = {}
+
+
+def benchmark(name: str):
+    """측정할 함수를 만들어 반환하는 준비 함수를 ``name`` 으로 등록합니다."""
+
+    def register(setup):
+        BENCHMARKS[name] = setup
+        return setup
+
+    return register
+
+
+@benchmark("response_data.search_x10")
+def _():
+    text = search_page(10)
+    return lambda: SRTResponseData(text).out_data()
+
+
+@benchmark("response_data.reservations_x50")
+def _():
+    text = reservations_page(50)
+
+    def parse():
+        data = SRTResponseData(text)
+        return data.train_list(), data.pay_list()
+
+    return parse
+
+
+@benchmark("srt_train.page_x10")
+def _():
+    rows = SRTResponseData(search_page(10)).out_data()
+    return lambda: [SRTTrain(row) for row in rows]
+
+
+@benchmark("netfunnel.parse_wait")
+def _():
+    text = RESPONSES["5002 wait"]
+    return lambda: NetFunnelResponse.parse(text)
+
+
+@benchmark("netfunnel.parse_done")
+def _():
+    text = RESPONSES["5004 done"]
+    return lambda: NetFunnelResponse.parse(text)
+
+
+@benchmark("passenger.combine")
+def _():
+    passengers = [Adult(), Child(), Adult(2), Senior(), Child()]
+    return lambda: Passenger.combine(passengers)
+
+
+@benchmark("passenger.get_passenger_dict")
+def _():
+    passengers = Passenger.combine([Adult(2), Child(), Senior()])
+    return lambda: Passenger.get_passenger_dict(passengers, special_seat=False, window_seat=None)
+
+
+@benchmark("korail.train_x10")
+def _():
+    from korail2.korail2 import Train
+
+    rows = json.loads(json.dumps(korail_rows(10), ensure_ascii=False))
+    return lambda: [Train(row) for row in rows]
+
+
+@benchmark("korail.passenger_reduce")
+def _():
+    from korail2.korail2 import AdultPassenger, ChildPassenger, Passenger as KorailPassenger
+
+    passengers = [AdultPassenger(), AdultPassenger(2), ChildPassenger(), ChildPassenger()]
+    return lambda: KorailPassenger.reduce(passengers)
+
+
+@benchmark("search.full_day")
+def _():
+    transport = MockTransport(schedule=make_schedule(DAY_TRAINS), metrics=None)
+    srt = SRT(
+        "bench", "bench", auto_login=False, verbose=False,
+        transport=transport, netfunnel_helper=NetFunnelHelper(transport=transport),
+    )
+
+    def search():
+        trains = srt.search_train("수서", "부산", "20250101", "000000", available_only=False)
+        assert len(trains) == DAY_TRAINS, len(trains)
+
+    return search
+
+
+@benchmark("macro.cycle")
+def _():
+    """웹 앱의 예약 매크로(srt_main_web._reservation_macro)에서 열차 하나의 검색 + 예약 시도 한 사이클
+
+    매크로는 잔여석이 있는 열차만 예약을 시도하므로 검색 결과에 잔여석이 있는 열차를 고릅니다.
+    (모의 서버의 예약은 항상 잔여석없음으로 실패)
+    """
+    web = import_web_app()
+    from SRT.client_pool import ClientPool
+    from SRT.netfunnel import NetFunnelKeyManager
+    from SRT.seat_type import SeatType
+
+    transport = MockTransport(schedule=make_schedule(DAY_TRAINS), metrics=None)
+    netfunnel = NetFunnelKeyManager(transport=transport, complete_mode="background")
+    web.CLIENT_POOL = ClientPool.for_srt(
+        search_cache=web.SEARCH_CACHE, transport=transport, netfunnel_helper=netfunnel,
+    )
+    trains = [SRTTrain(row) for row in make_schedule(DAY_TRAINS)]
+    train = next(t for t in trains[DAY_TRAINS // 2:] if t.seat_available())
+    job = NoWaitJob("bench", "bench")
+    macro = web._reservation_macro(job, "bench", "bench", [selection(train)], SeatType.GENERAL_FIRST)
+    next(macro)  # "▶ 예약 시작"
+
+    def cycle():
+        # 선택 열차가 하나이므로 "[" 로 시작하는 진행 메시지 하나가 한 사이클
+        for message in macro:
+            if message.startswith("["):
+                assert "매진" in message, message
+                return
+        raise SRTError("macro stopped")
+
+    return cycle
+
+
+def korail_rows(count: int) -> list[dict]:
+    """``count`` 개의 Korail 검색 결과 행 (``h_*`` 필드)"""
+    rows = []
+    for i in range(count):
+        dep = 5 * 3600 + i * 20 * 60
+        arr = dep + 2 * 3600 + 30 * 60
+        rows.append({
+            "h_trn_clsf_cd": "00",
+            "h_trn_clsf_nm": "KTX",
+            "h_trn_gp_cd": "100",
+            "h_trn_no": f"{101 + i:05d}",
+            "h_expct_dlay_hr": "0000",
+            "h_dpt_rs_stn_nm": "서울",
+            "h_dpt_rs_stn_cd": "0001",
+            "h_dpt_dt": "20250101",
+            "h_dpt_tm": f"{dep // 3600:02d}{dep // 60 % 60:02d}00",
+            "h_arv_rs_stn_nm": "부산",
+            "h_arv_rs_stn_cd": "0020",
+            "h_arv_dt": "20250101",
+            "h_arv_tm": f"{arr // 3600:02d}{arr // 60 % 60:02d}00",
+            "h_run_dt": "20250101",
+            "h_rsv_psb_flg": "Y" if i % 3 else "N",
+            "h_rsv_psb_nm": "예약가능" if i % 3 else "매진",
+            "h_spe_rsv_cd": "13",
+            "h_gen_rsv_cd": "11" if i % 3 else "13",
+            "h_wait_rsv_flg": "-2" if i % 3 else "9",
+        })
+    return rows
+
+
+def import_web_app():
+    # 매크로가 실제처럼 사이클마다 검색하도록 검색 캐시를 끔 (실제 사이클 간격 1초 ≥ 캐시 TTL).
+    # 앱 로그 파일(srt_app.log)이 저장소에 쌓이지 않도록 별도 작업 디렉터리에서 import
+    os.environ.setdefault("SEARCH_CACHE_TTL", "0")
+    cwd = os.getcwd()
+    os.chdir(tempfile.mkdtemp(prefix="bench"))
+    try:
+        if ROOT not in sys.path:
+            sys.path.insert(0, ROOT)
+        import srt_main_web
+    finally:
+        os.chdir(cwd)
+    return srt_main_web
+
+
+def measure(setup, repeat: int) -> dict:
+    """가장 빠른 측정의 1회당 시간 (초)"""
+    timer = timeit.Timer(setup())
+    number, _ = timer.autorange()
+    best = min(timer.repeat(repeat=repeat, number=number))
+    return {"seconds": best / number, "number": number, "repeat": repeat}
+
+
+def run_all(repeat: int, pattern: str | None = None) -> dict:
+    results = {}
+    for name, setup in BENCHMARKS.items():
+        if pattern and pattern not in name:
+            continue
+        results[name] = measure(setup, repeat)
+        print(f"{name:<34}{results[name]['seconds'] * 1e6:>12.2f} us", file=sys.stderr)
+    return {
+        "created": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "json_backend": response_data.JSON_BACKEND,
+        "results": results,
+    }
+
+
+def compare(baseline: dict, current: dict, threshold: float) -> list[str]:
+    """표를 출력하고 기준선보다 ``threshold`` 넘게 느려진 벤치마크 이름을 반환합니다."""
+    for key in ("python", "json_backend"):
+        if baseline.get(key) != current.get(key):
+            print(f"warning: {key} differs (baseline {baseline.get(key)}, current {current.get(key)})")
+
+    regressed = []
+    print(f"{'benchmark':<34}{'baseline(us)':>14}{'current(us)':>13}{'change':>9}  status")
+    names = list(baseline["results"]) + [n for n in current["results"] if n not in baseline["results"]]
+    for name in names:
+        base = baseline["results"].get(name)
+        now = current["results"].get(name)
+        if base is None or now is None:
+            status = "new" if base is None else "skipped"
+            value = (now or base)["seconds"] * 1e6
+            print(f"{name:<34}{'-' if base is None else f'{value:.2f}':>14}"
+                  f"{'-' if now is None else f'{value:.2f}':>13}{'':>9}  {status}")
+            continue
+        change = now["seconds"] / base["seconds"] - 1
+        status = "ok"
+        if change > threshold:
+            status = "REGRESSED"
+            regressed.append(name)
+        elif change < -threshold:
+            status = "faster"
+        print(f"{name:<34}{base['seconds'] * 1e6:>14.2f}{now['seconds'] * 1e6:>13.2f}{change:>+9.1%}  {status}")
+    return regressed
+
+
+def load(path: str) -> dict:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save(path: str, results: dict) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(results, f, ensure_ascii=False, indent=2)
+        f.write("\n")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    running = commands.add_parser("run", help="측정해서 JSON으로 저장")
+    running.add_argument("--output", "-o", help="결과 JSON 경로 (없으면 표준 출력)")
+
+    comparing = commands.add_parser("compare", help="기준선과 비교, 느려진 벤치마크가 있으면 종료 코드 1")
+    comparing.add_argument("baseline")
+    comparing.add_argument("current", nargs="?", help="비교할 결과 JSON (없으면 지금 측정)")
+    comparing.add_argument("--threshold", type=float, default=0.2, help="허용할 느려짐 비율 (0.2 = 20%%)")
+    comparing.add_argument("--output", "-o", help="지금 측정한 결과를 저장할 경로")
+
+    for sub in (running, comparing):
+        sub.add_argument("--repeat", type=int, default=5)
+        sub.add_argument("-k", dest="pattern", help="이름에 이 문자열이 들어간 벤치마크만 실행")
+
+    args = parser.parse_args()
+
+    if args.command == "compare" and args.current:
+        current = load(args.current)
+    else:
+        current = run_all(args.repeat, args.pattern)
+        if args.output:
+            save(args.output, current)
+        elif args.command == "run":
+            print(json.dumps(current, ensure_ascii=False, indent=2))
+
+    if args.command == "compare":
+        baseline = load(args.baseline)
+        if args.pattern:
+            baseline["results"] = {n: r for n, r in baseline["results"].items() if args.pattern in n}
+        regressed = compare(baseline, current, args.threshold)
+        if regressed:
+            print(f"{len(regressed)} benchmark(s) regressed more than {args.threshold:.0%}: {', '.join(regressed)}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""열차 10k개: dict 기반 객체 vs __slots__ 객체 vs TrainTable (생성 시간, 최대 메모리, 필터 시간)
+
+    python -m benchmarks.train_objects --trains 10000 --repeat 5
+"""
+
+import argparse
+import json
+import statistics
+import time
+import tracemalloc
+
+from SRT.train import SRTTrain
+from SRT.train_table import TrainTable, np
+
+from ._mock_srt import make_train
+
+
+class LegacyTrain:
+    """비교용: __slots__ 없이 같은 필드를 인스턴스 __dict__ 에 저장"""
+
+    __init__ = SRTTrain.__init__
+    seat_available = SRTTrain.seat_available
+    general_seat_available = SRTTrain.general_seat_available
+    special_seat_available = SRTTrain.special_seat_available
+
+
+def synthetic_rows(count: int) -> list[dict]:
+    # 실제 응답처럼 JSON에서 해석해 행마다 별도의 문자열 객체를 갖게 합니다.
+    rows = []
+    for i in range(count):
+        seconds = 5 * 3600 + (i * 7) % (19 * 3600)
+        dep_time = f"{seconds // 3600:02d}{seconds // 60 % 60:02d}{seconds % 60:02d}"
+        rows.append(make_train(dep_time, i % 100000))
+    return json.loads(json.dumps(rows, ensure_ascii=False))
+
+
+def measure(build, rows: list[dict], repeat: int) -> tuple[float, int, object]:
+    elapsed = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        build(rows)
+        elapsed.append(time.perf_counter() - started)
+
+    tracemalloc.start()
+    result = build(rows)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return statistics.median(elapsed), peak, result
+
+
+def timed(fn, repeat: int) -> float:
+    elapsed = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        elapsed.append(time.perf_counter() - started)
+    return statistics.median(elapsed)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--trains", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rows = synthetic_rows(args.trains)
+    start, end = "080000", "120000"
+
+    def filter_objects(trains):
+        return [t for t in trains if t.seat_available() and start <= t.dep_time <= end]
+
+    def filter_table(table):
+        return table.where(table.seat_available(), table.departing_between(start, end))
+
+    print(f"trains: {args.trains}, numpy: {'yes' if np is not None else 'no'}")
+    print(f"{'representation':<16}{'build(ms)':>11}{'peak(KiB)':>11}{'filter(ms)':>12}{'matched':>9}")
+
+    cases = [
+        ("dict objects", lambda rs: [LegacyTrain(r) for r in rs], filter_objects),
+        ("slots objects", lambda rs: [SRTTrain(r) for r in rs], filter_objects),
+        ("TrainTable", TrainTable.from_rows, filter_table),
+    ]
+    for name, build, apply_filter in cases:
+        build_time, peak, result = measure(build, rows, args.repeat)
+        filter_time = timed(lambda: apply_filter(result), args.repeat)
+        matched = len(apply_filter(result))
+        print(
+            f"{name:<16}{build_time * 1000:>11.1f}{peak / 1024:>11.0f}"
+            f"{filter_time * 1000:>12.2f}{matched:>9}"
+        )
+
+
+if __name__ == "__main__":
+    main()
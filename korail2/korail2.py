@@ -6,8 +6,8 @@
     :copyright: (c) 2014 by Taehoon Kim.
     :license: BSD, see LICENSE for more details.
 """
+import os
 import re
-import requests
 import itertools
 import sys
 import base64
@@ -24,6 +24,9 @@ import sys
 from Crypto.Util.Padding import pad
 from Crypto.Cipher import AES
 
+from SRT.tracing import span, trace
+from SRT.transport import DEFAULT_TRANSPORT, register_endpoints
+
 try:
     # noinspection PyPackageRequirements
     import simplejson as json
@@ -44,7 +47,8 @@ SCHEME = "https"
 KORAIL_HOST = "smart.letskorail.com"
 KORAIL_PORT = "443"
 
-KORAIL_DOMAIN = "%s://%s:%s" % (SCHEME, KORAIL_HOST, KORAIL_PORT)
+# KORAIL_BASE_URL로 모의 서버 등 다른 주소를 지정할 수 있습니다
+KORAIL_DOMAIN = os.environ.get('KORAIL_BASE_URL') or "%s://%s:%s" % (SCHEME, KORAIL_HOST, KORAIL_PORT)
 KORAIL_MOBILE = "%s/classes/com.korail.mobile" % KORAIL_DOMAIN
 
 KORAIL_LOGIN = "%s.login.Login" % KORAIL_MOBILE
@@ -66,19 +70,30 @@ KORAIL_PAYMENT_VOUCHER = "%s/ebizmw/PrdPkgBoucherView.do" % KORAIL_DOMAIN
 
 KORAIL_CODE = "%s.common.code.do" % KORAIL_MOBILE
 
+# endpoint names usable in `TransportConfig.endpoint_timeouts`
+KORAIL_ENDPOINTS = {
+    'korail_code': KORAIL_CODE,
+    'korail_login': KORAIL_LOGIN,
+    'korail_logout': KORAIL_LOGOUT,
+    'korail_search_schedule': KORAIL_SEARCH_SCHEDULE,
+    'korail_reserve': KORAIL_TICKETRESERVATION,
+    'korail_refund': KORAIL_REFUND,
+    'korail_tickets': KORAIL_MYTICKETLIST,
+    'korail_ticket_info': KORAIL_MYTICKET_SEAT,
+    'korail_reservations': KORAIL_MYRESERVATIONLIST,
+    'korail_cancel': KORAIL_CANCEL,
+    'korail_payment': KORAIL_PAYMENT,
+}
+register_endpoints(KORAIL_ENDPOINTS)
+
 DEFAULT_USER_AGENT = "Dalvik/2.1.0 (Linux; U; Android 5.1.1; Nexus 4 Build/LMY48T)"
 
+# 하루 전체 검색 시 요청할 최대 페이지 수
+MAX_SEARCH_PAGES = 15
 
-def _get_utf8(data, key, default=None):
-    v = data.get(key, default)
 
-    if _python3():
-        return v
-
-    if isinstance(v, basestring):
-        return v.encode('utf-8')
-    else:
-        return v
+def _get_utf8(data, key, default=None):
+    return data.get(key, default)
 
 class Schedule(object):
     """Korail train object. Highly inspired by `korail.py
@@ -86,74 +101,50 @@ class Schedule(object):
     by `Suyeol Jeon <http://xoul.kr/>`_ at 2014.
     """
 
-    # : 기차 종류
-    # : 00: KTX
-    #: 01: 새마을호
-    #: 02: 무궁화호
-    #: 03: 통근열차
-    #: 04: 누리로
-    #: 05: 전체 (검색시에만 사용)
-    #: 06: 공학직통
-    #: 07: KTX-산천
-    #: 08: ITX-새마을
-    #: 09: ITX-청춘
-    train_type = None  # h_trn_clsf_cd, selGoTrain
-
-    train_group = None # h_trn_gp_cd
-
-    #: 기차 종류 이름
-    train_type_name = None  # h_trn_clsf_nm
-
-    #: 기차 번호
-    train_no = None  # h_trn_no
-
-    #: 출발역 이름
-    dep_name = None  # h_dpt_rs_stn_nm
-
-    #: 출발역 코드
-    dep_code = None  # h_dpt_rs_stn_cd
-
-    #: 출발 날짜 (yyyyMMdd)
-    dep_date = None  # h_dpt_dt
-
-    #: 출발 시각 (hhmmss)
-    dep_time = None  # h_dpt_tm
-
-    #: 도착역 이름
-    arr_name = None  # h_arv_rs_stn_nm
-
-    #: 도착역 코드
-    arr_code = None  # h_arv_rs_stn_cd
-
-    #: 도착 날짜 (yyyyMMdd)
-    arr_date = None  # h_arv_dt
-
-    #: 도착 시각 (hhmmss)
-    arr_time = None  # h_arv_tm
-
-    #: 운행 날짜 (yyyyMMdd)
-    run_date = None  # h_run_dt
-
+    __slots__ = (
+        'train_type', 'train_type_name', 'train_group', 'train_no', 'delay_time',
+        'dep_name', 'dep_code', 'dep_date', 'dep_time',
+        'arr_name', 'arr_code', 'arr_date', 'arr_time',
+        'run_date',
+    )
 
     def __init__(self, data):
-
-        self.train_type = _get_utf8(data, 'h_trn_clsf_cd')
-        self.train_type_name = _get_utf8(data, 'h_trn_clsf_nm')
-        self.train_group = _get_utf8(data, 'h_trn_gp_cd')
-        self.train_no = _get_utf8(data, 'h_trn_no')
-        self.delay_time = _get_utf8(data, 'h_expct_dlay_hr')
-
-        self.dep_name = _get_utf8(data, 'h_dpt_rs_stn_nm')
-        self.dep_code = _get_utf8(data, 'h_dpt_rs_stn_cd')
-        self.dep_date = _get_utf8(data, 'h_dpt_dt')
-        self.dep_time = _get_utf8(data, 'h_dpt_tm')
-
-        self.arr_name = _get_utf8(data, 'h_arv_rs_stn_nm')
-        self.arr_code = _get_utf8(data, 'h_arv_rs_stn_cd')
-        self.arr_date = _get_utf8(data, 'h_arv_dt')
-        self.arr_time = _get_utf8(data, 'h_arv_tm')
-
-        self.run_date = _get_utf8(data, 'h_run_dt')
+        get = data.get
+
+        #: 기차 종류
+        #: 00: KTX
+        #: 01: 새마을호
+        #: 02: 무궁화호
+        #: 03: 통근열차
+        #: 04: 누리로
+        #: 05: 전체 (검색시에만 사용)
+        #: 06: 공학직통
+        #: 07: KTX-산천
+        #: 08: ITX-새마을
+        #: 09: ITX-청춘
+        self.train_type = get('h_trn_clsf_cd')  # selGoTrain
+        #: 기차 종류 이름
+        self.train_type_name = get('h_trn_clsf_nm')
+        self.train_group = get('h_trn_gp_cd')
+        #: 기차 번호
+        self.train_no = get('h_trn_no')
+        #: 지연 시간 (hhmm)
+        self.delay_time = get('h_expct_dlay_hr')
+
+        #: 출발역 이름, 코드, 날짜 (yyyyMMdd), 시각 (hhmmss)
+        self.dep_name = get('h_dpt_rs_stn_nm')
+        self.dep_code = get('h_dpt_rs_stn_cd')
+        self.dep_date = get('h_dpt_dt')
+        self.dep_time = get('h_dpt_tm')
+
+        #: 도착역 이름, 코드, 날짜 (yyyyMMdd), 시각 (hhmmss)
+        self.arr_name = get('h_arv_rs_stn_nm')
+        self.arr_code = get('h_arv_rs_stn_cd')
+        self.arr_date = get('h_arv_dt')
+        self.arr_time = get('h_arv_tm')
+
+        #: 운행 날짜 (yyyyMMdd)
+        self.run_date = get('h_run_dt')
 
     def __repr__(self):
         dep_time = "%s:%s" % (self.dep_time[:2], self.dep_time[2:4])
@@ -174,45 +165,34 @@ class Schedule(object):
 
 
 class Train(Schedule):
-    # : 지연 시간 (hhmm)
-    delay_time = None  # h_expct_dlay_hr
-
-    # : 예약 가능 여부
-    reserve_possible = False  # h_rsv_psb_flg ('Y' or 'N')
-
-    #: 예약 가능 여부
-    reserve_possible_name = None  # h_rsv_psb_nm
-
-    #: 특실 예약가능 여부
-    #: 00: 특실 없음
-    #: 11: 예약 가능
-    #: 13: 매진
-    special_seat = None  # h_spe_rsv_cd
-
-    #: 일반실 예약가능 여부
-    #: 00: 일반실 없음
-    #: 11: 예약 가능
-    #: 13: 매진
-    general_seat = None  # h_gen_rsv_cd
-
-    #: 예약 대기 가능 여부
-    #: -2: 좌석 있음
-    #: 9: 예약 대기 (일반석)
-    #: 0: 예약 대기 없음 (매진)
-    ## 특실의 경우 케이스 예약대기도 09를 사용하는지 확인이 필요함
-    wait_reserve_flag = None # h_wait_rsv_flg
+    __slots__ = (
+        'reserve_possible', 'reserve_possible_name',
+        'special_seat', 'general_seat', 'wait_reserve_flag',
+    )
 
     def __init__(self, data):
         super(Train, self).__init__(data)
-        self.reserve_possible = _get_utf8(data, 'h_rsv_psb_flg')
-        self.reserve_possible_name = _get_utf8(data, 'h_rsv_psb_nm')
+        get = data.get
+
+        #: 예약 가능 여부 ('Y' or 'N')
+        self.reserve_possible = get('h_rsv_psb_flg')
+        #: 예약 가능 여부
+        self.reserve_possible_name = get('h_rsv_psb_nm')
 
-        self.special_seat = _get_utf8(data, 'h_spe_rsv_cd')
-        self.general_seat = _get_utf8(data, 'h_gen_rsv_cd')
+        #: 특실 / 일반실 예약가능 여부
+        #: 00: 없음
+        #: 11: 예약 가능
+        #: 13: 매진
+        self.special_seat = get('h_spe_rsv_cd')
+        self.general_seat = get('h_gen_rsv_cd')
 
-        self.wait_reserve_flag = _get_utf8(data, 'h_wait_rsv_flg')
-        if self.wait_reserve_flag:
-            self.wait_reserve_flag = int(self.wait_reserve_flag)
+        #: 예약 대기 가능 여부
+        #: -2: 좌석 있음
+        #: 9: 예약 대기 (일반석)
+        #: 0: 예약 대기 없음 (매진)
+        ## 특실의 경우 케이스 예약대기도 09를 사용하는지 확인이 필요함
+        wait_reserve_flag = get('h_wait_rsv_flg')
+        self.wait_reserve_flag = int(wait_reserve_flag) if wait_reserve_flag else wait_reserve_flag
 
 
     def __repr__(self):
@@ -543,11 +523,21 @@ class SoldOutError(KorailError):
         KorailError.__init__(self, "Sold out", code)
 
 
+def _train_filter(include_no_seats, include_waiting_list):
+    filter_fns = [lambda x: x.has_seat()]
+
+    if include_no_seats:
+        filter_fns.append(lambda x: not x.has_seat())
+
+    if include_waiting_list:
+        filter_fns.append(lambda x: x.has_waiting_list())
+
+    return lambda x: any(f(x) for f in filter_fns)
+
+
 # noinspection PyUnresolvedReferences,PyRedeclaration
 class Korail(object):
     """Korail object"""
-    _session = requests.session()
-
     _device = 'AD'
     _version = '190617001'
     _key = 'korail1234567890'
@@ -558,15 +548,34 @@ class Korail(object):
     name = None
     email = None
 
-    def __init__(self, korail_id, korail_pw, auto_login=True, want_feedback=False):
-        self._session.headers.update({'User-Agent': DEFAULT_USER_AGENT})
+    def __init__(self, korail_id, korail_pw, auto_login=True, want_feedback=False, search_cache=None,
+                 transport=None):
+        """
+:param search_cache=None: (optional) A shared search result cache such as `SRT.search_cache.SearchCache`.
+                          Identical searches within its TTL are served from the cache.
+:param transport=None: (optional) `SRT.transport.TransportConfig` with pool size, retries, timeouts and warmup.
+"""
+        self.transport = transport if transport is not None else DEFAULT_TRANSPORT
+        # one session (and cookie jar) per instance so several accounts can be kept logged in at once
+        self._session = self.transport.create_session({'User-Agent': DEFAULT_USER_AGENT})
         self.korail_id = korail_id
         self.korail_pw = korail_pw
         self.want_feedback = want_feedback
+        self.search_cache = search_cache
         self.logined = False
+        if self.transport.warmup:
+            self.transport.warmup_session(self._session, [KORAIL_DOMAIN], verify=False, background=True)
         if auto_login:
             self.login(korail_id, korail_pw)
 
+    def warmup(self):
+        """Open connections to the Korail server ahead of time,
+so the first request of a booking burst skips the TCP/TLS handshake.
+
+:return: number of connections opened
+"""
+        return self.transport.warmup_session(self._session, [KORAIL_DOMAIN], verify=False)
+
     def __enc_password(self, password):
         url = KORAIL_CODE
         data = {
@@ -690,33 +699,76 @@ When you want change ID using existing object,
     def search_train_allday(self, dep, arr, date=None, time=None, train_type=TrainType.ALL,
                             passengers=None, include_no_seats=False):
         """Search all trains for specific time and date."""
-        min1 = timedelta(minutes=1)
-        all_trains = []
-        dep_time = time
-        for i in range(15):  # 최대 15번 호출
-            try:
-                trains = self.search_train(dep, arr, date, dep_time, train_type, passengers, True)
-                all_trains.extend(trains)
-                # 만약 마지막 승차권의 출발시각이 23시 59분인 경우, 검색 중지. (다음 날 승차권 검색 방지)
-                last_dep_time = datetime.strptime(all_trains[-1].dep_time, "%H%M%S")
-                if (last_dep_time.hour == 23) & (last_dep_time.minute == 59):
-                    break
-                # 마지막 열차시간에 1분 더해서 계속 검색.
-                t = last_dep_time + min1
-                dep_time = t.strftime("%H%M%S")
-            except NoResultsError:
-                break
-
-        if not include_no_seats:
-            all_trains = list(filter(lambda x: x.has_seat(), all_trains))
+        all_trains = list(self.iter_trains(dep, arr, date, time, train_type, passengers, include_no_seats))
 
         if len(all_trains) == 0:
             raise NoResultsError()
 
         return all_trains
 
+    def iter_trains(self, dep, arr, date=None, time=None, train_type=TrainType.ALL,
+                    passengers=None, include_no_seats=False, include_waiting_list=False, time_limit=None):
+        """Search trains page by page and yield them as each page arrives.
+
+Takes the same parameters as `search_train`, plus:
+
+:param time_limit=None: (optional) The last departure time in `hhmmss` format
+
+Each page is filtered as soon as it arrives. The next page is requested only
+after every train of the previous page has been consumed, so stopping the
+iteration stops the search. The search cache is not used; use `search_train`
+with `time_limit` to get the same trains through the cache.
+
+    >>> train = next(korail.iter_trains('서울', '부산', '20140815', '070000'), None)
+
+"""
+        kst_now = datetime.utcnow() + timedelta(hours=9)
+        if date is None:
+            date = kst_now.strftime("%Y%m%d")
+        if time is None:
+            time = kst_now.strftime("%H%M%S")
+
+        if passengers is None:
+            passengers = [AdultPassenger()]
+
+        passengers = Passenger.reduce(passengers)
+
+        return self._iter_trains(dep, arr, date, time, train_type, passengers,
+                                 include_no_seats, include_waiting_list, time_limit)
+
+    def _iter_trains(self, dep, arr, date, time, train_type, passengers,
+                     include_no_seats, include_waiting_list, time_limit):
+        """Yield filtered trains page by page. `passengers` must be already reduced."""
+        train_filter = _train_filter(include_no_seats, include_waiting_list)
+        min1 = timedelta(minutes=1)
+        dep_time = time
+        for i in range(MAX_SEARCH_PAGES):
+            try:
+                page = self._search_schedule(dep, arr, date, dep_time, train_type, passengers)
+            except NoResultsError:
+                return
+
+            for train in page:
+                if time_limit and train.dep_time > time_limit:
+                    return
+                if train_filter(train):
+                    yield train
+
+            if not page:
+                return
+            # 마지막 열차가 time_limit 에 닿으면 다음 페이지는 필요 없음
+            if time_limit and page[-1].dep_time >= time_limit:
+                return
+            # 만약 마지막 승차권의 출발시각이 23시 59분인 경우, 검색 중지. (다음 날 승차권 검색 방지)
+            last_dep_time = datetime.strptime(page[-1].dep_time, "%H%M%S")
+            if (last_dep_time.hour == 23) & (last_dep_time.minute == 59):
+                return
+            # 마지막 열차시간에 1분 더해서 계속 검색.
+            t = last_dep_time + min1
+            dep_time = t.strftime("%H%M%S")
+
     def search_train(self, dep, arr, date=None, time=None, train_type=TrainType.ALL,
-                     passengers=None, include_no_seats=False, include_waiting_list=False):
+                     passengers=None, include_no_seats=False, include_waiting_list=False, time_limit=None):
         """Search trains for specific time and date.
 
 :param dep: A departure station in Korean  ex) '서울'
@@ -737,6 +789,9 @@ When you want change ID using existing object,
 :param passengers=None: (optional) List of Passenger Objects. None means 1 AdultPassenger.
 :param include_no_seats=False: (optional) When True, a result includes trains which has no seats.
 :param include_waiting_list=False: (optional) When False, a result includes trains which has no seats but can make a wait reservation(예약 대기)'
+:param time_limit=None: (optional) The last departure time in `hhmmss` format. When given, every page up to
+                        that time is requested (see `iter_trains`) and an empty list is returned instead of
+                        raising `NoResultsError`.
 
 Below is a sample usage of `search_train`:
 
@@ -810,6 +865,35 @@ There are 4 types of Passengers now, AdultPassenger, ChildPassenger, ToddlerPass
 
         passengers = Passenger.reduce(passengers)
 
+        def search():
+            if time_limit:
+                return list(self._iter_trains(dep, arr, date, time, train_type, passengers,
+                                              include_no_seats, include_waiting_list, time_limit))
+            return self._search_train(dep, arr, date, time, train_type, passengers,
+                                      include_no_seats, include_waiting_list)
+
+        if self.search_cache is None:
+            return search()
+
+        key = ('Korail', dep, arr, date, time, time_limit, train_type,
+               tuple("%s_%s" % (p.group_key(), p.count) for p in passengers),
+               include_no_seats, include_waiting_list)
+        # 캐시된 리스트를 호출자가 수정하지 않도록 복사해서 반환
+        return list(self.search_cache.get_or_load(key, search))
+
+    def _search_train(self, dep, arr, date, time, train_type, passengers,
+                      include_no_seats, include_waiting_list):
+        """Send a schedule request. `passengers` must be already reduced."""
+        train_filter = _train_filter(include_no_seats, include_waiting_list)
+        trains = list(filter(train_filter, self._search_schedule(dep, arr, date, time, train_type, passengers)))
+
+        if len(trains) == 0:
+            raise NoResultsError()
+
+        return trains
+
+    def _search_schedule(self, dep, arr, date, time, train_type, passengers):
+        """Request one page of the schedule and return every train on it, unfiltered."""
         adult_count = reduce(lambda a, b: a + b.count, list(filter(lambda x: isinstance(x, AdultPassenger), passengers)), 0)
         child_count = reduce(lambda a, b: a + b.count, list(filter(lambda x: isinstance(x, ChildPassenger), passengers)), 0)
         toddler_count = reduce(lambda a, b: a + b.count, list(filter(lambda x: isinstance(x, ToddlerPassenger), passengers)), 0)
@@ -849,25 +933,7 @@ There are 4 types of Passengers now, AdultPassenger, ChildPassenger, ToddlerPass
         if self._result_check(j):
             train_infos = j['trn_infos']['trn_info']
 
-            trains = []
-
-            for info in train_infos:
-                trains.append(Train(info))
-
-            filter_fns = [lambda x: x.has_seat()]
-
-            if include_no_seats:
-                filter_fns.append(lambda x: not x.has_seat())
-
-            if include_waiting_list:
-                filter_fns.append(lambda x: x.has_waiting_list())
-
-            trains = list(filter(lambda x: any(f(x) for f in filter_fns), trains))
-
-            if len(trains) == 0:
-                raise NoResultsError()
-
-            return trains
+            return [Train(info) for info in train_infos]
 
     def reserve(self, train, passengers=None, option=ReserveOption.GENERAL_FIRST, try_waiting=False):
         """Reserve a train.
@@ -930,9 +996,37 @@ When the train allows waiting, enroll for the waiting list instead of failing in
 
         print(train)
 
-        passengers = Passenger.reduce(passengers)
+        with trace(self.transport.tracer, 'korail.reserve',
+                   train_no=train.train_no, dep='%s%s' % (train.dep_date, train.dep_time)) as root:
+            with span('passengers.combine'):
+                passengers = Passenger.reduce(passengers)
+            with span('reserve.form'):
+                data = self._reserve_data(train, passengers, seat_type, reserving_seat)
+
+            url = KORAIL_TICKETRESERVATION
+            with span('reserve.post'):
+                r = self._session.get(url, params=data, verify =False)
+            with span('reserve.decode'):
+                j = json.loads(r.text)
+                succeeded = self._result_check(j)
+            if succeeded:
+                rsv_id = j['h_pnr_no']
+                if root is not None:
+                    root.set(pnr_no=rsv_id)
+                with span('reservations'):
+                    reservations = self.reservations()
+                rsvlist = list(filter(lambda x: x.rsv_id == rsv_id, reservations))
+                if len(rsvlist) == 1:
+                    return rsvlist[0]
+
+    def _reserve_data(self, train, passengers, seat_type, reserving_seat):
+        """Build the reservation request parameters.
+
+:param passengers: List of Passenger Objects, already reduced.
+:param seat_type: '1' for general seats, '2' for special seats.
+:param reserving_seat: False to enroll for the waiting list.
+        """
         cnt = reduce(lambda x,y: x + y.count, passengers, 0)
-        url = KORAIL_TICKETRESERVATION
         data = {
             'Device': self._device,
             'Version': self._version,
@@ -992,13 +1086,7 @@ When the train allows waiting, enroll for the waiting list instead of failing in
             data.update(psg.get_dict(index))
             index += 1
 
-        r = self._session.get(url, params=data, verify =False)
-        j = json.loads(r.text)
-        if self._result_check(j):
-            rsv_id = j['h_pnr_no']
-            rsvlist = list(filter(lambda x: x.rsv_id == rsv_id, self.reservations()))
-            if len(rsvlist) == 1:
-                return rsvlist[0]
+        return data
 
     def tickets(self):
         """Get list of tickets"""
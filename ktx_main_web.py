@@ -1,10 +1,20 @@
 # -*- coding: utf-8 -*-
-import time
-import json
+import logging
+import os
+import threading
 import urllib3
+from collections import Counter
 from datetime import datetime
-from flask import Flask, request, render_template_string, redirect, url_for, session, Response
-from korail2.korail2 import Korail, Train, SoldOutError, NeedToLoginError
+from flask import Flask, request, render_template_string, redirect, url_for, session, Response, jsonify
+from korail2.korail2 import Korail, Train, KorailError, SoldOutError, NeedToLoginError
+from SRT.search_cache import SearchCache
+from SRT.result_store import ResultStore
+from SRT.client_pool import ClientPool
+from SRT.transport import TransportConfig, count_requests
+from SRT.metrics import CLIENT_METRICS
+from SRT.tracing import Tracer
+from SRT.recording import Recorder, Replay
+from SRT.jobs import JobRegistry, JOB_FAILED, JOB_SUCCEEDED
 
 # HTTPS 경고 숨기기
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
@@ -12,7 +22,152 @@ urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 app = Flask(__name__)
 app.secret_key = "YOUR_SECRET_KEY"
 
-STOP_MACRO = False
+# 매크로 작업: 워커 풀(최대 MACRO_WORKERS개)에서 실행, SSE 응답은 진행 메시지만 구독
+# 작업마다 ID와 취소 이벤트를 따로 두어 사용자끼리 영향이 없도록 함
+JOBS = JobRegistry(
+    max_workers=int(os.environ.get("MACRO_WORKERS", "8")),
+    retention=float(os.environ.get("JOB_RETENTION", "3600")),
+    max_events=int(os.environ.get("JOB_MAX_EVENTS", "256")),
+)
+
+
+# 메시지가 없을 때 이 간격(초)마다 heartbeat 주석을 보내 프록시가 연결을 끊지 않도록 함
+SSE_HEARTBEAT = float(os.environ.get("SSE_HEARTBEAT", "15"))
+
+
+def _job_events(job, last_event_id=0):
+    """job의 진행 메시지를 id가 붙은 SSE 메시지로 내보냄. 연결이 끊겨도 작업은 계속 실행
+
+    브라우저가 Last-Event-ID로 다시 연결하면 그 다음 메시지부터 이어서 보내고,
+    작업이 끝나면 end 이벤트를 보내 브라우저가 다시 연결하지 않도록 함
+    """
+    # 첫 메시지 전에 연결이 끊겨도 새 작업을 시작하지 않도록 ID만 먼저 보냄
+    yield f"id: {last_event_id}\n\n"
+    for event in job.subscribe(last_event_id, heartbeat=SSE_HEARTBEAT):
+        if event is None:
+            yield ": heartbeat\n\n"
+            continue
+        event_id, message = event
+        yield f"id: {event_id}\ndata: {message}\n\n"
+    yield f"event: end\ndata: {job.status}\n\n"
+
+
+def _sse_response(stream):
+    return Response(stream, mimetype="text/event-stream",
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+
+
+def _sse_error(message):
+    """메시지 하나를 보내고 end 이벤트로 스트림을 끝냄"""
+    return _sse_response(f"data: {message}\n\nevent: end\ndata: {JOB_FAILED}\n\n")
+
+
+def _last_event_id():
+    """EventSource가 다시 연결할 때 보내는 Last-Event-ID (없으면 None)"""
+    value = request.headers.get('Last-Event-ID') or request.args.get('last_event_id')
+    try:
+        return int(value) if value else None
+    except ValueError:
+        return 0
+
+# 검색 결과 캐시: 같은 노선을 보는 사용자/매크로가 한 번의 요청을 공유
+SEARCH_CACHE = SearchCache(
+    ttl=float(os.environ.get("SEARCH_CACHE_TTL", "1.0")),
+    maxsize=int(os.environ.get("SEARCH_CACHE_SIZE", "256")),
+)
+
+# 검색 결과/선택 열차: 서버에 보관하고 세션 쿠키에는 ID만 저장
+# RESULT_STORE_PATH를 지정하면 SQLite 파일에도 저장해 여러 워커 프로세스가 공유
+RESULTS = ResultStore(
+    maxsize=int(os.environ.get("RESULT_STORE_SIZE", "1024")),
+    ttl=float(os.environ.get("RESULT_STORE_TTL", "3600")),
+    path=os.environ.get("RESULT_STORE_PATH") or None,
+)
+
+# 녹화/재생: HTTP_RECORD_FILE을 지정하면 외부 서버와 주고받은 요청/응답을 녹화 (.jsonl.gz)
+# HTTP_REPLAY_FILE을 지정하면 서버에 요청하지 않고 녹화된 응답을 사용
+# (HTTP_REPLAY_LATENCY: 응답마다 기다릴 초, recorded 이면 녹화된 응답 시간)
+_replay_latency = os.environ.get("HTTP_REPLAY_LATENCY", "0")
+RECORDER = Recorder(os.environ["HTTP_RECORD_FILE"]) if os.environ.get("HTTP_RECORD_FILE") else None
+REPLAY = Replay(
+    os.environ["HTTP_REPLAY_FILE"],
+    latency=None if _replay_latency == "recorded" else float(_replay_latency),
+) if os.environ.get("HTTP_REPLAY_FILE") else None
+
+
+# HTTP 연결 설정: 타임아웃으로 멈춘 소켓이 매크로를 막지 않도록 함
+# RESERVE_TRACE_FILE을 지정하면 예약 시도마다 구간별 소요 시간을 JSONL로 기록 (python -m SRT.trace_report 로 요약)
+TRANSPORT = TransportConfig(
+    connect_timeout=float(os.environ.get("HTTP_CONNECT_TIMEOUT", "3.05")),
+    read_timeout=float(os.environ.get("HTTP_READ_TIMEOUT", "15")),
+    warmup_connections=int(os.environ.get("HTTP_WARMUP_CONNECTIONS", "2")),
+    tracer=Tracer(os.environ["RESERVE_TRACE_FILE"]) if os.environ.get("RESERVE_TRACE_FILE") else None,
+    recorder=RECORDER,
+    replay=REPLAY,
+)
+
+
+def _korail_login(kor):
+    # Korail.login()은 실패 시 False를 반환하므로 풀이 알 수 있도록 예외로 바꿈
+    if not kor.login():
+        raise KorailError("로그인 실패: 아이디/비번 확인", None)
+
+def _korail_session_alive(kor):
+    # 예약 목록 조회(요청 1회)로 서버에서 로그인이 유지되는지 확인
+    if not kor.logined:
+        return False
+    try:
+        kor.reservations()
+    except NeedToLoginError:
+        return False
+    except KorailError:
+        pass  # 로그인 외의 이유로 실패한 응답은 세션이 살아 있음을 뜻함
+    return True
+
+
+# 로그인 클라이언트 풀: 같은 계정의 검색/매크로가 하나의 로그인 세션을 공유
+CLIENT_POOL = ClientPool(
+    factory=lambda uid, upw: Korail(uid, upw, auto_login=False, search_cache=SEARCH_CACHE, transport=TRANSPORT),
+    login=_korail_login,
+    is_logged_in=_korail_session_alive,
+    relogin_errors=(NeedToLoginError,),
+    idle_timeout=float(os.environ.get("CLIENT_POOL_IDLE_TIMEOUT", "1800")),
+)
+
+# 매크로: 선택한 열차를 노선별로 묶어 노선마다 한 번씩 검색
+def _group_by_route(active):
+    """active 항목을 (출발역, 도착역, 날짜)별로 묶음"""
+    routes = {}
+    for info in active:
+        d = info['raw']
+        key = (d['dep_name'], d['arr_name'], d['dep_date'])
+        routes.setdefault(key, []).append(info)
+    return routes
+
+# 매크로 새로고침 비용: {새로고침 한 번에 보낸 검색 요청 수: 새로고침 횟수}
+# 열차 하나만 보는 노선(start == end)은 요청 1회여야 하므로 그보다 많으면 경고 로그를 남김
+# (검색 캐시에서 가져온 경우는 0회)
+REFRESH_REQUESTS = Counter()
+_REFRESH_LOCK = threading.Lock()
+
+def _refresh_route(uid, upw, dep, arr, date, start, end):
+    """노선의 선택 열차가 있는 start~end 구간만 검색하고, 보낸 검색 요청 수를 기록"""
+    with count_requests() as sent:
+        # 같은 노선을 보는 작업들이 검색 결과를 함께 쓰도록 캐시를 거치는 구간 검색 사용
+        trains = CLIENT_POOL.call(uid, upw, lambda kor: kor.search_train(
+            dep=dep,
+            arr=arr,
+            date=date,
+            time=start,
+            time_limit=end,
+            include_no_seats=True
+        ))
+    n = sent['korail_search_schedule']
+    with _REFRESH_LOCK:
+        REFRESH_REQUESTS[n] += 1
+    if start == end and n > 1:
+        logging.warning(f"새로고침 검색 요청 {n}회: {dep}→{arr} {date} {start}~{end}")
+    return trains
 
 STATION_LIST = [
     "서울","용산","광명","천안아산","오송","대전","김천(구미)","신경주",
@@ -217,7 +372,7 @@ main_template = r"""
           checked.forEach(c => fd.append('train_indices[]', c.value));
 
           const resp = await fetch('/reserve_select', { method:'POST', body:fd });
-          if (!resp.ok) { alert('예약 준비 중 오류'); return; }
+          if (!resp.ok) { alert(await resp.text()); return; }
 
           document.getElementById('logSection').classList.remove('hidden');
           document.getElementById('logContainer').innerHTML = '';
@@ -236,7 +391,8 @@ main_template = r"""
               }
             }
           };
-          es.onerror = () => es.close();
+          // 연결이 끊기면 브라우저가 Last-Event-ID로 다시 연결해 이어받음, 작업이 끝나면 서버가 end 이벤트를 보냄
+          es.addEventListener('end', () => es.close());
         };
 
         st.onclick = async () => {
@@ -260,11 +416,12 @@ def main():
 
     if request.method=="POST" and not session.get('korail_id'):
         uid, upw = request.form['korail_id'], request.form['korail_pw']
-        kor = Korail(uid, upw, auto_login=False)
-        if kor.login():
+        try:
+            CLIENT_POOL.get(uid, upw)
             session['korail_id'], session['korail_pw'] = uid, upw
             return redirect(url_for('main'))
-        error_message = "로그인 실패: 아이디/비번 확인"
+        except Exception:
+            error_message = "로그인 실패: 아이디/비번 확인"
 
     if session.get('korail_id') and request.method=="POST":
         dep, arr = request.form['dep'], request.form['arr']
@@ -273,9 +430,10 @@ def main():
         date_str = dt.replace('-','')
         time_full = f"{int(tm.split(':')[0]):02d}0000"
         try:
-            kor = Korail(session['korail_id'], session['korail_pw'], auto_login=False)
-            kor.login()
-            ts = kor.search_train(dep, arr, date=date_str, time=time_full, include_no_seats=True)
+            ts = CLIENT_POOL.call(
+                session['korail_id'], session['korail_pw'],
+                lambda kor: kor.search_train(dep, arr, date=date_str, time=time_full, include_no_seats=True)
+            )
             results = [{
                 'train_type': t.train_type,
                 'train_type_name': t.train_type_name,
@@ -295,17 +453,14 @@ def main():
                 'special_seat': t.special_seat,
                 'general_seat': t.general_seat
             } for t in ts]
-            session['search_results'] = json.dumps(results, ensure_ascii=False)
+            session['result_id'] = RESULTS.put(results)
             trains_with_index = list(zip(results, range(len(results))))
         except Exception as e:
             error_message = f"검색 오류: {e}"
 
-    if session.get('search_results') and not trains_with_index:
-        try:
-            stored = json.loads(session['search_results'])
-            trains_with_index = list(zip(stored, range(len(stored))))
-        except:
-            trains_with_index = None
+    if session.get('result_id') and not trains_with_index:
+        stored = RESULTS.get(session['result_id'])
+        trains_with_index = list(zip(stored, range(len(stored)))) if stored else None
 
     return render_template_string(
         main_template,
@@ -318,132 +473,212 @@ def main():
 
 @app.route("/logout", methods=["POST"])
 def logout():
+    if session.get('korail_id'):
+        CLIENT_POOL.discard(session['korail_id'])
     session.clear()
     return redirect(url_for('main'))
 
 @app.route("/reserve_select", methods=["POST"])
 def reserve_select():
-    session['selected_indices'] = json.dumps(request.form.getlist('train_indices[]'))
+    # 검색 결과 전체가 아니라 선택한 열차만 따로 보관
+    try:
+        idxs = [int(i) for i in request.form.getlist('train_indices[]')]
+        selected = RESULTS.rows(session.get('result_id', ''), idxs)
+    except (ValueError, IndexError):
+        return "잘못된 선택입니다", 400
+    if selected is None:
+        return "검색 결과가 만료되었습니다. 다시 검색하세요", 400
+    session['selection_id'] = RESULTS.put(selected)
     session['reserve_option'] = request.form.get('reserve_option')
     return "OK"
 
-@app.route("/start_reservation", methods=["GET"])
-def start_reservation():
-    global STOP_MACRO
-    STOP_MACRO = False
-
-    uid = session.get('korail_id')
-    upw = session.get('korail_pw')
-    sr  = session.get('search_results')
-    si  = session.get('selected_indices')
-    opt = session.get('reserve_option', 'GENERAL_ONLY')
-
-    def sse():
-        # 1) 로그인/데이터 확인
-        if not uid or not upw:
-            yield "data: 로그인 정보 없음\n\n"
-            return
-        if not sr or not si:
-            yield "data: 예약할 정보 없음\n\n"
-            return
-
-        # 2) Korail 객체 생성
-        kor = Korail(uid, upw, auto_login=False)
-        kor.login()
-
-        # 3) JSON → 리스트, Train 객체로 래핑
-        raw_list = json.loads(sr)
-        idxs     = json.loads(si)
-        active   = []
-        for s in idxs:
-            d = raw_list[int(s)]
-            tr = Train({
-                'h_trn_clsf_cd':   d['train_type'],
-                'h_trn_clsf_nm':   d['train_type_name'],
-                'h_trn_gp_cd':     d['train_group'],
-                'h_trn_no':        d['train_no'],
-                'h_dpt_rs_stn_nm': d['dep_name'],
-                'h_dpt_rs_stn_cd': d['dep_code'],
-                'h_dpt_dt':        d['dep_date'],
-                'h_dpt_tm':        d['dep_time'],
-                'h_arv_rs_stn_nm': d['arr_name'],
-                'h_arv_rs_stn_cd': d['arr_code'],
-                'h_arv_dt':        d['arr_date'],
-                'h_arv_tm':        d['arr_time'],
-                'h_run_dt':        d['run_date'],
-                'h_rsv_psb_flg':   d['reserve_possible'],
-                'h_rsv_psb_nm':    d['reserve_possible_name'],
-                'h_spe_rsv_cd':    d['special_seat'],
-                'h_gen_rsv_cd':    d['general_seat'],
-            })
-            active.append({'train': tr, 'raw': d, 'attempts': 0})
-
-        # 4) 시작 메시지
-        yield "data: ▶▶▶ 예약 시작 (한 사이클 당 1초씩, 첫 성공 시 즉시 종료)\n\n"
-
-        # 5) 라운드로빈 반복
-        while not STOP_MACRO:
-            for info in active:
-                if STOP_MACRO:
-                    yield "data: 예약이 중단되었습니다.\n\n"
-                    return
-
+def _reservation_macro(job, uid, upw, selected, opt):
+    """선택한 열차의 예약을 첫 성공까지 반복 (JOBS 워커 스레드에서 실행). 진행 메시지를 yield"""
+    # 2) Korail 객체는 CLIENT_POOL에서 계정별로 공유 (로그인 재사용)
+
+    # 3) 선택한 열차를 Train 객체로 래핑
+    active   = []
+    for d in selected:
+        tr = Train({
+            'h_trn_clsf_cd':   d['train_type'],
+            'h_trn_clsf_nm':   d['train_type_name'],
+            'h_trn_gp_cd':     d['train_group'],
+            'h_trn_no':        d['train_no'],
+            'h_dpt_rs_stn_nm': d['dep_name'],
+            'h_dpt_rs_stn_cd': d['dep_code'],
+            'h_dpt_dt':        d['dep_date'],
+            'h_dpt_tm':        d['dep_time'],
+            'h_arv_rs_stn_nm': d['arr_name'],
+            'h_arv_rs_stn_cd': d['arr_code'],
+            'h_arv_dt':        d['arr_date'],
+            'h_arv_tm':        d['arr_time'],
+            'h_run_dt':        d['run_date'],
+            'h_rsv_psb_flg':   d['reserve_possible'],
+            'h_rsv_psb_nm':    d['reserve_possible_name'],
+            'h_spe_rsv_cd':    d['special_seat'],
+            'h_gen_rsv_cd':    d['general_seat'],
+        })
+        active.append({'train': tr, 'raw': d, 'attempts': 0})
+
+    # 예약 시도 전에 Korail 서버 연결을 미리 열어둠
+    try:
+        CLIENT_POOL.call(uid, upw, lambda kor: kor.warmup())
+    except Exception:
+        pass
+
+    # 4) 시작 메시지
+    yield "▶▶▶ 예약 시작 (한 사이클 당 1초씩, 첫 성공 시 즉시 종료)"
+
+    # 5) 라운드로빈 반복: 같은 노선/날짜의 열차는 사이클마다 한 번만 검색
+    routes = _group_by_route(active)
+    while not job.cancelled:
+        for (dep, arr, date), infos in routes.items():
+            if job.cancelled:
+                break
+
+            # 6) 노선의 선택 열차를 모두 포함하는 시간 구간으로 최신 상태 가져오기
+            start = min(info['raw']['dep_time'] for info in infos)
+            end   = max(info['raw']['dep_time'] for info in infos)
+            try:
+                updated = _refresh_route(uid, upw, dep, arr, date, start, end)
+            except Exception as e:
+                yield f"[{dep}→{arr} {start}~{end}] 검색 오류: {e}"
+                job.wait(1)
+                continue
+
+            for info in infos:
                 tr = info['train']
-                d  = info['raw']
                 info['attempts'] += 1
                 cnt = info['attempts']
 
-                # 6) 최신 상태 가져오기
-                try:
-                    updated = kor.search_train(
-                        dep=d['dep_name'],
-                        arr=d['arr_name'],
-                        date=d['dep_date'],
-                        time=d['dep_time'],
-                        include_no_seats=True
-                    )
-                    cur = next((x for x in updated
-                                if x.train_type==tr.train_type
-                                and x.train_no==tr.train_no
-                                and x.dep_time==tr.dep_time), None)
-                except Exception as e:
-                    yield f"data: [{tr.train_type_name} {tr.dep_time}] 검색 오류: {e}\n\n"
-                    time.sleep(1)
-                    continue
+                cur = next((x for x in updated
+                            if x.train_type==tr.train_type
+                            and x.train_no==tr.train_no
+                            and x.dep_time==tr.dep_time), None)
 
                 # 7) 예약 가능하면 시도
                 if cur and cur.reserve_possible:
                     try:
-                        kor.reserve(cur, option=opt)
-                        yield f"data: [{tr.train_type_name} {tr.dep_time}] 예약 성공! (시도 {cnt}회)\n\n"
-                        yield "data: 첫 성공으로 전체 예약 종료\n\n"
+                        CLIENT_POOL.call(uid, upw, lambda kor: kor.reserve(cur, option=opt))
+                        yield f"[{tr.train_type_name} {tr.dep_time}] 예약 성공! (시도 {cnt}회)"
+                        yield "첫 성공으로 전체 예약 종료"
+                        job.finish(JOB_SUCCEEDED)
                         return
                     except SoldOutError:
-                        yield f"data: [{tr.train_type_name} {tr.dep_time}] 매진 (시도 {cnt}회)\n\n"
+                        yield f"[{tr.train_type_name} {tr.dep_time}] 매진 (시도 {cnt}회)"
                     except NeedToLoginError:
-                        yield "data: NeedToLoginError: 재로그인 필요\n\n"
+                        # 풀에서 다시 로그인한 뒤에도 실패한 경우
+                        yield "NeedToLoginError: 재로그인 필요"
                         return
                     except Exception as e:
-                        yield f"data: [{tr.train_type_name} {tr.dep_time}] 예약 오류: {e}\n\n"
+                        yield f"[{tr.train_type_name} {tr.dep_time}] 예약 오류: {e}"
                         return
                 else:
-                    yield f"data: [{tr.train_type_name} {tr.dep_time}] 매진 (시도 {cnt}회)\n\n"
+                    yield f"[{tr.train_type_name} {tr.dep_time}] 매진 (시도 {cnt}회)"
+
+            # 8) 다음 노선 전 1초 대기 (중지하면 바로 깨어남)
+            job.wait(1)
+
+        # 한 사이클 돌고도 성공 없으면 다시 처음부터…
+        # (취소 체크는 while 조건에서)
+    # 작업이 취소되어 빠져나왔을 때
+    yield "예약이 중단되었습니다."
 
-                # 8) 다음 열차 전 1초 대기
-                time.sleep(1)
 
-            # 한 사이클 돌고도 성공 없으면 다시 처음부터…
-            # (STOP_MACRO 체크는 while 조건에서)
-        # STOP_MACRO == True 로 빠져나왔을 때
-        yield "data: 예약이 중단되었습니다.\n\n"
+@app.route("/start_reservation", methods=["GET"])
+def start_reservation():
+    uid = session.get('korail_id')
+    upw = session.get('korail_pw')
+    opt = session.get('reserve_option', 'GENERAL_ONLY')
 
-    return Response(sse(), mimetype="text/event-stream")
+    # 1) 로그인 확인
+    if not uid or not upw:
+        return _sse_error("로그인 정보 없음")
+
+    # EventSource가 다시 연결한 경우: 새 작업을 시작하지 않고 기존 작업의 메시지를 이어서 보냄
+    last_event_id = _last_event_id()
+    if last_event_id is not None:
+        job = JOBS.get(session.get('job_id', ''), owner=uid)
+        if job is None:
+            return _sse_error("이어받을 작업이 없습니다")
+        return _sse_response(_job_events(job, last_event_id))
+
+    # 데이터 확인
+    selected = RESULTS.get(session.get('selection_id', ''))
+    if not selected:
+        return _sse_error("예약할 정보 없음")
+
+    # 같은 브라우저에서 이전에 시작한 작업은 멈추고 새 작업을 워커 풀에 등록
+    if session.get('job_id'):
+        JOBS.cancel(session['job_id'], owner=uid)
+    try:
+        job = JOBS.submit(
+            uid,
+            lambda job: _reservation_macro(job, uid, upw, selected, opt),
+            f"열차 {len(selected)}개",
+        )
+    except RuntimeError:
+        # 서버 종료 중(JOBS.drain)에는 새 작업을 받지 않음
+        return _sse_error("서버가 종료 중입니다. 잠시 후 다시 시도하세요")
+    session['job_id'] = job.job_id
+
+    return _sse_response(_job_events(job))
+
+
+@app.route("/jobs/<job_id>/events", methods=["GET"])
+def job_events(job_id):
+    uid = session.get('korail_id')
+    job = JOBS.get(job_id, owner=uid) if uid else None
+    if job is None:
+        return _sse_error("작업을 찾을 수 없습니다")
+    return _sse_response(_job_events(job, _last_event_id() or 0))
 
 
 @app.route("/stop_macro", methods=["POST"])
 def stop_macro():
-    global STOP_MACRO
-    STOP_MACRO = True
+    uid = session.get('korail_id')
+    job_id = request.form.get('job_id') or session.get('job_id')
+    if job_id:
+        JOBS.cancel(job_id, owner=uid)
     return "STOP_OK"
+
+
+@app.route("/jobs", methods=["GET"])
+def list_jobs():
+    uid = session.get('korail_id')
+    if not uid:
+        return jsonify([])
+    return jsonify([job.to_dict() for job in JOBS.jobs(owner=uid)])
+
+
+@app.route("/search_cache", methods=["GET"])
+def search_cache_stats():
+    return jsonify(SEARCH_CACHE.stats())
+
+
+@app.route("/client_pool", methods=["GET"])
+def client_pool_stats():
+    return jsonify(CLIENT_POOL.stats())
+
+
+@app.route("/refresh_stats", methods=["GET"])
+def refresh_stats():
+    with _REFRESH_LOCK:
+        per_refresh = dict(REFRESH_REQUESTS)
+    return jsonify({
+        'refreshes': sum(per_refresh.values()),
+        'requests': sum(n * count for n, count in per_refresh.items()),
+        'requests_per_refresh': {str(n): count for n, count in sorted(per_refresh.items())},
+    })
+
+
+@app.route("/metrics", methods=["GET"])
+def metrics():
+    """SRT/NetFunnel/Korail 요청 지표 (Prometheus text format, ?format=json 이면 JSON)"""
+    if request.args.get('format') == 'json':
+        return jsonify(CLIENT_METRICS.snapshot())
+    return Response(CLIENT_METRICS.render(), mimetype="text/plain; version=0.0.4")
+
+
 if __name__ == "__main__":
     app.run(host="0.0.0.0", port=30000, debug=False)
\ No newline at end of file
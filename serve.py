@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+"""운영 서버: gevent로 SRT/KTX 웹앱을 실행
+
+    python serve.py srt --port 5001 --connections 1000 --macro-workers 64 --grace 30
+
+개발용 ``app.run(debug=True, threaded=True)`` 은 리로더와 디버거를 켜고 SSE 연결마다 OS 스레드를 하나씩 씁니다.
+여기서는 표준 라이브러리를 gevent로 패치해 연결, 매크로 작업, 외부 HTTP 요청을 모두 greenlet으로 처리하므로
+수백 개의 SSE 연결을 적은 메모리로 유지할 수 있습니다. 동시 연결 수는 --connections 로 제한하고,
+넘치는 연결은 자리가 날 때까지 accept 대기열에서 기다립니다.
+
+SIGTERM/SIGINT를 받으면 새 연결을 받지 않고, 진행 중인 매크로 작업이 끝날 때까지 최대 --grace 초 기다린 뒤
+남은 작업을 취소합니다. 작업이 끝나면 구독 중인 SSE 스트림도 end 이벤트를 보내고 닫힙니다.
+"""
+import argparse
+import importlib
+import logging
+import os
+import signal
+import sys
+
+# 앱 이름: (모듈, 기본 포트)
+APPS = {
+    "srt": ("srt_main_web", 5001),
+    "ktx": ("ktx_main_web", 30000),
+}
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("app", choices=sorted(APPS))
+    parser.add_argument("--host", default=os.environ.get("HOST", "0.0.0.0"))
+    parser.add_argument("--port", type=int, default=None, help="기본값: srt 5001, ktx 30000")
+    parser.add_argument("--connections", type=int,
+                        default=int(os.environ.get("MAX_CONNECTIONS", "1000")),
+                        help="동시 연결 수 상한 (SSE 스트림 포함)")
+    parser.add_argument("--macro-workers", type=int, default=None,
+                        help="동시에 실행할 매크로 작업 수 (기본값: 환경 변수 MACRO_WORKERS)")
+    parser.add_argument("--grace", type=float,
+                        default=float(os.environ.get("SHUTDOWN_GRACE", "30")),
+                        help="종료할 때 진행 중인 작업을 기다릴 시간 (초)")
+    return parser.parse_args(argv)
+
+
+def patch():
+    """표준 라이브러리를 gevent로 패치. 앱(requests, threading 사용)을 import 하기 전에 호출해야 함"""
+    try:
+        from gevent import monkey
+    except ImportError:
+        sys.exit("gevent가 필요합니다: pip install gevent")
+    monkey.patch_all()
+
+
+def load_app(name, macro_workers=None):
+    """앱 모듈을 import. 매크로 워커 수는 모듈의 JOBS가 만들어지기 전에 환경 변수로 전달"""
+    module_name, _ = APPS[name]
+    if macro_workers is not None:
+        os.environ["MACRO_WORKERS"] = str(macro_workers)
+    return importlib.import_module(module_name)
+
+
+def serve(module, host, port, connections, grace):
+    """module.app을 실행하고, 종료 신호를 받으면 작업을 정리한 뒤 반환"""
+    from gevent.event import Event
+    from gevent.pool import Pool
+    from gevent.pywsgi import WSGIServer
+    import gevent
+
+    # 앱이 로깅을 설정하지 않았으면 (KTX) 서버 로그를 표준 출력으로
+    logging.basicConfig(level=logging.INFO)
+
+    server = WSGIServer(
+        (host, port), module.app,
+        spawn=Pool(connections),
+        log=logging.getLogger("access"),
+        error_log=logging.getLogger("serve"),
+    )
+
+    stopping = Event()
+    if os.name == "posix":
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            gevent.signal_handler(sig, stopping.set)
+
+    server.start()
+    logging.info(f"서버 시작: http://{host}:{port} (연결 {connections}개, 매크로 워커 {module.JOBS.max_workers}개)")
+    try:
+        stopping.wait()
+    except KeyboardInterrupt:
+        pass
+
+    # 1) 새 연결을 받지 않음 (열려 있는 SSE 연결은 유지)
+    logging.info(f"종료 시작: 진행 중인 작업을 최대 {grace:.0f}초 기다림")
+    server.close()
+
+    # 2) 작업이 끝나길 기다렸다가 남은 작업은 취소 → 구독 중인 스트림은 end 이벤트로 끝남
+    cancelled = module.JOBS.drain(grace)
+
+    # 3) 스트림이 마지막 메시지를 보낼 시간을 준 뒤 남은 연결을 끊음
+    server.stop(timeout=5)
+    logging.info(f"종료 완료: 작업 {cancelled}개 취소")
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    patch()
+    module = load_app(args.app, args.macro_workers)
+    port = args.port if args.port is not None else APPS[args.app][1]
+    serve(module, args.host, port, args.connections, args.grace)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,24 @@
 # -*- coding: utf-8 -*-
-import time
-import json
 import os
 import logging
+import threading
+from collections import Counter
 from datetime import datetime
-from flask import Flask, request, render_template_string, redirect, url_for, session, Response
+from flask import Flask, request, render_template_string, redirect, url_for, session, Response, jsonify
 
-from SRT.srt import SRT, SRTError, SRTNotLoggedInError
+from SRT.srt import SRTError, SRTNotLoggedInError
 from SRT.train import SRTTrain
 from SRT.constants import STATION_NAME
 from SRT.seat_type import SeatType  # ← enum 가져오기
+from SRT.search_cache import SearchCache
+from SRT.result_store import ResultStore
+from SRT.client_pool import ClientPool
+from SRT.transport import TransportConfig, count_requests
+from SRT.metrics import CLIENT_METRICS
+from SRT.tracing import Tracer
+from SRT.recording import Recorder, Replay
+from SRT.netfunnel import NetFunnelKeyManager
+from SRT.jobs import JobRegistry, JOB_FAILED, JOB_SUCCEEDED, current_job
 
 from logging.handlers import RotatingFileHandler
 
@@ -23,7 +32,139 @@ logging.getLogger().addHandler(handler)
 app = Flask(__name__)
 app.secret_key = os.environ.get("FLASK_SECRET_KEY", "default_secret_key")
 
-STOP_MACRO = False
+# ── 매크로 작업: 워커 풀(최대 MACRO_WORKERS개)에서 실행, SSE 응답은 진행 메시지만 구독 ──
+#    작업마다 ID와 취소 이벤트를 따로 두어 사용자끼리 영향이 없도록 함
+JOBS = JobRegistry(
+    max_workers=int(os.environ.get("MACRO_WORKERS", "8")),
+    retention=float(os.environ.get("JOB_RETENTION", "3600")),
+    max_events=int(os.environ.get("JOB_MAX_EVENTS", "256")),
+)
+
+# 메시지가 없을 때 이 간격(초)마다 heartbeat 주석을 보내 프록시가 연결을 끊지 않도록 함
+SSE_HEARTBEAT = float(os.environ.get("SSE_HEARTBEAT", "15"))
+
+def _job_events(job, last_event_id=0):
+    """job의 진행 메시지를 id가 붙은 SSE 메시지로 내보냄. 연결이 끊겨도 작업은 계속 실행
+
+    브라우저가 Last-Event-ID로 다시 연결하면 그 다음 메시지부터 이어서 보내고,
+    작업이 끝나면 end 이벤트를 보내 브라우저가 다시 연결하지 않도록 함
+    """
+    # 첫 메시지 전에 연결이 끊겨도 새 작업을 시작하지 않도록 ID만 먼저 보냄
+    yield f"id: {last_event_id}\n\n"
+    for event in job.subscribe(last_event_id, heartbeat=SSE_HEARTBEAT):
+        if event is None:
+            yield ": heartbeat\n\n"
+            continue
+        event_id, message = event
+        yield f"id: {event_id}\ndata: {message}\n\n"
+    yield f"event: end\ndata: {job.status}\n\n"
+
+def _sse_response(stream):
+    return Response(stream, mimetype="text/event-stream",
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+
+def _sse_error(message):
+    """메시지 하나를 보내고 end 이벤트로 스트림을 끝냄"""
+    return _sse_response(f"data: {message}\n\nevent: end\ndata: {JOB_FAILED}\n\n")
+
+def _last_event_id():
+    """EventSource가 다시 연결할 때 보내는 Last-Event-ID (없으면 None)"""
+    value = request.headers.get('Last-Event-ID') or request.args.get('last_event_id')
+    try:
+        return int(value) if value else None
+    except ValueError:
+        return 0
+
+# ── 검색 결과 캐시: 같은 노선을 보는 사용자/매크로가 한 번의 요청을 공유 ─────
+SEARCH_CACHE = SearchCache(
+    ttl=float(os.environ.get("SEARCH_CACHE_TTL", "1.0")),
+    maxsize=int(os.environ.get("SEARCH_CACHE_SIZE", "256")),
+)
+
+# ── 검색 결과/선택 열차: 서버에 보관하고 세션 쿠키에는 ID만 저장 ───────────────
+#    RESULT_STORE_PATH를 지정하면 SQLite 파일에도 저장해 여러 워커 프로세스가 공유
+RESULTS = ResultStore(
+    maxsize=int(os.environ.get("RESULT_STORE_SIZE", "1024")),
+    ttl=float(os.environ.get("RESULT_STORE_TTL", "3600")),
+    path=os.environ.get("RESULT_STORE_PATH") or None,
+)
+
+# ── 녹화/재생: HTTP_RECORD_FILE을 지정하면 외부 서버와 주고받은 요청/응답을 녹화 (.jsonl.gz) ──
+#    HTTP_REPLAY_FILE을 지정하면 서버에 요청하지 않고 녹화된 응답을 사용
+#    (HTTP_REPLAY_LATENCY: 응답마다 기다릴 초, recorded 이면 녹화된 응답 시간)
+_replay_latency = os.environ.get("HTTP_REPLAY_LATENCY", "0")
+RECORDER = Recorder(os.environ["HTTP_RECORD_FILE"]) if os.environ.get("HTTP_RECORD_FILE") else None
+REPLAY = Replay(
+    os.environ["HTTP_REPLAY_FILE"],
+    latency=None if _replay_latency == "recorded" else float(_replay_latency),
+) if os.environ.get("HTTP_REPLAY_FILE") else None
+
+# ── HTTP 연결 설정: 타임아웃으로 멈춘 소켓이 매크로를 막지 않도록 함 ─────────
+#    RESERVE_TRACE_FILE을 지정하면 예약 시도마다 구간별 소요 시간을 JSONL로 기록 (python -m SRT.trace_report 로 요약)
+TRANSPORT = TransportConfig(
+    connect_timeout=float(os.environ.get("HTTP_CONNECT_TIMEOUT", "3.05")),
+    read_timeout=float(os.environ.get("HTTP_READ_TIMEOUT", "15")),
+    warmup_connections=int(os.environ.get("HTTP_WARMUP_CONNECTIONS", "2")),
+    tracer=Tracer(os.environ["RESERVE_TRACE_FILE"]) if os.environ.get("RESERVE_TRACE_FILE") else None,
+    recorder=RECORDER,
+    replay=REPLAY,
+)
+
+# ── NetFunnel 대기열 상태: 대기 중인 매크로 작업의 진행 메시지로 전달 ───────────
+def _on_netfunnel_wait(status):
+    logging.info(f"NetFunnel 대기: {status.nwait}명, 예상 {status.eta}초")
+    job = current_job()
+    if job is not None:
+        eta = f", 약 {status.eta:.0f}초" if status.eta is not None else ""
+        job.publish(f"접속 대기 중: 대기인원 {status.nwait}명{eta}")
+
+# ── NetFunnel 키: 모든 클라이언트가 하나의 키를 공유하고 만료 전에 미리 갱신 ─────
+#    NETFUNNEL_KEY_FILE을 지정하면 여러 워커 프로세스가 파일로 키를 공유
+#    완료(setComplete) 요청은 키마다 한 번, 검색 요청과 동시에 백그라운드에서 보냄
+NETFUNNEL = NetFunnelKeyManager(
+    transport=TRANSPORT,
+    store_path=os.environ.get("NETFUNNEL_KEY_FILE") or None,
+    complete_mode=os.environ.get("NETFUNNEL_COMPLETE_MODE", "background"),
+    on_wait=_on_netfunnel_wait,
+)
+
+# ── 로그인 클라이언트 풀: 같은 계정의 검색/매크로가 하나의 로그인 세션을 공유 ─────
+CLIENT_POOL = ClientPool.for_srt(
+    idle_timeout=float(os.environ.get("CLIENT_POOL_IDLE_TIMEOUT", "1800")),
+    search_cache=SEARCH_CACHE,
+    transport=TRANSPORT,
+    netfunnel_helper=NETFUNNEL,
+)
+
+# ── 매크로: 선택한 열차를 노선별로 묶어 노선마다 한 번씩 검색 ─────────────────
+def _group_by_route(active):
+    """active 항목을 (출발역, 도착역, 날짜)별로 묶음"""
+    routes = {}
+    for info in active:
+        d = info['raw']
+        key = (d['dep_station_name'], d['arr_station_name'], d['dep_date'])
+        routes.setdefault(key, []).append(info)
+    return routes
+
+# ── 매크로 새로고침 비용: {새로고침 한 번에 보낸 검색 요청 수: 새로고침 횟수} ─────
+#    열차 하나만 보는 노선(start == end)은 요청 1회여야 하므로 그보다 많으면 경고 로그를 남김
+#    (검색 캐시에서 가져온 경우는 0회)
+REFRESH_REQUESTS = Counter()
+_REFRESH_LOCK = threading.Lock()
+
+def _refresh_route(sid, spw, dep, arr, date, start, end):
+    """노선의 선택 열차가 있는 start~end 구간만 검색하고, 보낸 검색 요청 수를 기록"""
+    with count_requests() as sent:
+        trains = CLIENT_POOL.call(sid, spw, lambda cli: cli.search_train(
+            dep, arr, date=date, time=start, time_limit=end,
+            available_only=False
+        ))
+    n = sent['search_schedule']
+    with _REFRESH_LOCK:
+        REFRESH_REQUESTS[n] += 1
+    if start == end and n > 1:
+        logging.warning(f"새로고침 검색 요청 {n}회: {dep}→{arr} {date} {start}~{end}")
+    return trains
 
 # ── 역 목록: constants.STATION_NAME 전체 값 사용 ─────────────────────────
 STATION_LIST = sorted(STATION_NAME.values())
@@ -219,7 +360,7 @@ main_template = r"""
           fd.append('reserve_option', document.getElementById('reserveOption').value);
           sel.forEach(c => fd.append('train_indices[]', c.value));
           let r = await fetch('/reserve_select',{method:'POST',body:fd});
-          if (!r.ok) { alert('준비 오류'); return; }
+          if (!r.ok) { alert(await r.text()); return; }
           document.getElementById('logSection').classList.remove('hidden');
           document.getElementById('logContainer').innerHTML = '';
           es = new EventSource('/start_reservation');
@@ -237,7 +378,8 @@ main_template = r"""
               }
             }
           };
-          es.onerror = _ => es.close();
+          // 연결이 끊기면 브라우저가 Last-Event-ID로 다시 연결해 이어받음, 작업이 끝나면 서버가 end 이벤트를 보냄
+          es.addEventListener('end', () => es.close());
         };
 
         // 중지
@@ -265,9 +407,8 @@ def main():
     # 로그인
     if request.method=="POST" and not session.get('srt_id'):
         sid, spw = request.form['srt_id'], request.form['srt_pw']
-        cli = SRT(sid, spw, auto_login=False)
         try:
-            cli.login(sid, spw)
+            CLIENT_POOL.get(sid, spw)
             session['srt_id'], session['srt_pw'] = sid, spw
             logging.info(f"{sid} 로그인 성공")
             return redirect(url_for('main'))
@@ -282,10 +423,11 @@ def main():
         dt, tm   = form_data['date'], form_data['time']
         date_str = dt.replace('-','')
         time_str = f"{int(tm.split(':')[0]):02d}0000"
-        cli = SRT(session['srt_id'], session['srt_pw'], auto_login=False)
         try:
-            cli.login()
-            ts = cli.search_train(dep, arr, date=date_str, time=time_str, available_only=False)
+            ts = CLIENT_POOL.call(
+                session['srt_id'], session['srt_pw'],
+                lambda cli: cli.search_train(dep, arr, date=date_str, time=time_str, available_only=False)
+            )
             results=[]
             for t in ts:
                 results.append({
@@ -301,7 +443,7 @@ def main():
                     'dep_station_code': t.dep_station_code,
                     'arr_station_code': t.arr_station_code
                 })
-            session['search_results'] = json.dumps(results, ensure_ascii=False)
+            session['result_id'] = RESULTS.put(results)
             trains_with_index = list(zip(results, range(len(results))))
             logging.info(f"스케줄 검색: {len(results)}개")
         except Exception as e:
@@ -309,12 +451,9 @@ def main():
             logging.error(f"검색 오류: {error_message}")
 
     # 이전 검색 결과 유지
-    if session.get('search_results') and not trains_with_index:
-        try:
-            lst = json.loads(session['search_results'])
-            trains_with_index = list(zip(lst, range(len(lst))))
-        except:
-            trains_with_index=None
+    if session.get('result_id') and not trains_with_index:
+        lst = RESULTS.get(session['result_id'])
+        trains_with_index = list(zip(lst, range(len(lst)))) if lst else None
 
     return render_template_string(
         main_template,
@@ -327,133 +466,213 @@ def main():
 
 @app.route("/logout", methods=["POST"])
 def logout():
+    if session.get('srt_id'):
+        CLIENT_POOL.discard(session['srt_id'])
     session.clear()
     return redirect(url_for('main'))
 
 @app.route("/reserve_select", methods=["POST"])
 def reserve_select():
     idxs = request.form.getlist('train_indices[]')
-    session['selected_indices'] = json.dumps(idxs)
+    # 검색 결과 전체가 아니라 선택한 열차만 따로 보관
+    try:
+        selected = RESULTS.rows(session.get('result_id', ''), [int(i) for i in idxs])
+    except (ValueError, IndexError):
+        return "잘못된 선택입니다", 400
+    if selected is None:
+        return "검색 결과가 만료되었습니다. 다시 검색하세요", 400
+    session['selection_id'] = RESULTS.put(selected)
     session['reserve_option'] = request.form.get('reserve_option','GENERAL_FIRST')
     logging.info(f"선택 인덱스: {idxs}")
     return "OK"
 
-@app.route("/start_reservation", methods=["GET"])
-def start_reservation():
-    global STOP_MACRO
-    STOP_MACRO = False
-
-    sid = session.get('srt_id')
-    spw = session.get('srt_pw')
-    sr  = session.get('search_results')
-    si  = session.get('selected_indices')
-    opt_enum = SeatType[session.get('reserve_option', 'GENERAL_FIRST')]
-
-    def sse():
-        # 로그인/파라미터 체크
-        if not sid or not spw:
-            yield "data: 로그인 필요\n\n"; return
-        if not sr or not si:
-            yield "data: 예약할 데이터가 없습니다\n\n"; return
-
-        cli = SRT(sid, spw, auto_login=False)
-        cli.login()
-
-        raw   = json.loads(sr)
-        idxs  = json.loads(si)
-
-        # active 리스트에 각 열차 객체와 상태 저장
-        active = []
-        for s in idxs:
-            d = raw[int(s)]
-            tr = SRTTrain({
-                'stlbTrnClsfCd':'17','trnNo':d['train_number'],
-                'dptDt':d['dep_date'],   'dptTm':d['dep_time'],
-                'arvDt':d['arr_date'],   'arvTm':d['arr_time'],
-                'dptRsStnCd':d['dep_station_code'],
-                'arvRsStnCd':d['arr_station_code'],
-                'gnrmRsvPsbStr':'예약가능' if d['general_seat_available'] else '매진',
-                'sprmRsvPsbStr':'예약가능' if d['special_seat_available'] else '매진',
-                'rsvWaitPsbCd':'0',
-                'arvStnRunOrdr':'000','arvStnConsOrdr':'000',
-                'dptStnRunOrdr':'000','dptStnConsOrdr':'000'
-            })
-            active.append({'train':tr, 'raw':d, 'attempts':0, 'done':False})
-
-        yield "data: ▶ 예약 시작 (첫 성공 시 즉시 종료)\n\n"
-
-        # 라운드 로빈 반복
-        while not STOP_MACRO:
-            all_done = True
-
-            for info in active:
-                if info['done']:
-                    continue
-                all_done = False
-
+def _reservation_macro(job, sid, spw, selected, opt_enum):
+    """선택한 열차의 예약을 첫 성공까지 반복 (JOBS 워커 스레드에서 실행). 진행 메시지를 yield"""
+    # active 리스트에 각 열차 객체와 상태 저장
+    active = []
+    for d in selected:
+        tr = SRTTrain({
+            'stlbTrnClsfCd':'17','trnNo':d['train_number'],
+            'dptDt':d['dep_date'],   'dptTm':d['dep_time'],
+            'arvDt':d['arr_date'],   'arvTm':d['arr_time'],
+            'dptRsStnCd':d['dep_station_code'],
+            'arvRsStnCd':d['arr_station_code'],
+            'gnrmRsvPsbStr':'예약가능' if d['general_seat_available'] else '매진',
+            'sprmRsvPsbStr':'예약가능' if d['special_seat_available'] else '매진',
+            'rsvWaitPsbCd':'0',
+            'arvStnRunOrdr':'000','arvStnConsOrdr':'000',
+            'dptStnRunOrdr':'000','dptStnConsOrdr':'000'
+        })
+        active.append({'train':tr, 'raw':d, 'attempts':0, 'done':False})
+
+    # 예약 시도 전에 SRT/NetFunnel 서버 연결을 미리 열어둠
+    try:
+        CLIENT_POOL.call(sid, spw, lambda cli: cli.warmup())
+    except Exception as e:
+        logging.warning(f"연결 워밍업 실패: {e}")
+
+    yield "▶ 예약 시작 (첫 성공 시 즉시 종료)"
+
+    # 같은 노선/날짜의 열차는 사이클마다 한 번만 검색
+    routes = _group_by_route(active)
+
+    # 라운드 로빈 반복
+    while not job.cancelled:
+        all_done = True
+
+        for (dep, arr, date), infos in routes.items():
+            if job.cancelled:
+                break
+            pending = [info for info in infos if not info['done']]
+            if not pending:
+                continue
+            all_done = False
+
+            # 1) 노선의 선택 열차를 모두 포함하는 시간 구간으로 최신 상태 조회
+            start = min(info['raw']['dep_time'] for info in pending)
+            end   = max(info['raw']['dep_time'] for info in pending)
+            try:
+                ups = _refresh_route(sid, spw, dep, arr, date, start, end)
+            except Exception as e:
+                yield f"[{dep}→{arr} {start}~{end}] 검색 오류: {e}"
+                job.wait(1)
+                continue
+
+            for info in pending:
                 tr = info['train']
-                d  = info['raw']
                 info['attempts'] += 1
                 cnt = info['attempts']
 
-                # 1) 최신 상태 조회
-                try:
-                    ups = cli.search_train(
-                        d['dep_station_name'], d['arr_station_name'],
-                        date=d['dep_date'], time=d['dep_time'],
-                        available_only=False
-                    )
-                    cur = next((x for x in ups
-                                if x.train_number==tr.train_number
-                                and x.dep_time==tr.dep_time), None)
-                except Exception as e:
-                    yield f"data: [{tr.dep_time}] {tr.train_name} 검색 오류: {e}\n\n"
-                    time.sleep(1)
-                    continue
-
-                # 2) 예약 가능 여부 & 시도
-                if cur:
+                cur = next((x for x in ups
+                            if x.train_number==tr.train_number
+                            and x.dep_time==tr.dep_time), None)
+
+                # 2) 잔여석이 있을 때만 예약 시도 (매진 열차에 예약 요청을 보내지 않음)
+                if cur and cur.seat_available():
                     try:
-                        cli.reserve(cur, special_seat=opt_enum)
-                        yield f"data: [{tr.dep_time}] {tr.train_name} 예약 성공 ({cnt}회)\n\n"
+                        # 예약 내역은 쓰지 않으므로 성공 응답을 받는 즉시 반환 (예약 조회 요청 생략)
+                        CLIENT_POOL.call(sid, spw, lambda cli: cli.reserve(cur, special_seat=opt_enum, fetch_details=False))
+                        yield f"[{tr.dep_time}] {tr.train_name} 예약 성공 ({cnt}회)"
                         # 첫 성공 시 전체 종료
-                        yield "data: 첫 성공으로 전체 종료\n\n"
+                        yield "첫 성공으로 전체 종료"
+                        job.finish(JOB_SUCCEEDED)
+                        return
+                    except SRTNotLoggedInError:
+                        # 풀에서 다시 로그인한 뒤에도 실패한 경우
+                        yield "재로그인 필요"
                         return
                     except SRTError as e:
                         msg = str(e)
                         if "잔여석없음" in msg:
-                            yield f"data: [{tr.dep_time}] {tr.train_name} 매진({cnt}회)—잔여석없음, 1초 후 재시도\n\n"
-                            time.sleep(1)
+                            yield f"[{tr.dep_time}] {tr.train_name} 매진({cnt}회)—잔여석없음"
                             continue
                         else:
-                            yield f"data: [{tr.dep_time}] {tr.train_name} 예약 오류: {msg}\n\n"
+                            yield f"[{tr.dep_time}] {tr.train_name} 예약 오류: {msg}"
                             return
-                    except SRTNotLoggedInError:
-                        yield "data: 재로그인 필요\n\n"
-                        return
                 else:
-                    yield f"data: [{tr.dep_time}] {tr.train_name} 매진 ({cnt}회)\n\n"
+                    yield f"[{tr.dep_time}] {tr.train_name} 매진 ({cnt}회)"
 
-                time.sleep(1)
+            # 다음 노선 전 1초 대기 (중지하면 바로 깨어남)
+            job.wait(1)
 
-            if all_done:
-                break
+        if all_done:
+            break
 
-        # STOP_MACRO 되거나 모든 done
-        if STOP_MACRO:
-            yield "data: 예약이 중단되었습니다.\n\n"
-        else:
-            yield "data: 모든 열차 시도 완료—예약 실패\n\n"
+    # 작업이 취소되거나 모든 done
+    if job.cancelled:
+        yield "예약이 중단되었습니다."
+    else:
+        yield "모든 열차 시도 완료—예약 실패"
 
-    return Response(sse(), mimetype="text/event-stream")
 
+@app.route("/start_reservation", methods=["GET"])
+def start_reservation():
+    sid = session.get('srt_id')
+    spw = session.get('srt_pw')
+    opt_enum = SeatType[session.get('reserve_option', 'GENERAL_FIRST')]
 
+    # 로그인 체크
+    if not sid or not spw:
+        return _sse_error("로그인 필요")
+
+    # EventSource가 다시 연결한 경우: 새 작업을 시작하지 않고 기존 작업의 메시지를 이어서 보냄
+    last_event_id = _last_event_id()
+    if last_event_id is not None:
+        job = JOBS.get(session.get('job_id', ''), owner=sid)
+        if job is None:
+            return _sse_error("이어받을 작업이 없습니다")
+        return _sse_response(_job_events(job, last_event_id))
+
+    # 파라미터 체크
+    selected = RESULTS.get(session.get('selection_id', ''))
+    if not selected:
+        return _sse_error("예약할 데이터가 없습니다")
+
+    # 같은 브라우저에서 이전에 시작한 작업은 멈추고 새 작업을 워커 풀에 등록
+    if session.get('job_id'):
+        JOBS.cancel(session['job_id'], owner=sid)
+    try:
+        job = JOBS.submit(
+            sid,
+            lambda job: _reservation_macro(job, sid, spw, selected, opt_enum),
+            f"열차 {len(selected)}개",
+        )
+    except RuntimeError:
+        # 서버 종료 중(JOBS.drain)에는 새 작업을 받지 않음
+        return _sse_error("서버가 종료 중입니다. 잠시 후 다시 시도하세요")
+    session['job_id'] = job.job_id
+    logging.info(f"{sid} 작업 시작: {job.job_id}")
+
+    return _sse_response(_job_events(job))
+
+@app.route("/jobs/<job_id>/events", methods=["GET"])
+def job_events(job_id):
+    sid = session.get('srt_id')
+    job = JOBS.get(job_id, owner=sid) if sid else None
+    if job is None:
+        return _sse_error("작업을 찾을 수 없습니다")
+    return _sse_response(_job_events(job, _last_event_id() or 0))
 
 @app.route("/stop_macro", methods=["POST"])
 def stop_macro():
-    global STOP_MACRO; STOP_MACRO=True
-    logging.info("중단 요청")
+    sid = session.get('srt_id')
+    job_id = request.form.get('job_id') or session.get('job_id')
+    if job_id:
+        JOBS.cancel(job_id, owner=sid)
+    logging.info(f"중단 요청: {job_id}")
     return "STOP_OK"
 
+@app.route("/jobs", methods=["GET"])
+def list_jobs():
+    sid = session.get('srt_id')
+    if not sid:
+        return jsonify([])
+    return jsonify([job.to_dict() for job in JOBS.jobs(owner=sid)])
+
+@app.route("/search_cache", methods=["GET"])
+def search_cache_stats():
+    return jsonify(SEARCH_CACHE.stats())
+
+@app.route("/client_pool", methods=["GET"])
+def client_pool_stats():
+    return jsonify(CLIENT_POOL.stats())
+
+@app.route("/refresh_stats", methods=["GET"])
+def refresh_stats():
+    with _REFRESH_LOCK:
+        per_refresh = dict(REFRESH_REQUESTS)
+    return jsonify({
+        'refreshes': sum(per_refresh.values()),
+        'requests': sum(n * count for n, count in per_refresh.items()),
+        'requests_per_refresh': {str(n): count for n, count in sorted(per_refresh.items())},
+    })
+
+@app.route("/metrics", methods=["GET"])
+def metrics():
+    """SRT/NetFunnel/Korail 요청 지표 (Prometheus text format, ?format=json 이면 JSON)"""
+    if request.args.get('format') == 'json':
+        return jsonify(CLIENT_METRICS.snapshot())
+    return Response(CLIENT_METRICS.render(), mimetype="text/plain; version=0.0.4")
+
 if __name__=="__main__":
     app.run(debug=True, threaded=True, port=5001)